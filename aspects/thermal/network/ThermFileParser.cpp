@@ -20,10 +20,22 @@ PROGRAMMERS:
 #include "math/MsMath.hh" //needed for fabs() and FLT_EPSILON in confirmNodeBuild()
 #include <algorithm> //needed for find() function in getCapEditGroupId()
 #include <iostream>
+#include <fstream>
+#include <iterator>
+#include <cstring>
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 /// @details  Integer used to designate a node name that is not yet registered in the Node map.
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 const int ThermFileParser::NOT_FOUND  = -99;
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @details  Identifier at the start of a bin-file written by ThermAspectGenerate.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+const char* ThermFileParser::BIN_MAGIC = "GTNB";
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @details  The bin-file format version this class can read. This must match the version written
+///           by ThermAspectGenerate's BinaryConfigWriter.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+const uint32_t ThermFileParser::BIN_VERSION = 1;
 /**************************************************************************************************/
 /* ThermFileParser class */
 ////////////////////////////////////////////////////////////////////////////////////////////////////
@@ -39,6 +51,7 @@ ThermFileParser::ThermFileParser(const std::string name)
     mHtrFile(),
     mPanFile(),
     mEtcFile(),
+    mBinFile(),
     mThermInputFile(),
     mThermInputFileRad(),
     numNodes(0),
@@ -112,6 +125,14 @@ void ThermFileParser::preCountNodes()
 {
     /// - Reset number of nodes for a fresh count.
     numNodes = 0;
+
+    /// - A bin-file holds the nodes in place of the node file, and counts them as it is read.
+    if (not mBinFile.empty())
+    {
+        readBinFile();
+        return;
+    }
+
     /// - Cause the node file to be parsed and node elements counted in numNodes.
     readFile(mNodeFile, "node", &ThermFileParser::countNode);
 }
@@ -137,13 +158,23 @@ void ThermFileParser::initialize(const std::string& name)
             TS_PTCS_ERREX(TsInitializationException, "initialization error", "a ThermFileParser has empty object name.")
         }
 
-        /// - Read each file and build data vectors.
-        readNodeFile();
-        readCondFile();
-        readRadFile();
+        /// - Read each file and build data vectors. A bin-file replaces the node, cond, rad and
+        ///   etc-files.
+        if (mBinFile.empty())
+        {
+            readNodeFile();
+            readCondFile();
+            readRadFile();
+        } else
+        {
+            readBinFile();
+        }
         readHtrFile();
         readPanFile();
-        readEtcFile();
+        if (mBinFile.empty())
+        {
+            readEtcFile();
+        }
 
         /// - Read ThermInput files for any overrides.
         readThermInputFile();
@@ -447,6 +478,143 @@ void ThermFileParser::readEtcFile()
     confirmDataFound(numLinksPot, "etc-file", mEtcFile);
 }
 ////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @throw      TsParseException if the bin-file cannot be read, is not a supported version, fails
+///             its checksum, or contains invalid data
+///
+/// @details    Builds the Node, Capacitance, Conduction, Radiation and Potential link data vectors
+///             from a binary config-file written by ThermAspectGenerate, in place of the node,
+///             cond, rad and etc-files. The data is the same as would be read from those files,
+///             with link names and port numbers already resolved, so no XML is parsed.
+///
+/// @note       The bin-file is little-endian. It starts with a 16-byte header: the 4-char
+///             BIN_MAGIC, then the format version, the payload size in bytes, and the CRC-32 of
+///             the payload, as uint32. The payload holds five tables, each starting with a uint32
+///             row count. Strings are a uint32 length followed by the characters.
+///             \verbatim
+///             cap-edit groups:  name
+///             nodes:            name, temperature (double), capacitance (double), group (int32)
+///             conductions:      name, port0 (int32), port1 (int32), conductivity (double)
+///             radiations:       name, port0 (int32), port1 (int32), coefficient (double)
+///             potentials:       name, port (int32), temperature (double), conductivity (double)
+///             \endverbatim
+///             A negative group means the node is not in a cap-edit group. As with the node-file,
+///             the last node should be the space node, with zero capacitance.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+void ThermFileParser::readBinFile()
+{
+    /// - Reset node registration flag.
+    areNodesRegistered = false;
+
+    /// - Clear the counts and vectors.
+    clearNode();
+    clearCap();
+    clearCond();
+    clearRad();
+    clearPot();
+    vCapEditGroupList.clear();
+
+    /// - Read the whole file into memory.
+    std::ifstream file(mBinFile.c_str(), std::ios::in | std::ios::binary);
+    if (not file)
+    {
+        TS_PTCS_ERREX(TsParseException, "file accessibility error", mBinFile)
+    }
+    const std::vector<char> data((std::istreambuf_iterator<char>(file)),
+                                 std::istreambuf_iterator<char>());
+    file.close();
+
+    try
+    {
+        /// - Check the header.
+        TS_PTCS_IF_ERREX(data.size() < 16 or 0 != memcmp(&data[0], BIN_MAGIC, 4),
+                TsParseException, "invalid bin-file format", mBinFile);
+        size_t pos = 4;
+        const uint32_t version  = readBinUInt(data, pos);
+        const uint32_t size     = readBinUInt(data, pos);
+        const uint32_t checksum = readBinUInt(data, pos);
+        TS_PTCS_IF_ERREX(BIN_VERSION != version,
+                TsParseException, "unsupported bin-file version", mBinFile);
+        TS_PTCS_IF_ERREX(data.size() - pos != size,
+                TsParseException, "truncated bin-file", mBinFile);
+        TS_PTCS_IF_ERREX(checksum != computeCrc32(&data[0] + pos, size),
+                TsParseException, "bin-file checksum mismatch", mBinFile);
+
+        /// - Cap-edit groups.
+        const uint32_t numGroups = readBinUInt(data, pos);
+        for (uint32_t i = 0; i < numGroups; ++i)
+        {
+            vCapEditGroupList.push_back(readBinString(data, pos));
+        }
+
+        /// - Nodes and capacitance links.
+        const uint32_t numBinNodes = readBinUInt(data, pos);
+        for (uint32_t i = 0; i < numBinNodes; ++i)
+        {
+            const std::string nodeName = readBinString(data, pos);
+            validateNode(nodeName);
+            const double temperature = readBinDouble(data, pos);
+            const double capacitance = readBinDouble(data, pos);
+            int groupId = readBinInt(data, pos);
+            if (groupId < 0 or groupId >= static_cast<int>(vCapEditGroupList.size()))
+            {
+                groupId = NOT_FOUND;
+            }
+            vNodeNames.push_back(nodeName);
+            vCapNames.push_back("cap_" + nodeName);
+            vCapPorts.push_back(numNodes);
+            vCapTemperatures.push_back(temperature);
+            vCapCapacitances.push_back(capacitance);
+            vCapEditGroupIdentifiers.push_back(groupId);
+            mNodeMap[nodeName] = numNodes;
+            numNodes++;
+            numLinksCap++;
+        }
+        confirmNodeBuild();
+        areNodesRegistered = true;
+
+        /// - Conduction links.
+        const uint32_t numCond = readBinUInt(data, pos);
+        for (uint32_t i = 0; i < numCond; ++i)
+        {
+            vCondNames.push_back(readBinString(data, pos));
+            vCondPorts0.push_back(readBinPort(data, pos));
+            vCondPorts1.push_back(readBinPort(data, pos));
+            vCondConductivities.push_back(readBinDouble(data, pos));
+            numLinksCond++;
+        }
+
+        /// - Radiation links.
+        const uint32_t numRad = readBinUInt(data, pos);
+        for (uint32_t i = 0; i < numRad; ++i)
+        {
+            vRadNames.push_back(readBinString(data, pos));
+            vRadPorts0.push_back(readBinPort(data, pos));
+            vRadPorts1.push_back(readBinPort(data, pos));
+            vRadCoefficients.push_back(readBinDouble(data, pos));
+            numLinksRad++;
+        }
+
+        /// - Potential links.
+        const uint32_t numPot = readBinUInt(data, pos);
+        for (uint32_t i = 0; i < numPot; ++i)
+        {
+            vPotNames.push_back(readBinString(data, pos));
+            vPotPorts.push_back(readBinPort(data, pos));
+            vPotTemperatures.push_back(readBinDouble(data, pos));
+            vPotConductivities.push_back(readBinDouble(data, pos));
+            numLinksPot++;
+        }
+
+        /// - All of the payload should have been used.
+        TS_PTCS_IF_ERREX(pos != data.size(), TsParseException, "invalid bin-file data", mBinFile);
+
+    } catch(TsParseException& e)
+    {
+        /// - Re-throw.
+        TS_PTCS_ERREX(TsParseException, "bin-file error", mBinFile)
+    }
+}
+////////////////////////////////////////////////////////////////////////////////////////////////////
 /// @details    Edits existing link data by reading overrides described in the ThermInput file.
 ///
 /// @note       The ThermInput-file should be in the following format.
@@ -1445,3 +1613,118 @@ void ThermFileParser::confirmDataFound(int count, const char* fileType, std::str
     /// - If no links were found, the wrong file was probably read.
     TS_PTCS_IF_ERREX(count <= 0, TsParseException, subtype.str(), xmlFile);
 }
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]      data  (--)  bin-file data
+/// @param[in,out]  pos   (--)  position of the value in the data, advanced past it
+///
+/// @throw    TsParseException if the data ends before the value
+///
+/// @return   The little-endian unsigned integer at the position.
+///
+/// @details  Private method used to read an unsigned integer from bin-file data.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+uint32_t ThermFileParser::readBinUInt(const std::vector<char>& data, size_t& pos)
+{
+    TS_PTCS_IF_ERREX(pos + 4 > data.size(), TsParseException, "truncated bin-file", mBinFile);
+
+    uint32_t value = 0;
+    for (int i = 3; i >= 0; --i)
+    {
+        value = (value << 8) | static_cast<unsigned char>(data[pos + i]);
+    }
+    pos += 4;
+    return value;
+}
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]      data  (--)  bin-file data
+/// @param[in,out]  pos   (--)  position of the value in the data, advanced past it
+///
+/// @throw    TsParseException if the data ends before the value
+///
+/// @return   The little-endian signed integer at the position.
+///
+/// @details  Private method used to read a signed integer from bin-file data.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+int ThermFileParser::readBinInt(const std::vector<char>& data, size_t& pos)
+{
+    return static_cast<int32_t>(readBinUInt(data, pos));
+}
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]      data  (--)  bin-file data
+/// @param[in,out]  pos   (--)  position of the value in the data, advanced past it
+///
+/// @throw    TsParseException if the data ends before the value
+///
+/// @return   The little-endian IEEE double at the position.
+///
+/// @details  Private method used to read a double from bin-file data.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+double ThermFileParser::readBinDouble(const std::vector<char>& data, size_t& pos)
+{
+    const uint64_t low  = readBinUInt(data, pos);
+    const uint64_t high = readBinUInt(data, pos);
+    const uint64_t bits = (high << 32) | low;
+
+    double value;
+    memcpy(&value, &bits, sizeof(value));
+    return value;
+}
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]      data  (--)  bin-file data
+/// @param[in,out]  pos   (--)  position of the string length in the data, advanced past the string
+///
+/// @throw    TsParseException if the data ends before the end of the string
+///
+/// @return   The string at the position.
+///
+/// @details  Private method used to read a length-prefixed string from bin-file data.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+std::string ThermFileParser::readBinString(const std::vector<char>& data, size_t& pos)
+{
+    const uint32_t length = readBinUInt(data, pos);
+    TS_PTCS_IF_ERREX(length > data.size() - pos, TsParseException, "truncated bin-file", mBinFile);
+
+    const std::string value(data.begin() + pos, data.begin() + pos + length);
+    pos += length;
+    return value;
+}
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]      data  (--)  bin-file data
+/// @param[in,out]  pos   (--)  position of the port number in the data, advanced past it
+///
+/// @throw    TsParseException if the data ends before the value, or the port is not a node
+///
+/// @return   The port number at the position.
+///
+/// @details  Private method used to read a link port number from bin-file data. The nodes must
+///           already be registered.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+int ThermFileParser::readBinPort(const std::vector<char>& data, size_t& pos)
+{
+    const int port = readBinInt(data, pos);
+    TS_PTCS_IF_ERREX(port < 0 or port >= numNodes, TsParseException, "invalid bin-file port",
+            mBinFile);
+    return port;
+}
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]  data  (--)  pointer to the start of the data
+/// @param[in]  size  (--)  number of bytes of data
+///
+/// @return   The CRC-32 checksum of the data.
+///
+/// @details  Computes the standard (IEEE 802.3, reflected) CRC-32 checksum, the same as Python's
+///           zlib.crc32, used to detect corrupted bin-files.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+uint32_t ThermFileParser::computeCrc32(const char* data, const size_t size)
+{
+    uint32_t crc = 0xFFFFFFFF;
+    for (size_t i = 0; i < size; ++i)
+    {
+        crc ^= static_cast<unsigned char>(data[i]);
+        for (int bit = 0; bit < 8; ++bit)
+        {
+            crc = (crc >> 1) ^ (0xEDB88320 & (0 - (crc & 1)));
+        }
+    }
+    return ~crc;
+}
@@ -18,6 +18,9 @@ PURPOSE:
           - htr-file:  Heater links, <heater>
           - pan-file:  ThermalPanel links, <panel>
           - etc-file:  et.cetera; Other link types, namely <potential> and <source>
+    Optionally, a binary bin-file written by ThermAspectGenerate may be given. It holds the same
+    node, conduction, radiation and potential data as the node, cond, rad and etc-files, and is
+    loaded in their place, which is much faster than parsing the XML for large networks.
     ThermalNetwork calls the ThermFileParser's initialize() method, which parses each file's
     specific XML tag structure, and stores the relevant data into its link-specific vectors.
     ThermalNetwork accesses these vectors and uses their data to construct a GUNNS network.)
@@ -26,7 +29,8 @@ REFERENCE:
    ()
 
 ASSUMPTIONS AND LIMITATIONS:
-   (This class utilizes tinyxml, hence is limited to take in only XML files.)
+   (This class utilizes tinyxml, hence is limited to take in only XML files, except for the
+    optional bin-file. The bin-file is little-endian, and its version must match BIN_VERSION.)
 
 LIBRARY DEPENDENCY:
    (ThermFileParser.o)
@@ -40,6 +44,7 @@ PROGRAMMERS:
 #include <string>
 #include <vector>
 #include <map>
+#include <stdint.h>
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 /// @brief    Parses the ThermalNetwork config-files and stores the data into vectors.
 ///
@@ -63,6 +68,8 @@ class ThermFileParser
 
     protected:
         static const int                   NOT_FOUND;                /**<    (--)  trick_chkpnt_io(**) result for a node not registered in the Node map */
+        static const char*                 BIN_MAGIC;                /**<    (--)  trick_chkpnt_io(**) identifier at the start of a bin-file */
+        static const uint32_t              BIN_VERSION;              /**<    (--)  trick_chkpnt_io(**) supported bin-file format version */
         bool                               areNodesRegistered;       /**<    (--)                      True if Nodes file successfully parsed. */
         std::string                        mName;                    /**<    (--)  trick_chkpnt_io(**) Parser name. */
 
@@ -73,6 +80,7 @@ class ThermFileParser
         std::string                        mHtrFile;                 /**<    (--)  trick_chkpnt_io(**) xml file with heater link data */
         std::string                        mPanFile;                 /**<    (--)  trick_chkpnt_io(**) xml file with thermal-panel data */
         std::string                        mEtcFile;                 /**<    (--)  trick_chkpnt_io(**) xml file with other thermal link data */
+        std::string                        mBinFile;                 /**<    (--)  trick_chkpnt_io(**) binary file with node, cond, rad & potential link data, replaces the node, cond, rad & etc files */
 
         std::string                        mThermInputFile;          /**<    (--)  trick_chkpnt_io(**) name of thermal input-file to parse */
         std::string                        mThermInputFileRad;       /**<    (--)  trick_chkpnt_io(**) name of radiation thermal input-file to parse */
@@ -155,6 +163,8 @@ class ThermFileParser
         void readPanFile();
         /// @brief  Read Other Link config-file.
         void readEtcFile();
+        /// @brief  Read Node/Cap, Cond, Rad and Potential Link data from the binary config-file.
+        void readBinFile();
 
         /// @brief  Edits existing link data by reading overrides described in the ThermInput file.
         void readThermInputFile();
@@ -237,6 +247,19 @@ class ThermFileParser
         /// @brief  Checks whether the parsed file contained the expected data.
         void confirmDataFound(int count, const char* info, std::string& xmlFile);
 
+        /// @brief  Reads an unsigned integer from binary config-file data.
+        uint32_t readBinUInt(const std::vector<char>& data, size_t& pos);
+        /// @brief  Reads a signed integer from binary config-file data.
+        int readBinInt(const std::vector<char>& data, size_t& pos);
+        /// @brief  Reads a double from binary config-file data.
+        double readBinDouble(const std::vector<char>& data, size_t& pos);
+        /// @brief  Reads a string from binary config-file data.
+        std::string readBinString(const std::vector<char>& data, size_t& pos);
+        /// @brief  Reads a port number from binary config-file data and validates it.
+        int readBinPort(const std::vector<char>& data, size_t& pos);
+        /// @brief  Computes the CRC-32 checksum of binary config-file data.
+        static uint32_t computeCrc32(const char* data, const size_t size);
+
     private:
         /// @details  Copy constructor unavailable since declared private and not implemented.
         ThermFileParser(const ThermFileParser&);
@@ -33,6 +33,7 @@ LIBRARY DEPENDENCY:
 /// @param[in]  htrFile   (--)  xml file with heater link data
 /// @param[in]  panFile   (--)  xml file with thermal-panel data
 /// @param[in]  etcFile   (--)  xml file with other thermal link data (potentials, sources, etc)
+/// @param[in]  binFile   (--)  optional binary file replacing the node, cond, rad & etc files
 ///
 /// @details    Constructs this ThermalNetwork configuration data.
 ////////////////////////////////////////////////////////////////////////////////////////////////////
@@ -42,14 +43,16 @@ ThermalNetworkConfigData::ThermalNetworkConfigData(
         std::string radFile,
         std::string htrFile,
         std::string panFile,
-        std::string etcFile)
+        std::string etcFile,
+        std::string binFile)
     :
     cNodeFile(nodeFile),
     cCondFile(condFile),
     cRadFile(radFile),
     cHtrFile(htrFile),
     cPanFile(panFile),
-    cEtcFile(etcFile)
+    cEtcFile(etcFile),
+    cBinFile(binFile)
 {
     // nothing to do
 }
@@ -65,7 +68,8 @@ ThermalNetworkConfigData::ThermalNetworkConfigData(const ThermalNetworkConfigDat
     cRadFile(that.cRadFile),
     cHtrFile(that.cHtrFile),
     cPanFile(that.cPanFile),
-    cEtcFile(that.cEtcFile)
+    cEtcFile(that.cEtcFile),
+    cBinFile(that.cBinFile)
 {
     // nothing to do
 }
@@ -201,6 +205,7 @@ void ThermalNetwork::initNodes(const std::string& name)
     parser.mHtrFile           = mConfig.cHtrFile;
     parser.mPanFile           = mConfig.cPanFile;
     parser.mEtcFile           = mConfig.cEtcFile;
+    parser.mBinFile           = mConfig.cBinFile;
     parser.mThermInputFile    = mInput.iThermInputFile;
     parser.mThermInputFileRad = mInput.iInputRadFile;
 
@@ -1256,6 +1261,7 @@ void ThermalNetwork::setMalfHtrMiswire(const bool flag, const int* index)
 int ThermalNetwork::getNumLocalNodes()
 {
     parser.mNodeFile = mConfig.cNodeFile;
+    parser.mBinFile  = mConfig.cBinFile;
     parser.preCountNodes();
     netNumLocalNodes = parser.numNodes;
     return netNumLocalNodes;
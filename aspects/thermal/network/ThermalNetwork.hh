@@ -81,6 +81,7 @@ class ThermalNetworkConfigData
         std::string  cHtrFile;  /**< (--) trick_chkpnt_io(**) name of xml file with heater/source link data */
         std::string  cPanFile;  /**< (--) trick_chkpnt_io(**) name of xml file with thermal-panel data */
         std::string  cEtcFile;  /**< (--) trick_chkpnt_io(**) name of xml file with other thermal link data */
+        std::string  cBinFile;  /**< (--) trick_chkpnt_io(**) optional binary file replacing the node, cond, rad & etc files */
 
         /// @brief   Default constructs this ThermalNetwork configuration data.
         ThermalNetworkConfigData(std::string nodeFile = "",
@@ -88,7 +89,8 @@ class ThermalNetworkConfigData
                                  std::string radFile = "",
                                  std::string htrFile = "",
                                  std::string panFile = "",
-                                 std::string etcFile = "");
+                                 std::string etcFile = "",
+                                 std::string binFile = "");
         /// @brief   Default destructs this ThermalNetwork configuration data.
         ~ThermalNetworkConfigData();
         /// @brief   Copy constructs this ThermalNetwork configuration data.
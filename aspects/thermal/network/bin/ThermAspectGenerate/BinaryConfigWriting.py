@@ -0,0 +1,293 @@
+####################################################################################################
+## @copyright Copyright 2019 United States Government as represented by the Administrator of the
+##            National Aeronautics and Space Administration.  All Rights Reserved.
+##
+## created: Oct 2026
+####################################################################################################
+## Include all necessary classes.
+import struct
+import zlib
+from ThermSupport import ThermError
+from XmlParsing import XmlParser, TagNotFound
+
+#===================================================================================================
+# BinaryConfigWriter
+#===================================================================================================
+## @brief:
+## This class writes the node, conduction, radiation and potential data of a generated thermal
+## network to a single binary config-file, which the sim's ThermFileParser can load instead of
+## parsing the node, cond, rad and etc xml-files. The binary file holds the same data the
+## ThermFileParser would build from the xml: node and link names, port numbers in node-file order,
+## and the numeric values converted from the same text.
+##
+## The file is little-endian. It starts with a 16-byte header:
+##   - magic     4 chars, "GTNB"
+##   - version   uint32
+##   - size      uint32, number of bytes in the payload
+##   - checksum  uint32, CRC-32 of the payload
+## The payload holds five tables in order, each starting with a uint32 row count. Strings are a
+## uint32 length followed by the characters.
+##   - cap-edit groups:  name
+##   - nodes:            name, temperature (K), capacitance (J/K), cap-edit group index (int32, -1
+##                       if none)
+##   - conductions:      name, port0 (int32), port1 (int32), conductivity (W/K)
+##   - radiations:       name, port0 (int32), port1 (int32), coefficient (m2)
+##   - potentials:       name, port (int32), temperature (K), conductivity (W/K)
+##
+## Links without a <name> are given the same default names the ThermFileParser gives them.
+class BinaryConfigWriter():
+    ## @brief:
+    ## Default constructs the object.
+    def __init__(self):
+
+        ## An XmlParser() object for getting data from xml elements.
+        self.mParser = XmlParser()
+
+        ## Name (abbreviation) of network being written, for error reporting.
+        self.mNetwork = "[mNetwork not initialized]"
+
+        ## File identifier and format version. The version must be incremented, and the
+        ## ThermFileParser updated to match, whenever the layout changes.
+        self.mMagic = "GTNB"
+        self.mVersion = 1
+
+        ## Number of rows written in each table.
+        self.mCounts = {}
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder after the xml-files are printed. Writes
+    ## the binary config-file from the given xml-trees.
+    ## @param[in]: network   name (abbreviation) of the network, for error reporting
+    ## @param[in]: binFile   path and name of the binary config-file to write
+    ## @param[in]: nodeXml   xml element containing the <node> and <capEditing> elements
+    ## @param[in]: condXml   xml element containing the <conduction> elements
+    ## @param[in]: radXml    xml element containing the <radiation> elements
+    ## @param[in]: etcXml    xml element containing the <potential> elements, or None
+    def write(self, network, binFile, nodeXml, condXml, radXml, etcXml):
+        self.mNetwork = network
+        tables = self.buildTables(nodeXml, condXml, radXml, etcXml)
+        payload = self.packTables(tables)
+        header = struct.pack("<4sIII", self.mMagic, self.mVersion, len(payload),
+                             zlib.crc32(payload) & 0xffffffff)
+        try:
+            f = open(binFile, 'wb')
+            f.write(header)
+            f.write(payload)
+            f.close()
+        except IOError, e:
+            print e
+            raise ThermError("Error writing binary config-file: %s" % binFile)
+
+        self.mCounts = dict((key, len(rows)) for (key, rows) in tables.iteritems())
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Reads a binary config-file and checks its header and checksum.
+    ## @param[in]: binFile   path and name of the binary config-file to read
+    ## @return:    dictionary of tables, with keys "groups", "nodes", "conductions", "radiations"
+    ##             and "potentials", each a list of row tuples
+    def read(self, binFile):
+        try:
+            f = open(binFile, 'rb')
+            data = f.read()
+            f.close()
+        except IOError, e:
+            print e
+            raise ThermError("Error reading binary config-file: %s" % binFile)
+
+        if len(data) < 16:
+            raise ThermError("Binary config-file is truncated: %s" % binFile)
+        (magic, version, size, checksum) = struct.unpack_from("<4sIII", data, 0)
+        if magic != self.mMagic:
+            raise ThermError("Not a thermal binary config-file: %s" % binFile)
+        if version != self.mVersion:
+            raise ThermError("Unsupported binary config-file version %i: %s" % (version, binFile))
+        payload = data[16:]
+        if len(payload) != size:
+            raise ThermError("Binary config-file is truncated: %s" % binFile)
+        if zlib.crc32(payload) & 0xffffffff != checksum:
+            raise ThermError("Binary config-file checksum mismatch: %s" % binFile)
+
+        try:
+            return self.unpackTables(payload)
+        except struct.error, e:
+            print e
+            raise ThermError("Binary config-file is corrupt: %s" % binFile)
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Proves the binary config-file is equivalent to the xml config-files by
+    ## reading both back from disk and comparing every table.
+    ## @param[in]: network    name (abbreviation) of the network, for error reporting
+    ## @param[in]: binFile    path and name of the binary config-file
+    ## @param[in]: nodeFile   path and name of the node xml-file
+    ## @param[in]: condFile   path and name of the conduction xml-file, or None if not printed
+    ## @param[in]: radFile    path and name of the radiation xml-file, or None if not printed
+    ## @param[in]: etcFile    path and name of the etc xml-file, or None if not printed
+    def verify(self, network, binFile, nodeFile, condFile, radFile, etcFile):
+        self.mNetwork = network
+        xml = []
+        for file in [nodeFile, condFile, radFile, etcFile]:
+            if None == file:
+                xml.append(self.mParser.newElement("list"))
+            else:
+                xml.append(self.mParser.loadFile(file))
+        expected = self.buildTables(xml[0], xml[1], xml[2], xml[3])
+        actual = self.read(binFile)
+
+        for key in ["groups", "nodes", "conductions", "radiations", "potentials"]:
+            if len(expected[key]) != len(actual[key]):
+                raise ThermError("Binary config-file has %i %s, xml has %i (%s)." %
+                                 (len(actual[key]), key, len(expected[key]), network))
+            for (i, row) in enumerate(expected[key]):
+                if row != actual[key][i]:
+                    raise ThermError("Binary config-file %s row %i differs from xml (%s): %s" %
+                                     (key, i, network, str(actual[key][i])))
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in write() and verify(). Builds the tables from the xml-trees, the
+    ## same way the ThermFileParser reads the xml-files: a node or link with missing or invalid
+    ## data, a blank or repeated node name, or a link to an unregistered node is skipped with a
+    ## warning.
+    ## @param[in]: nodeXml   xml element containing the <node> and <capEditing> elements
+    ## @param[in]: condXml   xml element containing the <conduction> elements
+    ## @param[in]: radXml    xml element containing the <radiation> elements
+    ## @param[in]: etcXml    xml element containing the <potential> elements, or None
+    ## @return:    dictionary of tables, see read()
+    def buildTables(self, nodeXml, condXml, radXml, etcXml):
+        tables = {"groups": [], "nodes": [], "conductions": [], "radiations": [],
+                  "potentials": []}
+        ports = {}
+        try:
+            for capEditing in self.mParser.getElements(nodeXml, "capEditing"):
+                for group in self.mParser.getElements(capEditing, "group", True, self.mNetwork):
+                    tables["groups"].append((self.mParser.getText(group, self.mNetwork),))
+        except TagNotFound, e:
+            print e,
+            raise ThermError("Invalid <capEditing> data in network (%s)." % self.mNetwork)
+        groupIds = dict((row[0], i) for (i, row) in enumerate(tables["groups"]))
+
+        for element in self.mParser.getElements(nodeXml, "node"):
+            name = "(error setting name)"
+            try:
+                name = self.mParser.getChildText(element, "name", self.mNetwork)
+                if name in ports:
+                    raise ThermError("Repeated node name %s." % name)
+                row = (name, self.getFloat(element, "temperature", name),
+                       self.getFloat(element, "capacitance", name), -1)
+                editGroup = self.mParser.getElements(element, "editGroup")
+                if editGroup and editGroup[0].text in groupIds:
+                    row = row[:3] + (groupIds[editGroup[0].text],)
+            except (ThermError, TagNotFound), e:
+                print "Warning: did not write node %s (%s): %s" % (name, self.mNetwork, e)
+                continue
+            ports[name] = len(tables["nodes"])
+            tables["nodes"].append(row)
+
+        for (key, xml, tag, valueTag, prefix) in [
+                ("conductions", condXml, "conduction", "conductivity", "cond"),
+                ("radiations", radXml, "radiation", "coefficient", "rad")]:
+            for element in self.mParser.getElements(xml, tag):
+                name = "(error setting name)"
+                try:
+                    n0 = self.mParser.getChildText(element, "node0", self.mNetwork)
+                    n1 = self.mParser.getChildText(element, "node1", self.mNetwork)
+                    name = "%s %s to %s" % (prefix, n0, n1)
+                    if self.mParser.getElements(element, "name"):
+                        name = self.mParser.getChildText(element, "name", self.mNetwork)
+                    row = (name, self.getPort(ports, n0), self.getPort(ports, n1),
+                           self.getFloat(element, valueTag, name))
+                except (ThermError, TagNotFound), e:
+                    print "Warning: did not write %s link %s (%s): %s" % (prefix, name,
+                                                                          self.mNetwork, e)
+                    continue
+                tables[key].append(row)
+
+        for element in ([] if None == etcXml else self.mParser.getElements(etcXml, "potential")):
+            name = "(error setting name)"
+            try:
+                name = self.mParser.getChildText(element, "name", self.mNetwork)
+                node = self.mParser.getChildText(element, "node", name)
+                row = (name, self.getPort(ports, node),
+                       self.getFloat(element, "temperature", name),
+                       self.getFloat(element, "conductivity", name))
+            except (ThermError, TagNotFound), e:
+                print "Warning: did not write pot link %s (%s): %s" % (name, self.mNetwork, e)
+                continue
+            tables["potentials"].append(row)
+
+        return tables
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in write(). Packs the tables into the binary payload.
+    ## @param[in]: tables   dictionary of tables, see read()
+    ## @return:    payload string
+    def packTables(self, tables):
+        chunks = []
+        for (key, format) in [("groups", "s"), ("nodes", "sddi"), ("conductions", "siid"),
+                              ("radiations", "siid"), ("potentials", "sidd")]:
+            chunks.append(struct.pack("<I", len(tables[key])))
+            for row in tables[key]:
+                for (code, value) in zip(format, row):
+                    if "s" == code:
+                        chunks.append(struct.pack("<I", len(value)) + value)
+                    else:
+                        chunks.append(struct.pack("<" + code, value))
+        return "".join(chunks)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in read(). Unpacks the tables from the binary payload.
+    ## @param[in]: payload   payload string
+    ## @return:    dictionary of tables, see read()
+    def unpackTables(self, payload):
+        tables = {}
+        offset = 0
+        for (key, format) in [("groups", "s"), ("nodes", "sddi"), ("conductions", "siid"),
+                              ("radiations", "siid"), ("potentials", "sidd")]:
+            (count,) = struct.unpack_from("<I", payload, offset)
+            offset = offset + 4
+            tables[key] = []
+            for i in range(count):
+                row = []
+                for code in format:
+                    if "s" == code:
+                        (length,) = struct.unpack_from("<I", payload, offset)
+                        (value,) = struct.unpack_from("<%is" % length, payload, offset + 4)
+                        offset = offset + 4 + length
+                    else:
+                        (value,) = struct.unpack_from("<" + code, payload, offset)
+                        offset = offset + struct.calcsize(code)
+                    row.append(value)
+                tables[key].append(tuple(row))
+        if offset != len(payload):
+            raise struct.error("%i unused bytes at end of payload" % (len(payload) - offset))
+        return tables
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in buildTables(). Gets a float from a child element's text.
+    ## @param[in]: element   parent xml element
+    ## @param[in]: tag       tag of the child element
+    ## @param[in]: info      node or link name, for error reporting
+    ## @return:    value of the child element's text
+    def getFloat(self, element, tag, info):
+        text = self.mParser.getChildText(element, tag, info)
+        try:
+            return float(text)
+        except ValueError, e:
+            raise ThermError("Non-numeric <%s> (%s)." % (tag, info))
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in buildTables(). Gets the port number of a node.
+    ## @param[in]: ports   dictionary with key = node name, value = port number
+    ## @param[in]: node    node name
+    ## @return:    port number of the node
+    def getPort(self, ports, node):
+        if node not in ports:
+            raise ThermError("Unregistered node name %s." % node)
+        return ports[node]
@@ -13,6 +13,11 @@ from XmlParsing import XmlParser, TagNotFound
 from ThermRegistryEntryAnalyzing import ThermRegistryEntryAnalyzer
 from SourceEntryAnalyzing import SourceEntryAnalyzer  
 from IcdBuilding import IcdBuilder
+from RadiationSparsifying import RadiationSparsifier
+from NodeLumping import NodeLumper
+from StiffnessAnalyzing import StiffnessAnalyzer
+from BinaryConfigWriting import BinaryConfigWriter
+from NetworkPartitioning import NetworkPartitioner
 
 #===================================================================================================
 # IndivNetworkBuilder
@@ -79,6 +84,12 @@ class IndivNetworkBuilder():
         self.mEtcFile = uninitialized % "mEtcFile"
         ## Path and file name of TrickView file. Each network produces its own TrickView file.
         self.mTvFile = uninitialized % "mTvFile"
+        ## Path and file name of the optional binary config-file, or None if disabled.
+        self.mBinFile = None
+        ## BinaryConfigWriter object. Writes and verifies the binary config-file.
+        self.mBinWriter = BinaryConfigWriter()
+        ## Path and file name of the optional partition report, or None.
+        self.mPartitionFile = None
         
         ## Initialize lists for enumerating.
         self.tdNodeList = []
@@ -106,6 +117,35 @@ class IndivNetworkBuilder():
         ## modeled mass to the rated mass.
         self.mStructMassScalar = 0
         
+        ## Energy-error budget for radiation sparsification, or None if sparsification is disabled.
+        self.mRadSparsifyBudget = None
+        ## RadiationSparsifier object. Drops negligible Thermal Desktop radiation couplings.
+        self.mRadSparsifier = RadiationSparsifier()
+        
+        ## Node lumping settings, see IndivNetworkConfig. Lumping is disabled if the time constant
+        ## is None.
+        self.mNodeLumpTimeConstant = None
+        self.mNodeLumpCouplingRatio = 0.9
+        self.mNodeLumpFrequency = 0.01
+        ## NodeLumper object. Merges strongly coupled nodes.
+        self.mNodeLumper = NodeLumper()
+        ## Set of nodes referenced by heaters, panels and sources.
+        self.mSourceNodes = set()
+        
+        ## Stiffness analysis settings, see IndivNetworkConfig. The analysis is disabled if the
+        ## rate is None.
+        self.mStiffnessRate = None
+        self.mStiffnessCandidateRates = []
+        ## StiffnessAnalyzer object. Reports node time constants and suggested rates.
+        self.mStiffnessAnalyzer = StiffnessAnalyzer()
+        
+        ## Partition advisor settings, see IndivNetworkConfig. The advisor is disabled if the count
+        ## is None.
+        self.mPartitionCount = None
+        self.mPartitionImbalance = 0.05
+        ## NetworkPartitioner object. Proposes a split of the network into sub-networks.
+        self.mPartitioner = NetworkPartitioner()
+        
         ## Initialize new PTCS XML elements. These elements will be built up during the course of
         ## the network parsing/analysis. At the conclusion, when the xml trees are complete, they
         ## will be printed to generated thermal config-files.
@@ -141,6 +181,22 @@ class IndivNetworkBuilder():
         ## Expected/Rated mass (kg) of the thermal network
         self.mExpectedMass = None
         
+        ## Energy-error budget for radiation sparsification, or None if sparsification is disabled.
+        self.mRadSparsifyBudget = config.cRadSparsifyBudget
+        
+        ## Node lumping settings.
+        self.mNodeLumpTimeConstant = config.cNodeLumpTimeConstant
+        self.mNodeLumpCouplingRatio = config.cNodeLumpCouplingRatio
+        self.mNodeLumpFrequency = config.cNodeLumpFrequency
+        
+        ## Stiffness analysis settings.
+        self.mStiffnessRate = config.cStiffnessRate
+        self.mStiffnessCandidateRates = config.cStiffnessCandidateRates
+        
+        ## Partition advisor settings.
+        self.mPartitionCount = config.cPartitionCount
+        self.mPartitionImbalance = config.cPartitionImbalance
+        
         ## Initialize file paths.      
         self.mRegisFile = config.cRegisFile
         self.mTdFile = config.cTdFile
@@ -151,6 +207,8 @@ class IndivNetworkBuilder():
         self.mHtrFile = config.cHtrFile
         self.mEtcFile = config.cEtcFile
         self.mTvFile = config.cTvFile
+        self.mBinFile = config.cBinFile
+        self.mPartitionFile = config.cPartitionFile
         
         ## Initialize IcdBuilder object with basic ICD data.
         self.mIcdBuilder.initialize(self.mNetwork, config.cIcdSettings)
@@ -181,11 +239,23 @@ class IndivNetworkBuilder():
             ## Append ThermalDesktop data to the end of the xml config-files.
             self.appendThermalDesktopData(tdData)
             
+            ## Drop negligible radiation couplings, if configured.
+            self.sparsifyRadiation()
+            
             ## Heaters and panels are both derived from GunnsThermalSource, and they both have very
             ## similar registry schemas. They can be parsed with the same function.
             self.readThermSourceFile("heater", self.mHtrFile, self.mHtrList)
             self.readThermSourceFile("panel", self.mPanFile, self.mPanList)
             self.readThermSourceFile("source", self.mHtrFile, self.mSrcList)
+            
+            ## Merge strongly coupled nodes, if configured.
+            self.lumpNodes()
+            
+            ## Analyze the finished network's time constants, if configured.
+            self.analyzeStiffness()
+            
+            ## Propose a split of the network into sub-networks, if configured.
+            self.partitionNetwork()
 
             ## Write XML trees to file.
             self.mPrinter.printThermXml(self.mNodeXml, self.mNodeFile, self.mCallingScript)
@@ -193,6 +263,9 @@ class IndivNetworkBuilder():
             self.mPrinter.printThermXml(self.mRadXml, self.mRadFile, self.mCallingScript)
             self.mPrinter.printThermXml(self.mEtcXml, self.mEtcFile, self.mCallingScript)
             
+            ## Write the binary config-file and verify it against the xml-files, if configured.
+            self.writeBinaryConfig()
+            
         except ThermError, e:
             print e,
             raise ThermError("Error executing network (%s)." % self.mNetwork)
@@ -551,6 +624,9 @@ class IndivNetworkBuilder():
         ## Append source to list of successfully-build sources.
         srcList.append(entryObj.mName)
         
+        ## Record the source's nodes, which are referenced by name in the source files.
+        self.mSourceNodes.update(entryObj.mNodeList)
+        
         ## Build Icd jobs.
         self.mIcdBuilder.processIcd(entryObj.mEntry, entryObj.mName, theType, enumIndex, entryObj.mDescription)
     #-----------------------------------------------------------------------------------------------
@@ -656,6 +732,82 @@ class IndivNetworkBuilder():
             if None != tdRadElement:
                 self.mRadXml.append(tdRadElement)
 
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). If a radiation sparsification budget is configured,
+    ## drops the negligible Thermal Desktop radiation couplings and lumps their coefficients onto
+    ## the surviving links. The registry radiation links, which are first in the mRadXml, are kept.
+    def sparsifyRadiation(self):
+        if None == self.mRadSparsifyBudget:
+            return
+        self.mRadSparsifier.initialize(self.mNetwork, self.mRadSparsifyBudget)
+        self.mRadSparsifier.execute(self.mRadXml, self.mNodeXml, len(self.mRadList))
+    
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). If a node lumping time constant is configured, merges
+    ## strongly coupled nodes into surviving nodes and updates the node bookkeeping to match. Nodes
+    ## in the registry and nodes referenced by sources are never merged away.
+    def lumpNodes(self):
+        if None == self.mNodeLumpTimeConstant:
+            return
+        self.mNodeLumper.initialize(self.mNetwork, self.mNodeLumpTimeConstant,
+                                    self.mNodeLumpCouplingRatio, self.mNodeLumpFrequency)
+        lumped = self.mNodeLumper.execute(self.mNodeXml, self.mCondXml, self.mRadXml, self.mEtcXml,
+                                          set(self.regisNodeList) | self.mSourceNodes,
+                                          len(self.mRadList))
+        
+        ## Move the merged nodes' mass to their survivors and remove them from the node list.
+        for (node, survivor) in lumped.iteritems():
+            self.mMassDict[survivor] = self.mMassDict.get(survivor, 0) + self.mMassDict.pop(node, 0)
+        self.masterNodeList = [n for n in self.masterNodeList if n not in lumped]
+        self.mCondNum = len(self.mParser.getElements(self.mCondXml, "conduction"))
+    
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). If a stiffness analysis rate is configured, reports the
+    ## node time constants, the nodes too fast for the rate, and the suggested rate groupings.
+    def analyzeStiffness(self):
+        if None == self.mStiffnessRate:
+            return
+        self.mStiffnessAnalyzer.initialize(self.mNetwork, self.mStiffnessRate,
+                                           self.mStiffnessCandidateRates)
+        self.mStiffnessAnalyzer.execute(self.mNodeXml, self.mCondXml, self.mRadXml, self.mEtcXml)
+    
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). If a partition count is configured, proposes a split of
+    ## the finished network into weakly coupled sub-networks, and writes the proposal to the
+    ## partition report if one is configured.
+    def partitionNetwork(self):
+        if None == self.mPartitionCount:
+            return
+        self.mPartitioner.initialize(self.mNetwork, self.mPartitionCount, self.mPartitionImbalance)
+        self.mPartitioner.execute(self.mNodeXml, self.mCondXml, self.mRadXml)
+        if None != self.mPartitionFile:
+            self.mPartitioner.writeReport(self.mPartitionFile, self.mCallingScript,
+                                          self.regisNodeList)
+    
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute() after the xml-files are printed. If a binary config-file
+    ## is configured, writes it and verifies it against the printed xml-files. Empty xml trees are
+    ## not printed, so they are verified as empty.
+    def writeBinaryConfig(self):
+        if None == self.mBinFile:
+            return
+        self.mBinWriter.write(self.mNetwork, self.mBinFile, self.mNodeXml, self.mCondXml,
+                              self.mRadXml, self.mEtcXml)
+        printed = []
+        for (xml, file) in [(self.mCondXml, self.mCondFile), (self.mRadXml, self.mRadFile),
+                            (self.mEtcXml, self.mEtcFile)]:
+            printed.append(file if len(xml) > 0 else None)
+        self.mBinWriter.verify(self.mNetwork, self.mBinFile, self.mNodeFile,
+                               printed[0], printed[1], printed[2])
+        counts = self.mBinWriter.mCounts
+        print "     binary config: %i nodes, %i cond, %i rad, %i pot links verified against xml." % \
+              (counts["nodes"], counts["conductions"], counts["radiations"], counts["potentials"])
+    
     #-----------------------------------------------------------------------------------------------
     ## @brief:
     ## Private method, called in readThermRegistry(). Reads the expectedMass element from the
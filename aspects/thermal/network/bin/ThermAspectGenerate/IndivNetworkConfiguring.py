@@ -42,6 +42,32 @@ class IndivNetworkConfig():
         ## total-mass expected value.
         self.cIsMassAdjustable = notSet % "cIsMassAdjustable"
         
+        ## Energy-error budget for the optional radiation sparsification: the fraction (0-1) of each
+        ## node's total radiation conductance that may be dropped from its weakest Thermal Desktop
+        ## radiation couplings. None disables radiation sparsification.
+        self.cRadSparsifyBudget = None
+        
+        ## Settings for the optional node lumping. Nodes whose RC time constant (s) through a
+        ## conduction coupling is no greater than cNodeLumpTimeConstant, and whose total conductance
+        ## is at least the cNodeLumpCouplingRatio fraction in that coupling, are merged. The
+        ## frequency-response error is reported at cNodeLumpFrequency (Hz). A cNodeLumpTimeConstant
+        ## of None disables node lumping.
+        self.cNodeLumpTimeConstant = None
+        self.cNodeLumpCouplingRatio = 0.9
+        self.cNodeLumpFrequency = 0.01
+        
+        ## Settings for the optional stiffness analysis. cStiffnessRate is the network's thermal
+        ## rate (Hz); nodes whose time constant is shorter than its step are flagged, and nodes are
+        ## grouped by the cStiffnessCandidateRates (Hz). A cStiffnessRate of None disables it.
+        self.cStiffnessRate = None
+        self.cStiffnessCandidateRates = [0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0]
+        
+        ## Settings for the optional partition advisor, which proposes a split of the network into
+        ## cPartitionCount weakly coupled sub-networks, with each bisection's node counts balanced
+        ## to within the cPartitionImbalance fraction. A cPartitionCount of None disables it.
+        self.cPartitionCount = None
+        self.cPartitionImbalance = 0.05
+        
         #Files to read ............................................
         ## Path and file name of Thermal Aspect Registry file.
         self.cRegisFile = notSet % "cRegisFile"
@@ -63,3 +89,11 @@ class IndivNetworkConfig():
         self.cEtcFile = notSet % "cEtcFile"
         ## Path and file name of TrickView file. Each network produces its own TrickView file.
         self.cTvFile = notSet % "cTvFile"
+        ## Path and file name of the optional binary config-file, holding the node, conduction,
+        ## radiation and potential data for a faster sim load. None disables it.
+        self.cBinFile = None
+        ## Path and file name of the optional partition report, listing the proposed sub-networks
+        ## and their interface couplings. None only prints the partition summary. The report is
+        ## advisory, for splitting the Thermal Aspect Registry and Thermal Desktop files by hand;
+        ## it is not a registry, and no generator stage reads it.
+        self.cPartitionFile = None
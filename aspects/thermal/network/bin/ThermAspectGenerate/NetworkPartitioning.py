@@ -0,0 +1,429 @@
+####################################################################################################
+## @copyright Copyright 2019 United States Government as represented by the Administrator of the
+##            National Aeronautics and Space Administration.  All Rights Reserved.
+##
+## created: Oct 2026
+####################################################################################################
+## Include all necessary classes.
+import heapq
+from ThermSupport import ThermError, ThermPrinter
+from XmlParsing import XmlParser
+from ThermNetworkModeling import ThermNetworkModel
+
+#===================================================================================================
+# NetworkPartitioner
+#===================================================================================================
+## @brief:
+## This class is an optional advisory stage of the IndivNetworkBuilder. It proposes how a generated
+## thermal network could be split into a number of smaller, weakly coupled sub-networks, so that
+## they could run in parallel on separate threads and exchange their interface couplings over the
+## sim bus. It does not change the generated network.
+##
+## The network's nodes are split into sub-networks with balanced node counts, while keeping the
+## conductance (conduction plus linearized radiation) of the couplings cut between sub-networks
+## small. The split is made by recursive bisection. Each bisection grows one half from a peripheral
+## node, always adding the node most strongly coupled to it, then refines the split by
+## Fiduccia-Mattheyses passes, which move single nodes across to reduce the cut conductance while
+## keeping the halves within the allowed imbalance.
+##
+## The space node (the last node, with zero capacitance) is a fixed boundary that every sub-network
+## would keep a copy of, so it is not split and its links are never interface couplings.
+##
+## The proposal is written as an xml report listing each sub-network's nodes, marking the nodes
+## that are in the Thermal Aspect Registry, followed by every interface coupling that would cross
+## the bus. The coupling error of running the interface explicitly is summarized by the largest
+## fraction of any node's conductance that crosses the interface, and by the shortest interface
+## time constant, C / G_interface, which the bus exchange step must be well within.
+##
+## The report is advisory only. It is not a Thermal Aspect Registry, and no generator stage reads
+## it. Most of a network's nodes and links come from the Thermal Desktop files rather than the
+## registry, so a per-sub-network registry can't express the split. To apply a proposal, the
+## registry and Thermal Desktop files are split by hand along the reported sub-networks, and each
+## interface coupling is replaced by a bus coupling, such as a <potential> to the other
+## sub-network's node temperature.
+class NetworkPartitioner():
+    ## @brief:
+    ## Default constructs the object with default, uninitialized members.
+    def __init__(self):
+
+        ## Initialization flag.
+        self.mInitialized = False
+
+        ## An XmlParser() object for building the report xml.
+        self.mParser = XmlParser()
+
+        ## Name (abbreviation) of network being partitioned, for reporting.
+        self.mNetwork = "[mNetwork not initialized]"
+
+        ## Number of sub-networks to split the network into.
+        self.mNumParts = 1
+        ## Allowed imbalance, as a fraction of the node count, of each bisection.
+        self.mImbalance = 0.05
+        ## Maximum number of refinement passes of each bisection.
+        self.mMaxPasses = 10
+
+        ## List of sub-networks, each a list of node names in node-file order.
+        self.mParts = []
+        ## Dictionary with key = node name, value = index of its sub-network.
+        self.mNodePart = {}
+        ## Shared boundary (space) node, or None.
+        self.mBoundaryNode = None
+        ## List of interface couplings: [type, name, node0, node1, conductance (W/K)].
+        self.mInterfaceLinks = []
+        ## Total conductance (W/K) of the cut couplings, and of all couplings between split nodes.
+        self.mCutConductance = 0.0
+        self.mTotalConductance = 0.0
+        ## Largest fraction of a node's conductance that crosses the interface, and the node.
+        self.mMaxInterfaceFraction = 0.0
+        self.mMaxInterfaceFractionNode = None
+        ## Shortest interface time constant (s), C / G_interface, and the node.
+        self.mMinInterfaceTimeConstant = None
+        self.mMinInterfaceTimeConstantNode = None
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder. Initializes the object.
+    ## @param[in]: network     name (abbreviation) of the network, for reporting
+    ## @param[in]: numParts    number of sub-networks to split the network into
+    ## @param[in]: imbalance   allowed imbalance (0-1) of each bisection, as a fraction of its nodes
+    def initialize(self, network, numParts, imbalance=0.05):
+        try:
+            if int(numParts) != numParts:
+                raise ValueError
+            numParts = int(numParts)
+            imbalance = float(imbalance)
+        except (TypeError, ValueError), e:
+            raise ThermError("Invalid network partition settings (%s)." % network)
+
+        if numParts < 1:
+            raise ThermError("Network partition count must be >= 1 (%s)." % network)
+        if imbalance < 0.0 or imbalance >= 1.0:
+            raise ThermError("Network partition imbalance must be in [0, 1) (%s)." % network)
+
+        self.mNetwork = network
+        self.mNumParts = numParts
+        self.mImbalance = imbalance
+
+        ## Set initialization flag.
+        self.mInitialized = True
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder after the network is complete. Splits the
+    ## network into sub-networks and finds the interface couplings.
+    ## @param[in]: nodeXml   xml element containing the <node> elements
+    ## @param[in]: condXml   xml element containing the <conduction> elements
+    ## @param[in]: radXml    xml element containing the <radiation> elements
+    def execute(self, nodeXml, condXml, radXml):
+
+        if False == self.mInitialized:
+            raise ThermError("NetworkPartitioner not initialized.")
+
+        model = ThermNetworkModel()
+        model.load(self.mNetwork, nodeXml, condXml, radXml)
+
+        ## The space node is a shared boundary, not split.
+        nodes = list(model.mNodeNames)
+        self.mBoundaryNode = None
+        if nodes and model.mCapacitance[nodes[-1]] <= 0.0:
+            self.mBoundaryNode = nodes.pop()
+
+        couplings = model.getCouplings()
+        adjacency = {}
+        for node in nodes:
+            adjacency[node] = dict((n, g) for (n, g) in couplings.get(node, {}).iteritems()
+                                   if n != self.mBoundaryNode and n in model.mCapacitance)
+
+        ## Split, and order each sub-network's nodes as in the node-file.
+        parts = self.partition(nodes, min(self.mNumParts, max(len(nodes), 1)), adjacency)
+        self.mNodePart = {}
+        for (i, part) in enumerate(parts):
+            for node in part:
+                self.mNodePart[node] = i
+        self.mParts = [[] for part in parts]
+        for node in nodes:
+            self.mParts[self.mNodePart[node]].append(node)
+
+        self.findInterface(model, adjacency)
+        self.printReport()
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder after execute(). Writes the proposed
+    ## sub-networks and interface couplings to an advisory xml report file, which is not read by
+    ## any generator stage.
+    ## @param[in]: file               path and name of the report file
+    ## @param[in]: callingScript      name of the top-level script, for the file header
+    ## @param[in]: registeredNodes    collection of the nodes in the Thermal Aspect Registry
+    def writeReport(self, file, callingScript, registeredNodes):
+        registered = set(registeredNodes)
+        root = self.mParser.newElement("list")
+        for (i, part) in enumerate(self.mParts):
+            subNetwork = self.mParser.newElement("subNetwork", root)
+            self.mParser.newElement("index", subNetwork).text = str(i)
+            for node in part:
+                attr = None
+                if node in registered:
+                    attr = {"isRegistered": "true"}
+                self.mParser.newElement("node", subNetwork, attr).text = node
+        for (type, name, n0, n1, g) in self.mInterfaceLinks:
+            interface = self.mParser.newElement("interface", root)
+            self.mParser.newElement("type", interface).text = type
+            self.mParser.newElement("name", interface).text = name
+            self.mParser.newElement("node0", interface).text = n0
+            self.mParser.newElement("subNetwork0", interface).text = str(self.mNodePart[n0])
+            self.mParser.newElement("node1", interface).text = n1
+            self.mParser.newElement("subNetwork1", interface).text = str(self.mNodePart[n1])
+            self.mParser.newElement("conductance", interface, {"units": "W/K"}).text = \
+                self.mParser.roundValue(g, 6)
+        ThermPrinter().printThermXml(root, file, callingScript)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Recursively bisects the nodes into the given number of
+    ## sub-networks.
+    ## @param[in]: nodes       list of node names to split
+    ## @param[in]: numParts    number of sub-networks to split them into
+    ## @param[in]: adjacency   dictionary with key = node name, value = dictionary with key =
+    ##                         neighbor node name, value = conductance (W/K)
+    ## @return:    list of sub-networks, each a list of node names
+    def partition(self, nodes, numParts, adjacency):
+        if numParts <= 1:
+            return [nodes]
+        leftParts = numParts / 2
+        target = int(round(float(len(nodes)) * leftParts / numParts))
+        (left, right) = self.bisect(nodes, target, adjacency)
+        return self.partition(left, leftParts, adjacency) + \
+               self.partition(right, numParts - leftParts, adjacency)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in partition(). Splits the nodes in two, with the target number of
+    ## nodes in the first half.
+    ## @param[in]: nodes       list of node names to split
+    ## @param[in]: target      number of nodes in the first half
+    ## @param[in]: adjacency   see partition()
+    ## @return:    tuple of the two halves, each a list of node names
+    def bisect(self, nodes, target, adjacency):
+        members = set(nodes)
+        order = self.peripheralOrder(nodes, adjacency, members)
+        rank = dict((node, i) for (i, node) in enumerate(order))
+
+        ## Grow the first half (side 0) from the peripheral node, adding the node most strongly
+        ## coupled to it. Disconnected nodes are taken in breadth-first order.
+        side = dict((node, 1) for node in nodes)
+        gain = {}
+        heap = []
+        count = 0
+        nextInOrder = 0
+        while count < target:
+            node = None
+            while heap:
+                (g, r, candidate) = heapq.heappop(heap)
+                if 1 == side[candidate] and -g == gain[candidate]:
+                    node = candidate
+                    break
+            while None == node:
+                if 1 == side[order[nextInOrder]]:
+                    node = order[nextInOrder]
+                nextInOrder = nextInOrder + 1
+            side[node] = 0
+            count = count + 1
+            for (neighbor, g) in adjacency[node].iteritems():
+                if neighbor in members and 1 == side[neighbor]:
+                    gain[neighbor] = gain.get(neighbor, 0.0) + g
+                    heapq.heappush(heap, (-gain[neighbor], rank[neighbor], neighbor))
+
+        self.refine(nodes, side, target, adjacency, members, rank)
+        return ([n for n in nodes if 0 == side[n]], [n for n in nodes if 1 == side[n]])
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in bisect(). Orders the nodes breadth-first from a peripheral node,
+    ## found as the last node reached by a breadth-first search from the first node. Nodes not
+    ## connected to it follow, by component.
+    ## @param[in]: nodes       list of node names
+    ## @param[in]: adjacency   see partition()
+    ## @param[in]: members     set of the node names
+    ## @return:    list of node names in breadth-first order
+    def peripheralOrder(self, nodes, adjacency, members):
+        if not nodes:
+            return []
+        start = self.breadthFirst([nodes[0]], nodes, adjacency, members)[-1]
+        return self.breadthFirst([start], nodes, adjacency, members)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in peripheralOrder(). Breadth-first search from the start nodes,
+    ## continuing from the next unreached node whenever a component is finished.
+    ## @param[in]: start       list of start node names
+    ## @param[in]: nodes       list of node names
+    ## @param[in]: adjacency   see partition()
+    ## @param[in]: members     set of the node names
+    ## @return:    list of node names in breadth-first order
+    def breadthFirst(self, start, nodes, adjacency, members):
+        order = []
+        reached = set(start)
+        queue = list(start)
+        remaining = iter(nodes)
+        while len(order) < len(nodes):
+            if not queue:
+                for node in remaining:
+                    if node not in reached:
+                        reached.add(node)
+                        queue.append(node)
+                        break
+            node = queue.pop(0)
+            order.append(node)
+            for neighbor in sorted(adjacency[node]):
+                if neighbor in members and neighbor not in reached:
+                    reached.add(neighbor)
+                    queue.append(neighbor)
+        return order
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in bisect(). Fiduccia-Mattheyses refinement: each pass moves every
+    ## node across once, best gain first, as long as the halves stay balanced, then keeps the
+    ## balanced sequence of moves that reduced the cut conductance the most.
+    ## @param[in]:     nodes       list of node names
+    ## @param[in,out]: side        dictionary with key = node name, value = 0 or 1
+    ## @param[in]:     target      number of nodes in side 0
+    ## @param[in]:     adjacency   see partition()
+    ## @param[in]:     members     set of the node names
+    ## @param[in]:     rank        dictionary with key = node name, value = tie-breaking order
+    def refine(self, nodes, side, target, adjacency, members, rank):
+        ## Moves may pass through one node of extra imbalance, but only balanced splits are kept.
+        tolerance = int(self.mImbalance * len(nodes))
+        moveTolerance = max(1, tolerance)
+        for i in range(self.mMaxPasses):
+            ## Gain of moving each node: its external minus its internal conductance.
+            gain = {}
+            heaps = [[], []]
+            for node in nodes:
+                g = 0.0
+                for (neighbor, c) in adjacency[node].iteritems():
+                    if neighbor in members:
+                        g = g + (c if side[neighbor] != side[node] else -c)
+                gain[node] = g
+                heaps[side[node]].append((-g, rank[node], node))
+            for heap in heaps:
+                heapq.heapify(heap)
+
+            size0 = len([n for n in nodes if 0 == side[n]])
+            locked = set()
+            moves = []
+            cumulative = 0.0
+            best = 0.0
+            bestCount = 0
+            while True:
+                ## Best valid move from each side that keeps the halves balanced.
+                candidates = []
+                for s in (0, 1):
+                    newSize0 = size0 - 1 if 0 == s else size0 + 1
+                    if abs(newSize0 - target) > moveTolerance:
+                        continue
+                    heap = heaps[s]
+                    while heap and (heap[0][2] in locked or side[heap[0][2]] != s or
+                                    -heap[0][0] != gain[heap[0][2]]):
+                        heapq.heappop(heap)
+                    if heap:
+                        candidates.append(heap[0])
+                if not candidates:
+                    break
+                (g, r, node) = min(candidates)
+                heapq.heappop(heaps[side[node]])
+
+                ## Move the node and update its neighbors' gains.
+                oldSide = side[node]
+                side[node] = 1 - oldSide
+                size0 = size0 + (1 if 1 == oldSide else -1)
+                locked.add(node)
+                moves.append(node)
+                cumulative = cumulative + gain[node]
+                if cumulative > best + 1.0e-12 * (1.0 + abs(best)) and \
+                   abs(size0 - target) <= tolerance:
+                    best = cumulative
+                    bestCount = len(moves)
+                for (neighbor, c) in adjacency[node].iteritems():
+                    if neighbor not in members or neighbor in locked:
+                        continue
+                    if side[neighbor] == oldSide:
+                        gain[neighbor] = gain[neighbor] + 2.0 * c
+                    else:
+                        gain[neighbor] = gain[neighbor] - 2.0 * c
+                    heapq.heappush(heaps[side[neighbor]],
+                                   (-gain[neighbor], rank[neighbor], neighbor))
+
+            ## Undo the moves after the best point.
+            for node in moves[bestCount:]:
+                side[node] = 1 - side[node]
+            if 0 == bestCount:
+                break
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Finds the interface couplings, the cut conductance and
+    ## the coupling error measures.
+    ## @param[in]: model       ThermNetworkModel of the network
+    ## @param[in]: adjacency   see partition()
+    def findInterface(self, model, adjacency):
+        self.mInterfaceLinks = []
+        self.mCutConductance = 0.0
+        self.mTotalConductance = 0.0
+        cutByNode = {}
+        for (type, links) in [("conduction", model.mConductions), ("radiation", model.mRadiations)]:
+            prefix = {"conduction": "cond", "radiation": "rad"}[type]
+            for link in links:
+                (element, n0, n1, g) = (link[0], link[1], link[2], link[-1])
+                if n0 not in self.mNodePart or n1 not in self.mNodePart or n0 == n1:
+                    continue
+                self.mTotalConductance = self.mTotalConductance + g
+                if self.mNodePart[n0] == self.mNodePart[n1]:
+                    continue
+                name = "%s %s to %s" % (prefix, n0, n1)
+                names = self.mParser.getElements(element, "name")
+                if names and names[0].text:
+                    name = names[0].text
+                self.mInterfaceLinks.append([type, name, n0, n1, g])
+                self.mCutConductance = self.mCutConductance + g
+                for node in (n0, n1):
+                    cutByNode[node] = cutByNode.get(node, 0.0) + g
+
+        self.mMaxInterfaceFraction = 0.0
+        self.mMaxInterfaceFractionNode = None
+        self.mMinInterfaceTimeConstant = None
+        self.mMinInterfaceTimeConstantNode = None
+        for node in sorted(cutByNode):
+            total = sum(adjacency[node].values())
+            if total > 0.0 and cutByNode[node] / total > self.mMaxInterfaceFraction:
+                self.mMaxInterfaceFraction = cutByNode[node] / total
+                self.mMaxInterfaceFractionNode = node
+            cap = model.mCapacitance[node]
+            if cap > 0.0 and cutByNode[node] > 0.0:
+                tau = cap / cutByNode[node]
+                if None == self.mMinInterfaceTimeConstant or tau < self.mMinInterfaceTimeConstant:
+                    self.mMinInterfaceTimeConstant = tau
+                    self.mMinInterfaceTimeConstantNode = node
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Prints the sub-network sizes and interface summary.
+    def printReport(self):
+        if not self.mNodePart:
+            return
+        sizes = "/".join([str(len(part)) for part in self.mParts])
+        fraction = 0.0
+        if self.mTotalConductance > 0.0:
+            fraction = self.mCutConductance / self.mTotalConductance
+        print "     partition: %i sub-networks of %s nodes, %i interface links," % \
+              (len(self.mParts), sizes, len(self.mInterfaceLinks)),
+        print "cut %.4g W/K (%.2f%% of total)." % (self.mCutConductance, 100.0 * fraction)
+        if None != self.mMaxInterfaceFractionNode:
+            print "     partition: max %.2f%% of a node's conductance on the interface (%s)," % \
+                  (100.0 * self.mMaxInterfaceFraction, self.mMaxInterfaceFractionNode),
+            if None == self.mMinInterfaceTimeConstantNode:
+                print "no capacitive interface nodes."
+            else:
+                print "min interface tau %.4g s (%s)." % (self.mMinInterfaceTimeConstant,
+                                                          self.mMinInterfaceTimeConstantNode)
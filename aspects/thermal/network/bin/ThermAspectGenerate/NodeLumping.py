@@ -0,0 +1,294 @@
+####################################################################################################
+## @copyright Copyright 2019 United States Government as represented by the Administrator of the
+##            National Aeronautics and Space Administration.  All Rights Reserved.
+##
+## created: Oct 2026
+####################################################################################################
+## Include all necessary classes.
+import math
+from ThermSupport import ThermError
+from XmlParsing import XmlParser
+from ThermNetworkModeling import ThermNetworkModel
+
+#===================================================================================================
+# NodeLumper
+#===================================================================================================
+## @brief:
+## This class is an optional model-order reduction stage of the IndivNetworkBuilder. Generated
+## thermal networks often include tiny-capacitance nodes tied to a neighbor by a very high
+## conductance. These nodes add matrix size and stiffness but no fidelity, since they just follow
+## their neighbor's temperature.
+##
+## A conduction coupling between two nodes is considered strong when:
+## - the RC time constant of the smaller-capacitance node through the coupling,
+##   C_small / G_coupling, is no greater than the configured maximum time constant, and
+## - the coupling carries at least the configured fraction of all the conductance attached to the
+##   smaller-capacitance node (conduction plus linearized radiation).
+## Strongly coupled nodes are gathered into clusters, strongest couplings first, and each cluster is
+## merged into one surviving node. The survivor receives the cluster's total mass and capacitance,
+## and the capacitance-weighted average initial temperature, so mass and energy are conserved.
+## Conduction, radiation and potential references to the merged nodes are rewritten to the
+## survivor, and links internal to a cluster are removed.
+##
+## Registry nodes are enumerated and referenced by the icd, and source nodes are referenced by
+## name in the heater and panel files, so these nodes are protected: they are never merged away,
+## and a cluster never contains more than one of them. The protected node of a cluster is its
+## survivor, so icd, enumeration and source references stay valid.
+##
+## The frequency-response error of each merged node is estimated as the magnitude error of the
+## first-order lag between it and its partner, 1 - 1/sqrt(1 + (2*pi*f*tau)^2), at the configured
+## evaluation frequency f. The steady-state response is unchanged.
+class NodeLumper():
+    ## @brief:
+    ## Default constructs the object with default, uninitialized members.
+    def __init__(self):
+
+        ## Initialization flag.
+        self.mInitialized = False
+
+        ## An XmlParser() object for setting data in xml elements.
+        self.mParser = XmlParser()
+
+        ## Name (abbreviation) of network being reduced, for reporting.
+        self.mNetwork = "[mNetwork not initialized]"
+
+        ## Maximum RC time constant (s) of a node through a coupling for the coupling to be strong.
+        self.mMaxTimeConstant = 0.0
+        ## Minimum fraction (0-1) of a node's total conductance that a strong coupling must carry.
+        self.mCouplingRatio = 0.9
+        ## Frequency (Hz) at which the frequency-response error is evaluated.
+        self.mEvalFrequency = 0.01
+
+        ## Number of nodes before reduction.
+        self.mOrigCount = 0
+        ## Number of nodes merged into survivors.
+        self.mRemovedCount = 0
+        ## Largest estimated frequency-response error (0-1), and the merged node it occurs at.
+        self.mMaxResponseError = 0.0
+        self.mMaxResponseErrorNode = None
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder. Initializes the object.
+    ## @param[in]: network           name (abbreviation) of the network, for reporting
+    ## @param[in]: maxTimeConstant   maximum node time constant (s) through a strong coupling
+    ## @param[in]: couplingRatio     minimum fraction (0-1] of a node's conductance in a strong
+    ##                               coupling
+    ## @param[in]: evalFrequency     frequency (Hz) to evaluate the frequency-response error at
+    def initialize(self, network, maxTimeConstant, couplingRatio=0.9, evalFrequency=0.01):
+        try:
+            maxTimeConstant = float(maxTimeConstant)
+            couplingRatio = float(couplingRatio)
+            evalFrequency = float(evalFrequency)
+        except (TypeError, ValueError), e:
+            raise ThermError("Invalid node lumping settings (%s)." % network)
+
+        if maxTimeConstant < 0.0:
+            raise ThermError("Node lumping time constant must be >= 0 (%s)." % network)
+        if couplingRatio <= 0.0 or couplingRatio > 1.0:
+            raise ThermError("Node lumping coupling ratio must be in (0, 1] (%s)." % network)
+        if evalFrequency < 0.0:
+            raise ThermError("Node lumping frequency must be >= 0 (%s)." % network)
+
+        self.mNetwork = network
+        self.mMaxTimeConstant = maxTimeConstant
+        self.mCouplingRatio = couplingRatio
+        self.mEvalFrequency = evalFrequency
+
+        ## Set initialization flag.
+        self.mInitialized = True
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder after all links have been registered.
+    ## Merges the strongly coupled nodes, modifying the given xml-trees in place.
+    ## @param[in]: nodeXml          xml element containing the <node> elements
+    ## @param[in]: condXml          xml element containing the <conduction> elements
+    ## @param[in]: radXml           xml element containing the <radiation> elements
+    ## @param[in]: etcXml           xml element containing the <potential> elements
+    ## @param[in]: protectedNodes   collection of node names that must not be merged away
+    ## @param[in]: numProtectedRad  number of leading <radiation> elements (from the registry) whose
+    ##                              nodes are also protected
+    ## @return:    dictionary with key = merged node name, value = surviving node name
+    def execute(self, nodeXml, condXml, radXml, etcXml, protectedNodes, numProtectedRad=0):
+
+        if False == self.mInitialized:
+            raise ThermError("NodeLumper not initialized.")
+
+        model = ThermNetworkModel()
+        model.load(self.mNetwork, nodeXml, condXml, radXml)
+
+        ## Registry radiation links are enumerated, so they must never become internal to a cluster.
+        protected = set(protectedNodes)
+        for link in model.mRadiations[:numProtectedRad]:
+            protected.update([link[1], link[2]])
+
+        ## Sum parallel conductions between each pair of nodes.
+        pairs = {}
+        for (element, n0, n1, g) in model.mConductions:
+            if n0 != n1 and n0 in model.mCapacitance and n1 in model.mCapacitance:
+                key = tuple(sorted([n0, n1]))
+                pairs[key] = pairs.get(key, 0.0) + g
+
+        ## Gather the clusters, strongest couplings first. Each cluster is a set with its root node.
+        totals = model.getTotalConductances()
+        parent = dict((node, node) for node in model.mNodeNames)
+        hasProtected = dict((node, node in protected) for node in model.mNodeNames)
+        mergedTau = {}
+        for (key, g) in sorted(pairs.iteritems(), key=lambda p: (-p[1], p[0])):
+            if g <= 0.0:
+                continue
+            small = min(key, key=lambda n: (model.mCapacitance[n], n in protected))
+            tau = model.mCapacitance[small] / g
+            if tau > self.mMaxTimeConstant or g < self.mCouplingRatio * totals[small]:
+                continue
+            root0 = self.findRoot(parent, key[0])
+            root1 = self.findRoot(parent, key[1])
+            if root0 == root1 or (hasProtected[root0] and hasProtected[root1]):
+                continue
+            parent[root1] = root0
+            hasProtected[root0] = hasProtected[root0] or hasProtected[root1]
+            for node in key:
+                mergedTau.setdefault(node, tau)
+
+        clusters = {}
+        for node in model.mNodeNames:
+            clusters.setdefault(self.findRoot(parent, node), []).append(node)
+
+        ## Pick each cluster's survivor and map the merged nodes to it.
+        lumped = {}
+        for members in clusters.itervalues():
+            if len(members) < 2:
+                continue
+            survivors = [n for n in members if n in protected]
+            if not survivors:
+                survivors = sorted(members, key=lambda n: -model.mCapacitance[n])
+            survivor = survivors[0]
+            for node in members:
+                if node != survivor:
+                    lumped[node] = survivor
+            self.mergeNodes(model, survivor, [n for n in members if n != survivor])
+
+        self.rewriteLinks(condXml, "conduction", lumped)
+        self.rewriteLinks(radXml, "radiation", lumped)
+        self.rewriteNodeRefs(etcXml, "potential", lumped)
+
+        ## Remove the merged nodes and re-enumerate the nodes that remain.
+        for node in lumped:
+            nodeXml.remove(model.mNodeElements[node])
+        self.renumber(nodeXml, "node")
+
+        ## Estimate the frequency-response error of each merged node.
+        self.mOrigCount = len(model.mNodeNames)
+        self.mRemovedCount = len(lumped)
+        self.mMaxResponseError = 0.0
+        self.mMaxResponseErrorNode = None
+        for node in sorted(lumped):
+            wt = 2.0 * math.pi * self.mEvalFrequency * mergedTau.get(node, self.mMaxTimeConstant)
+            error = 1.0 - 1.0 / math.sqrt(1.0 + wt * wt)
+            if error > self.mMaxResponseError or None == self.mMaxResponseErrorNode:
+                self.mMaxResponseError = error
+                self.mMaxResponseErrorNode = node
+
+        self.printReport()
+        return lumped
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Finds the root node of a node's cluster.
+    ## @param[in]: parent   dictionary with key = node name, value = parent node name in the cluster
+    ## @param[in]: node     node name
+    ## @return:    name of the cluster's root node
+    def findRoot(self, parent, node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Conserves mass and capacitance by adding the merged
+    ## nodes' values to the survivor's <node> element. The survivor's initial temperature becomes
+    ## the capacitance-weighted average, which conserves the cluster's initial energy.
+    ## @param[in]: model      ThermNetworkModel of the network before reduction
+    ## @param[in]: survivor   name of the surviving node
+    ## @param[in]: merged     list of names of the nodes merged into the survivor
+    def mergeNodes(self, model, survivor, merged):
+        members = [survivor] + merged
+        mass = sum([model.mMass[n] for n in members])
+        cap = sum([model.mCapacitance[n] for n in members])
+        temp = model.mTemperature[survivor]
+        if cap > 0.0:
+            temp = sum([model.mCapacitance[n] * model.mTemperature[n] for n in members]) / cap
+
+        element = model.mNodeElements[survivor]
+        for (tag, value) in [("mass", mass), ("temperature", temp), ("capacitance", cap)]:
+            children = self.mParser.getElements(element, tag)
+            if children:
+                children[0].text = self.mParser.roundValue(value, 2)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Rewrites the node0 and node1 references of the links to
+    ## the surviving nodes, removes links that became internal to a cluster, and re-enumerates.
+    ## @param[in]: linkXml   xml element containing the link elements
+    ## @param[in]: tag       tag of the link elements
+    ## @param[in]: lumped    dictionary with key = merged node name, value = surviving node name
+    def rewriteLinks(self, linkXml, tag, lumped):
+        for element in list(linkXml):
+            if tag != element.tag:
+                continue
+            self.rewriteNodeRefs(element, None, lumped)
+            n0 = self.mParser.getChildText(element, "node0", self.mNetwork)
+            n1 = self.mParser.getChildText(element, "node1", self.mNetwork)
+            if n0 == n1:
+                linkXml.remove(element)
+        self.renumber(linkXml, tag)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method. Rewrites the <node>, <node0> and <node1> references of the given elements
+    ## to the surviving nodes.
+    ## @param[in]: parentXml   xml element containing the elements to rewrite, or the element
+    ##                         itself if tag is None
+    ## @param[in]: tag         tag of the elements to rewrite, or None
+    ## @param[in]: lumped      dictionary with key = merged node name, value = surviving node name
+    def rewriteNodeRefs(self, parentXml, tag, lumped):
+        if None == parentXml:
+            return
+        elements = [parentXml]
+        if None != tag:
+            elements = [e for e in parentXml if tag == e.tag]
+        for element in elements:
+            for ref in element:
+                if ref.tag in ("node", "node0", "node1") and ref.text in lumped:
+                    ref.text = lumped[ref.text]
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method. Renumbers the <enum> children of the given elements sequentially.
+    ## @param[in]: parentXml   xml element containing the elements to renumber
+    ## @param[in]: tag         tag of the elements to renumber
+    def renumber(self, parentXml, tag):
+        counter = 0
+        for element in parentXml:
+            if tag != element.tag:
+                continue
+            enums = self.mParser.getElements(element, "enum")
+            if enums:
+                enums[0].text = str(counter)
+            counter = counter + 1
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Prints the node-count reduction and error estimate.
+    def printReport(self):
+        if 0 == self.mOrigCount:
+            return
+        print "     node lumping: %i of %i nodes merged (%.1f%%)," % \
+              (self.mRemovedCount, self.mOrigCount, 100.0 * self.mRemovedCount / self.mOrigCount),
+        if None == self.mMaxResponseErrorNode:
+            print "max frequency-response error 0.00%% at %g Hz." % self.mEvalFrequency
+        else:
+            print "max frequency-response error %.2f%% at %g Hz (%s)." % \
+                  (100.0 * self.mMaxResponseError, self.mEvalFrequency, self.mMaxResponseErrorNode)
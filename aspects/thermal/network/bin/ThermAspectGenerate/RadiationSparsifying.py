@@ -0,0 +1,289 @@
+####################################################################################################
+## @copyright Copyright 2019 United States Government as represented by the Administrator of the
+##            National Aeronautics and Space Administration.  All Rights Reserved.
+##
+## created: Oct 2026
+####################################################################################################
+## Include all necessary classes.
+from ThermSupport import ThermError
+from XmlParsing import XmlParser, TagNotFound
+
+#===================================================================================================
+# RadiationSparsifier
+#===================================================================================================
+## @brief:
+## This class is an optional stage of the IndivNetworkBuilder. Thermal Desktop radiation exports
+## are nearly dense, and every coupling becomes a radiation link that is solved every pass. This
+## class ranks each node's radiation couplings by their linearized conductance at the nodes'
+## initial temperatures, and drops the weakest Thermal Desktop couplings that, summed together,
+## carry less than a configured fraction (the energy-error budget) of the node's total radiation
+## conductance. A coupling is only dropped if it is negligible to both of its nodes.
+##
+## The coefficient of a dropped coupling is not thrown away. The whole coefficient is added to the
+## surviving coupling of each of its nodes to the space node (the last node, with zero
+## capacitance), so both nodes keep their total radiating coefficient. The space node is a fixed
+## boundary, so the area it gains doesn't upset any node's energy balance. A coupling is only
+## dropped if each of its nodes, other than the space node, has such a coupling to lump onto. The
+## change in each node's heat flow, from radiating the dropped area to space instead of to the
+## other node, is counted in the temperature error estimate.
+##
+## Radiation links defined in the Thermal Aspect Registry are enumerated and may be on the icd, so
+## they are never dropped or modified.
+class RadiationSparsifier():
+    ## @brief:
+    ## Default constructs the object with default, uninitialized members.
+    def __init__(self):
+
+        ## Initialization flag.
+        self.mInitialized = False
+
+        ## An XmlParser() object for getting data from xml elements.
+        self.mParser = XmlParser()
+
+        ## Name (abbreviation) of network being sparsified, for reporting.
+        self.mNetwork = "[mNetwork not initialized]"
+
+        ## Fraction (0-1) of each node's total radiation conductance that may be dropped.
+        self.mBudget = 0.0
+
+        ## Temperature (K) assumed for nodes that have no initial temperature in the node data.
+        self.mDefaultTemp = 296.0
+
+        ## Stefan-Boltzmann constant (W/m2/K4).
+        self.mSigma = 5.670373e-8
+
+        ## Number of radiation links before sparsification.
+        self.mOrigCount = 0
+        ## Number of radiation links removed.
+        self.mRemovedCount = 0
+        ## Largest fraction of any node's total radiation conductance that was removed.
+        self.mMaxRemovedFraction = 0.0
+        ## Largest estimated node temperature error (K), and the node it occurs at.
+        self.mMaxTempError = 0.0
+        self.mMaxTempErrorNode = None
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder. Initializes the object.
+    ## @param[in]: network       name (abbreviation) of the network, for reporting
+    ## @param[in]: budget        fraction (0-1) of each node's radiation conductance that may be
+    ##                           dropped
+    ## @param[in]: defaultTemp   temperature (K) to assume for nodes without an initial temperature
+    def initialize(self, network, budget, defaultTemp=296.0):
+        try:
+            budget = float(budget)
+            defaultTemp = float(defaultTemp)
+        except (TypeError, ValueError), e:
+            raise ThermError("Invalid radiation sparsification settings (%s)." % network)
+
+        if budget < 0.0 or budget >= 1.0:
+            raise ThermError("Radiation sparsification budget must be in [0, 1) (%s)." % network)
+        if defaultTemp <= 0.0:
+            raise ThermError("Radiation sparsification temperature must be > 0 (%s)." % network)
+
+        self.mNetwork = network
+        self.mBudget = budget
+        self.mDefaultTemp = defaultTemp
+
+        ## Set initialization flag.
+        self.mInitialized = True
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder after the Thermal Desktop data has been
+    ## appended. Removes negligible radiation links from the radXml and lumps their coefficients
+    ## onto surviving links.
+    ## @param[in]: radXml         xml element containing the <radiation> elements, modified in place
+    ## @param[in]: nodeXml        xml element containing the <node> elements
+    ## @param[in]: numProtected   number of leading <radiation> elements (from the registry) that
+    ##                            must not be dropped or modified
+    def execute(self, radXml, nodeXml, numProtected):
+
+        if False == self.mInitialized:
+            raise ThermError("RadiationSparsifier not initialized.")
+
+        temps = self.readNodeTemps(nodeXml)
+        sink = self.findSinkNode(nodeXml)
+
+        ## Build the list of links: [element, node0, node1, coefficient, conductance, protected].
+        links = []
+        for i, element in enumerate(radXml):
+            if "radiation" != element.tag:
+                continue
+            try:
+                n0 = self.mParser.getChildText(element, "node0", self.mNetwork)
+                n1 = self.mParser.getChildText(element, "node1", self.mNetwork)
+                coeff = float(self.mParser.getChildText(element, "coefficient", self.mNetwork))
+            except (TagNotFound, ValueError), e:
+                print e,
+                raise ThermError("Invalid radiation link in network (%s)." % self.mNetwork)
+            g = self.linearizedConductance(coeff, temps.get(n0, self.mDefaultTemp),
+                                                  temps.get(n1, self.mDefaultTemp))
+            links.append([element, n0, n1, coeff, g, i < numProtected])
+
+        self.mOrigCount = len(links)
+        self.mRemovedCount = 0
+
+        ## Total radiation conductance, and the links attached to each node.
+        totalG = {}
+        nodeLinks = {}
+        for link in links:
+            for node in (link[1], link[2]):
+                totalG[node] = totalG.get(node, 0.0) + link[4]
+                nodeLinks.setdefault(node, []).append(link)
+
+        ## Mark the links that are negligible to each node: the weakest links whose sum stays within
+        ## the budget of the node's total.
+        negligibleCount = {}
+        for node, attached in nodeLinks.iteritems():
+            allowed = self.mBudget * totalG[node]
+            cumulative = 0.0
+            for link in sorted(attached, key=lambda l: l[4]):
+                cumulative = cumulative + link[4]
+                if cumulative > allowed:
+                    break
+                negligibleCount[id(link)] = negligibleCount.get(id(link), 0) + 1
+
+        ## Drop the links negligible to both nodes, lumping their coefficients.
+        removedG = {}
+        tempErrorQ = {}
+        removed = set()
+        for link in sorted(links, key=lambda l: l[4]):
+            if link[5] or 2 != negligibleCount.get(id(link), 0) or link[1] == link[2]:
+                continue
+
+            targets = self.findLumpTargets(link, nodeLinks, removed, sink)
+            if None == targets:
+                continue
+            removed.add(id(link))
+
+            ## Add the whole coefficient to each node's coupling to space. The misrouted heat flow
+            ## at the representative temperatures, for error estimation, is the difference between
+            ## the node's flow to space through the added conductance and its dropped flow.
+            sinkTemp = temps.get(sink, self.mDefaultTemp)
+            for (node, target) in targets:
+                other = link[2] if node == link[1] else link[1]
+                nodeTemp = temps.get(node, self.mDefaultTemp)
+                addedG = self.linearizedConductance(link[3], nodeTemp, sinkTemp)
+                target[3] = target[3] + link[3]
+                target[4] = target[4] + addedG
+                q = addedG * (nodeTemp - sinkTemp) - \
+                    link[4] * (nodeTemp - temps.get(other, self.mDefaultTemp))
+                removedG[node] = removedG.get(node, 0.0) + link[4]
+                tempErrorQ[node] = tempErrorQ.get(node, 0.0) + abs(q)
+
+        ## Write the lumped coefficients back and remove the dropped elements.
+        for link in links:
+            if id(link) in removed:
+                radXml.remove(link[0])
+                self.mRemovedCount = self.mRemovedCount + 1
+            elif not link[5]:
+                coeffElem = self.mParser.getElements(link[0], "coefficient")[0]
+                if float(coeffElem.text) != link[3]:
+                    coeffElem.text = self.mParser.roundValue(link[3], 6)
+
+        ## Estimate the node temperature errors as the misrouted heat flow over the node's total
+        ## radiation conductance.
+        self.mMaxRemovedFraction = 0.0
+        self.mMaxTempError = 0.0
+        self.mMaxTempErrorNode = None
+        for node in removedG:
+            if totalG[node] <= 0.0:
+                continue
+            self.mMaxRemovedFraction = max(self.mMaxRemovedFraction, removedG[node] / totalG[node])
+            tempError = tempErrorQ[node] / totalG[node]
+            if tempError > self.mMaxTempError or None == self.mMaxTempErrorNode:
+                self.mMaxTempError = tempError
+                self.mMaxTempErrorNode = node
+
+        self.printReport()
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Builds a dictionary of the node initial temperatures.
+    ## @param[in]: nodeXml   xml element containing the <node> elements
+    ## @return:    dictionary with key = node name, value = initial temperature (K)
+    def readNodeTemps(self, nodeXml):
+        temps = {}
+        for element in nodeXml:
+            if "node" != element.tag:
+                continue
+            try:
+                name = self.mParser.getChildText(element, "name", self.mNetwork)
+                temps[name] = float(self.mParser.getChildText(element, "temperature", name))
+            except (ThermError, TagNotFound, ValueError), e:
+                continue
+        return temps
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Finds the space node, which is the last node if it has
+    ## zero capacitance, the same as the other network analysis stages.
+    ## @param[in]: nodeXml   xml element containing the <node> elements
+    ## @return:    name of the space node, or None if there is none
+    def findSinkNode(self, nodeXml):
+        nodes = [element for element in nodeXml if "node" == element.tag]
+        if not nodes:
+            return None
+        try:
+            name = self.mParser.getChildText(nodes[-1], "name", self.mNetwork)
+        except (ThermError, TagNotFound), e:
+            return None
+        try:
+            capacitance = float(self.mParser.getChildText(nodes[-1], "capacitance", name))
+        except (ThermError, TagNotFound, ValueError), e:
+            capacitance = 0.0
+        if capacitance > 0.0:
+            return None
+        return name
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Returns the linearized conductance of a radiation link,
+    ## q = sigma * coeff * (T0^4 - T1^4) = G * (T0 - T1).
+    ## @param[in]: coeff   radiation coefficient (m2)
+    ## @param[in]: t0      representative temperature (K) of node0
+    ## @param[in]: t1      representative temperature (K) of node1
+    ## @return:    linearized conductance (W/K)
+    def linearizedConductance(self, coeff, t0, t1):
+        return self.mSigma * abs(coeff) * (t0*t0 + t1*t1) * (t0 + t1)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Finds the strongest surviving, non-registry link to the
+    ## space node of each of the dropped link's nodes, other than the space node itself.
+    ## @param[in]: link        link to be dropped
+    ## @param[in]: nodeLinks   dictionary of the links attached to each node
+    ## @param[in]: removed     set of ids of links already dropped
+    ## @param[in]: sink        name of the space node, or None
+    ## @return:    list of the [node, target link] of each of the nodes, or None if there is no
+    ##             space node or any of the nodes has no valid target
+    def findLumpTargets(self, link, nodeLinks, removed, sink):
+        if None == sink:
+            return None
+        targets = []
+        for node in (link[1], link[2]):
+            if node == sink:
+                continue
+            candidates = [l for l in nodeLinks[node]
+                          if l is not link and not l[5] and id(l) not in removed and
+                             sink in (l[1], l[2]) and l[1] != l[2]]
+            if not candidates:
+                return None
+            targets.append([node, max(candidates, key=lambda l: l[4])])
+        return targets
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Prints the link-count reduction and error estimate.
+    def printReport(self):
+        if 0 == self.mOrigCount:
+            return
+        print "     radiation sparsification: %i of %i links removed (%.1f%%)," % \
+              (self.mRemovedCount, self.mOrigCount, 100.0 * self.mRemovedCount / self.mOrigCount),
+        print "max %.2f%% of a node's conductance," % (100.0 * self.mMaxRemovedFraction),
+        if None == self.mMaxTempErrorNode:
+            print "est. max temperature error 0.000 K."
+        else:
+            print "est. max temperature error %.3f K (%s)." % (self.mMaxTempError,
+                                                                self.mMaxTempErrorNode)
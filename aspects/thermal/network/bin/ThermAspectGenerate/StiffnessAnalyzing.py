@@ -0,0 +1,248 @@
+####################################################################################################
+## @copyright Copyright 2019 United States Government as represented by the Administrator of the
+##            National Aeronautics and Space Administration.  All Rights Reserved.
+##
+## created: Oct 2026
+####################################################################################################
+## Include all necessary classes.
+from ThermSupport import ThermError
+from ThermNetworkModeling import ThermNetworkModel
+
+## NumPy and SciPy are only needed for the eigenvalue analysis. Without them, the eigenvalues are
+## skipped and only the node time constants are analyzed.
+try:
+    import numpy
+    import scipy.sparse
+    import scipy.sparse.linalg
+except ImportError:
+    numpy = None
+
+#===================================================================================================
+# StiffnessAnalyzer
+#===================================================================================================
+## @brief:
+## This class is an optional analysis stage of the IndivNetworkBuilder. It computes each node's RC
+## time constant, tau = C / G, where G is all the conductance attached to the node (conduction,
+## linearized radiation and potential links), and flags the nodes whose time constant is shorter
+## than the step of the configured thermal rate. Each node is grouped at the slowest candidate rate
+## whose step is no longer than its time constant, and the network's suggested rate is that of
+## its fastest group. This tells whether a network needs a higher rate, or could run slower.
+##
+## If NumPy and SciPy are available, the conductance matrix is assembled as a sparse matrix and the
+## extreme eigenvalues of C^-1 G are found. Zero-capacitance nodes are algebraic, so they are
+## eliminated first (Kron reduction). The ratio of the extreme eigenvalues is the network's
+## stiffness ratio.
+class StiffnessAnalyzer():
+    ## @brief:
+    ## Default constructs the object with default, uninitialized members.
+    def __init__(self):
+
+        ## Initialization flag.
+        self.mInitialized = False
+
+        ## Name (abbreviation) of network being analyzed, for reporting.
+        self.mNetwork = "[mNetwork not initialized]"
+
+        ## Configured thermal rate (Hz) of the network.
+        self.mRate = 0.0
+        ## Candidate rates (Hz) for the rate groups, in ascending order.
+        self.mCandidateRates = []
+        ## Networks with more capacitive nodes than this use sparse iterative eigenvalue solutions.
+        self.mDenseLimit = 1000
+
+        ## Dictionary with key = node name, value = time constant (s), or None if the node has no
+        ## conductance. Zero-capacitance nodes are not included.
+        self.mTimeConstants = {}
+        ## List of zero-capacitance (algebraic) nodes.
+        self.mAlgebraicNodes = []
+        ## List of nodes whose time constant is shorter than the configured rate's step.
+        self.mFastNodes = []
+        ## Shortest time constant (s), and the node it occurs at.
+        self.mMinTimeConstant = None
+        self.mMinTimeConstantNode = None
+        ## Dictionary with key = candidate rate (Hz), value = list of nodes grouped at that rate.
+        self.mRateGroups = {}
+        ## Suggested rate (Hz) of the network.
+        self.mSuggestedRate = None
+        ## Smallest and largest eigenvalues (1/s) of C^-1 G, or None if not found.
+        self.mMinEigenvalue = None
+        self.mMaxEigenvalue = None
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder. Initializes the object.
+    ## @param[in]: network          name (abbreviation) of the network, for reporting
+    ## @param[in]: rate             configured thermal rate (Hz) of the network
+    ## @param[in]: candidateRates   list of rates (Hz) that nodes and networks may be grouped at
+    def initialize(self, network, rate, candidateRates):
+        try:
+            rate = float(rate)
+            candidateRates = sorted([float(r) for r in candidateRates])
+        except (TypeError, ValueError), e:
+            raise ThermError("Invalid stiffness analysis settings (%s)." % network)
+
+        if rate <= 0.0:
+            raise ThermError("Stiffness analysis rate must be > 0 (%s)." % network)
+        if 0 == len(candidateRates) or candidateRates[0] <= 0.0:
+            raise ThermError("Stiffness analysis candidate rates must be > 0 (%s)." % network)
+
+        self.mNetwork = network
+        self.mRate = rate
+        self.mCandidateRates = candidateRates
+
+        ## Set initialization flag.
+        self.mInitialized = True
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function, called by the IndivNetworkBuilder after the network is complete. Analyzes
+    ## the network and prints a report.
+    ## @param[in]: nodeXml   xml element containing the <node> elements
+    ## @param[in]: condXml   xml element containing the <conduction> elements
+    ## @param[in]: radXml    xml element containing the <radiation> elements
+    ## @param[in]: etcXml    xml element containing the <potential> elements
+    def execute(self, nodeXml, condXml, radXml, etcXml):
+
+        if False == self.mInitialized:
+            raise ThermError("StiffnessAnalyzer not initialized.")
+
+        model = ThermNetworkModel()
+        model.load(self.mNetwork, nodeXml, condXml, radXml, etcXml)
+
+        self.analyzeTimeConstants(model)
+        self.analyzeEigenvalues(model)
+        self.printReport()
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Finds the node time constants, the fast nodes, and the
+    ## rate groups.
+    ## @param[in]: model   ThermNetworkModel of the network
+    def analyzeTimeConstants(self, model):
+        totals = model.getTotalConductances()
+        step = 1.0 / self.mRate
+
+        self.mTimeConstants = {}
+        self.mAlgebraicNodes = []
+        self.mFastNodes = []
+        self.mMinTimeConstant = None
+        self.mMinTimeConstantNode = None
+        self.mRateGroups = dict((r, []) for r in self.mCandidateRates)
+        self.mSuggestedRate = None
+
+        for node in model.mNodeNames:
+            cap = model.mCapacitance[node]
+            if cap <= 0.0:
+                self.mAlgebraicNodes.append(node)
+                continue
+
+            tau = None
+            if totals.get(node, 0.0) > 0.0:
+                tau = cap / totals[node]
+            self.mTimeConstants[node] = tau
+
+            if None != tau and (None == self.mMinTimeConstant or tau < self.mMinTimeConstant):
+                self.mMinTimeConstant = tau
+                self.mMinTimeConstantNode = node
+            if None != tau and tau < step:
+                self.mFastNodes.append(node)
+
+            ## Group the node at the slowest candidate rate whose step fits in its time constant.
+            group = self.mCandidateRates[-1]
+            for rate in self.mCandidateRates:
+                if None == tau or 1.0 / rate <= tau:
+                    group = rate
+                    break
+            self.mRateGroups[group].append(node)
+            self.mSuggestedRate = max(self.mSuggestedRate, group)
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Finds the extreme eigenvalues of C^-1 G, if NumPy and
+    ## SciPy are available.
+    ## @param[in]: model   ThermNetworkModel of the network
+    def analyzeEigenvalues(self, model):
+        self.mMinEigenvalue = None
+        self.mMaxEigenvalue = None
+        if None == numpy or 0 == len(self.mTimeConstants):
+            return
+
+        ## Assemble the sparse conductance matrix.
+        index = dict((node, i) for (i, node) in enumerate(model.mNodeNames))
+        rows = []
+        cols = []
+        vals = []
+        for (n0, neighbors) in model.getCouplings().iteritems():
+            if n0 not in index:
+                continue
+            for (n1, g) in neighbors.iteritems():
+                if n1 not in index:
+                    continue
+                rows.extend([index[n0], index[n0]])
+                cols.extend([index[n0], index[n1]])
+                vals.extend([g, -g])
+        for (node, g) in model.getGroundConductances().iteritems():
+            if node in index:
+                rows.append(index[node])
+                cols.append(index[node])
+                vals.append(g)
+        n = len(model.mNodeNames)
+        G = scipy.sparse.csr_matrix((vals, (rows, cols)), shape=(n, n))
+
+        ## Eliminate the algebraic nodes that have any conductance.
+        cap = numpy.array([model.mCapacitance[node] for node in model.mNodeNames])
+        c = numpy.nonzero(cap > 0.0)[0]
+        z = numpy.nonzero((cap <= 0.0) & (numpy.asarray(G.diagonal()) > 0.0))[0]
+        K = G[c, :][:, c]
+        try:
+            if len(z) > 0:
+                Gcz = G[c, :][:, z].tocsc()
+                Gzz = G[z, :][:, z].tocsc()
+                K = K - Gcz * scipy.sparse.linalg.spsolve(Gzz, Gcz.T.tocsc())
+            K = scipy.sparse.csr_matrix(K)
+
+            ## Symmetric form: C^-1/2 K C^-1/2 has the same eigenvalues as C^-1 K.
+            scale = scipy.sparse.diags(1.0 / numpy.sqrt(cap[c]))
+            A = scale * K * scale
+            if len(c) <= self.mDenseLimit:
+                eigs = numpy.linalg.eigvalsh(A.toarray())
+                self.mMinEigenvalue = float(eigs[0])
+                self.mMaxEigenvalue = float(eigs[-1])
+            else:
+                self.mMaxEigenvalue = float(scipy.sparse.linalg.eigsh(A, 1, which='LA',
+                                                  return_eigenvectors=False)[0])
+                self.mMinEigenvalue = float(scipy.sparse.linalg.eigsh(A, 1, which='SA',
+                                                  return_eigenvectors=False)[0])
+        except (RuntimeError, ValueError, numpy.linalg.LinAlgError,
+                scipy.sparse.linalg.ArpackNoConvergence), e:
+            print "     stiffness: eigenvalue analysis failed (%s): %s" % (self.mNetwork, e)
+            self.mMinEigenvalue = None
+            self.mMaxEigenvalue = None
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in execute(). Prints the time constant, rate and eigenvalue results.
+    def printReport(self):
+        if None == self.mMinTimeConstantNode:
+            print "     stiffness: no capacitive nodes with conductance."
+            return
+        print "     stiffness: min tau %.4g s (%s), %i of %i nodes faster than the %g Hz step." % \
+              (self.mMinTimeConstant, self.mMinTimeConstantNode, len(self.mFastNodes),
+               len(self.mTimeConstants), self.mRate)
+        groups = ["%g Hz: %i" % (r, len(self.mRateGroups[r]))
+                  for r in self.mCandidateRates if self.mRateGroups[r]]
+        print "     stiffness: rate groups {%s}," % ", ".join(groups),
+        if self.mSuggestedRate > self.mRate:
+            print "network needs %g Hz (configured %g Hz)." % (self.mSuggestedRate, self.mRate)
+        elif self.mSuggestedRate < self.mRate:
+            print "network could run at %g Hz (configured %g Hz)." % (self.mSuggestedRate, self.mRate)
+        else:
+            print "network rate %g Hz is suitable." % self.mRate
+        if None == numpy:
+            print "     stiffness: eigenvalues skipped, NumPy/SciPy not available."
+        elif None != self.mMaxEigenvalue:
+            ratio = "inf"
+            if self.mMinEigenvalue > 0.0:
+                ratio = "%.3g" % (self.mMaxEigenvalue / self.mMinEigenvalue)
+            print "     stiffness: eigenvalues [%.4g, %.4g] 1/s, stiffness ratio %s." % \
+                  (self.mMinEigenvalue, self.mMaxEigenvalue, ratio)
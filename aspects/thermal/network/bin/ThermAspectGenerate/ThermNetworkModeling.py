@@ -0,0 +1,182 @@
+####################################################################################################
+## @copyright Copyright 2019 United States Government as represented by the Administrator of the
+##            National Aeronautics and Space Administration.  All Rights Reserved.
+##
+## created: Oct 2026
+####################################################################################################
+## Include all necessary classes.
+from ThermSupport import ThermError
+from XmlParsing import XmlParser, TagNotFound
+
+#===================================================================================================
+# ThermNetworkModel
+#===================================================================================================
+## @brief:
+## This class is a lightweight, read-only model of a generated thermal network. It is loaded from
+## the node, conduction and radiation xml-trees that an IndivNetworkBuilder has built, and gives
+## the network analysis and reduction stages a common view of each node's capacitance, mass and
+## initial temperature, and of the conductance of every link. Radiation links are represented by
+## their conductance linearized about the nodes' initial temperatures. Potential links, which tie
+## a node to a fixed temperature, are the only conductance to ground.
+class ThermNetworkModel():
+    ## @brief:
+    ## Default constructs the object with an empty network.
+    def __init__(self):
+
+        ## An XmlParser() object for getting data from xml elements.
+        self.mParser = XmlParser()
+
+        ## Name (abbreviation) of network, for error reporting.
+        self.mNetwork = "[mNetwork not loaded]"
+
+        ## Stefan-Boltzmann constant (W/m2/K4).
+        self.mSigma = 5.670373e-8
+
+        ## Temperature (K) assumed for nodes that have no initial temperature in the node data.
+        self.mDefaultTemp = 296.0
+
+        ## List of node names, in the order of the node xml-tree.
+        self.mNodeNames = []
+        ## Dictionaries with key = node name, for the node <node> element, capacitance (J/K),
+        ## mass (kg) and initial temperature (K).
+        self.mNodeElements = {}
+        self.mCapacitance = {}
+        self.mMass = {}
+        self.mTemperature = {}
+
+        ## List of conduction links: [element, node0, node1, conductance (W/K)].
+        self.mConductions = []
+        ## List of radiation links: [element, node0, node1, coefficient (m2), conductance (W/K)].
+        self.mRadiations = []
+        ## List of potential links: [element, node, conductance (W/K)].
+        self.mPotentials = []
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Loads the model from the given xml-trees. Elements in the trees that are
+    ## not <node>, <conduction>, <radiation> or <potential> (such as <mass> and <capEditing>) are
+    ## ignored.
+    ## @param[in]: network   name (abbreviation) of the network, for error reporting
+    ## @param[in]: nodeXml   xml element containing the <node> elements
+    ## @param[in]: condXml   xml element containing the <conduction> elements
+    ## @param[in]: radXml    xml element containing the <radiation> elements
+    ## @param[in]: etcXml    optional xml element containing the <potential> elements
+    def load(self, network, nodeXml, condXml, radXml, etcXml=None):
+        self.__init__()
+        self.mNetwork = network
+
+        try:
+            for element in nodeXml:
+                if "node" != element.tag:
+                    continue
+                name = self.mParser.getChildText(element, "name", network)
+                self.mNodeNames.append(name)
+                self.mNodeElements[name] = element
+                self.mCapacitance[name] = self.getFloat(element, "capacitance", 0.0)
+                self.mMass[name] = self.getFloat(element, "mass", 0.0)
+                self.mTemperature[name] = self.getFloat(element, "temperature", self.mDefaultTemp)
+
+            for element in condXml:
+                if "conduction" != element.tag:
+                    continue
+                n0 = self.mParser.getChildText(element, "node0", network)
+                n1 = self.mParser.getChildText(element, "node1", network)
+                g = float(self.mParser.getChildText(element, "conductivity", network))
+                self.mConductions.append([element, n0, n1, abs(g)])
+
+            for element in radXml:
+                if "radiation" != element.tag:
+                    continue
+                n0 = self.mParser.getChildText(element, "node0", network)
+                n1 = self.mParser.getChildText(element, "node1", network)
+                coeff = float(self.mParser.getChildText(element, "coefficient", network))
+                g = self.linearizedConductance(coeff, self.getTemperature(n0),
+                                                      self.getTemperature(n1))
+                self.mRadiations.append([element, n0, n1, coeff, g])
+
+            for element in ([] if None == etcXml else etcXml):
+                if "potential" != element.tag:
+                    continue
+                node = self.mParser.getChildText(element, "node", network)
+                g = float(self.mParser.getChildText(element, "conductivity", network))
+                self.mPotentials.append([element, node, abs(g)])
+
+        except (TagNotFound, ValueError), e:
+            print e,
+            raise ThermError("Invalid node or link data in network (%s)." % network)
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Returns the linearized conductance of a radiation link,
+    ## q = sigma * coeff * (T0^4 - T1^4) = G * (T0 - T1).
+    ## @param[in]: coeff   radiation coefficient (m2)
+    ## @param[in]: t0      representative temperature (K) of node0
+    ## @param[in]: t1      representative temperature (K) of node1
+    ## @return:    linearized conductance (W/K)
+    def linearizedConductance(self, coeff, t0, t1):
+        return self.mSigma * abs(coeff) * (t0*t0 + t1*t1) * (t0 + t1)
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Returns the initial temperature of a node, or the default temperature if
+    ## the node is not in the node data.
+    ## @param[in]: node   node name
+    ## @return:    temperature (K)
+    def getTemperature(self, node):
+        return self.mTemperature.get(node, self.mDefaultTemp)
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Returns the conduction and linearized radiation conductance between each
+    ## pair of nodes, summing parallel links. Links from a node to itself are ignored.
+    ## @return:  dictionary with key = node name, value = dictionary with key = neighbor node name,
+    ##           value = total conductance (W/K) between the two nodes
+    def getCouplings(self):
+        couplings = {}
+        for node in self.mNodeNames:
+            couplings[node] = {}
+        for link in self.mConductions + self.mRadiations:
+            (n0, n1, g) = (link[1], link[2], link[-1])
+            if n0 == n1:
+                continue
+            couplings.setdefault(n0, {})
+            couplings.setdefault(n1, {})
+            couplings[n0][n1] = couplings[n0].get(n1, 0.0) + g
+            couplings[n1][n0] = couplings[n1].get(n0, 0.0) + g
+        return couplings
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Returns the total conductance attached to each node, including the
+    ## conductance to ground of any potential links.
+    ## @return:  dictionary with key = node name, value = total conductance (W/K)
+    def getTotalConductances(self):
+        totals = {}
+        for node, neighbors in self.getCouplings().iteritems():
+            totals[node] = sum(neighbors.values())
+        for (element, node, g) in self.mPotentials:
+            totals[node] = totals.get(node, 0.0) + g
+        return totals
+
+    #===============================================================================================
+    ## @brief:
+    ## Public function. Returns the conductance to ground of each node from its potential links.
+    ## @return:  dictionary with key = node name, value = conductance to ground (W/K)
+    def getGroundConductances(self):
+        grounds = {}
+        for (element, node, g) in self.mPotentials:
+            grounds[node] = grounds.get(node, 0.0) + g
+        return grounds
+
+    #-----------------------------------------------------------------------------------------------
+    ## @brief:
+    ## Private method, called in load(). Gets a float from a child element's text.
+    ## @param[in]: element   parent xml element
+    ## @param[in]: tag       tag of the child element
+    ## @param[in]: default   value to return if the child element does not exist
+    ## @return:    value of the child element's text
+    def getFloat(self, element, tag, default):
+        children = self.mParser.getElements(element, tag)
+        if 0 == len(children):
+            return default
+        return float(self.mParser.getText(children[0], self.mNetwork))
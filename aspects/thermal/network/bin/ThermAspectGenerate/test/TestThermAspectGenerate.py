@@ -4,16 +4,21 @@
 #
 # programmer: joseph.valerioti@nasa.gov     Jan 2013
 # =================================================================================================
-import unittest,os,sys
+import unittest,os,sys,shutil,tempfile
 ## Set the sys.path to check the one-up directory.
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from ThermSupport import ThermError
+from ThermSupport import ThermError, ThermPrinter
 from ThermAspectConfiguring import ThermAspectConfig
 from ThermAspectBuilding import ThermAspectBuilder
 from IndivNetworkConfiguring import IndivNetworkConfig
 from IndivNetworkBuilding import IndivNetworkBuilder
 from XmlParsing import XmlParser
+from RadiationSparsifying import RadiationSparsifier
+from NodeLumping import NodeLumper
+from StiffnessAnalyzing import StiffnessAnalyzer
+from BinaryConfigWriting import BinaryConfigWriter
+from NetworkPartitioning import NetworkPartitioner
 
 ## Name of this file.
 thisScript = os.path.basename(__file__)
@@ -295,6 +300,319 @@ class TestThermBuilder(unittest.TestCase):
         self.assertAlmostEqual(float(radCoeffRegis), tRadCoeffRegis)
         self.assertAlmostEqual(float(radCoeffTd), tRadCoeffTd)
 
+    def test_61_radiation_sparsification(self):
+        print "\n(6.1) Test radiation sparsification.\n  ",
+        parser = XmlParser()
+        
+        ## Build node and radiation data. The first radiation link is from the registry.
+        nodeXml = parser.newElement("list")
+        for (name, temp) in [("A", 300.0), ("B", 300.0), ("C", 300.0), ("SPACE_1", 3.0)]:
+            n = parser.newElement("node", nodeXml)
+            parser.newElement("name", n).text = name
+            parser.newElement("temperature", n).text = str(temp)
+        radXml = parser.newElement("list")
+        for (n0, n1, coeff) in [("A", "C", "0.000100"), ("A", "SPACE_1", "1.000000"),
+                                ("B", "SPACE_1", "1.000000"), ("C", "SPACE_1", "1.000000"),
+                                ("A", "C", "0.100000"), ("A", "B", "0.001000")]:
+            r = parser.newElement("radiation", radXml)
+            parser.newElement("node0", r).text = n0
+            parser.newElement("node1", r).text = n1
+            parser.newElement("coefficient", r).text = coeff
+        
+        ## @test  Invalid budget is rejected, and cannot execute before initialized.
+        sparsifier = RadiationSparsifier()
+        self.assertRaises(ThermError, sparsifier.execute, radXml, nodeXml, 1)
+        self.assertRaises(ThermError, sparsifier.initialize, "test", 1.0)
+        
+        ## @test  Only the negligible A-B link is dropped, its whole coefficient is added to both
+        ##        A's and B's links to space so they keep their total coefficient, and the registry
+        ##        link is kept.
+        sparsifier.initialize("test", 0.01)
+        with SuppressOutput():
+            sparsifier.execute(radXml, nodeXml, 1)
+        self.assertEqual(sparsifier.mOrigCount, 6)
+        self.assertEqual(sparsifier.mRemovedCount, 1)
+        self.assertEqual(len(radXml), 5)
+        self.assertEqual(parser.getChildText(radXml[0], "coefficient"), "0.000100")
+        self.assertAlmostEqual(float(parser.getChildText(radXml[1], "coefficient")), 1.001)
+        self.assertAlmostEqual(float(parser.getChildText(radXml[2], "coefficient")), 1.001)
+        self.assertAlmostEqual(float(parser.getChildText(radXml[3], "coefficient")), 1.0)
+        self.assertAlmostEqual(float(parser.getChildText(radXml[4], "coefficient")), 0.1)
+        self.assertTrue(sparsifier.mMaxRemovedFraction <= 0.01)
+        
+        ## @test  The temperature error estimate includes the dropped area's heat flow to space.
+        self.assertTrue(sparsifier.mMaxTempErrorNode in ("A", "B"))
+        self.assertTrue(sparsifier.mMaxTempError > 0.0)
+        
+        ## @test  A link is kept if one of its nodes has no link to space to lump onto.
+        radXml = parser.newElement("list")
+        for (n0, n1, coeff) in [("A", "SPACE_1", "1.000000"), ("A", "C", "0.001000"),
+                                ("C", "B", "1.000000")]:
+            r = parser.newElement("radiation", radXml)
+            parser.newElement("node0", r).text = n0
+            parser.newElement("node1", r).text = n1
+            parser.newElement("coefficient", r).text = coeff
+        with SuppressOutput():
+            sparsifier.execute(radXml, nodeXml, 0)
+        self.assertEqual(sparsifier.mRemovedCount, 0)
+        self.assertEqual(len(radXml), 3)
+        
+        ## @test  Sparsification is disabled by default.
+        self.assertEqual(IndivNetworkConfig().cRadSparsifyBudget, None)
+
+    def test_62_node_lumping(self):
+        print "\n(6.2) Test node lumping.\n  ",
+        parser = XmlParser()
+        
+        ## Build node, conduction, radiation and potential data. Node A is tiny and tied to B.
+        nodeXml = parser.newElement("list")
+        for (i, (name, mass, temp, cap)) in enumerate([("REG", 10.0, 296.0, 1000.0),
+                                                       ("A", 1.0, 300.0, 1.0),
+                                                       ("B", 10.0, 290.0, 1000.0),
+                                                       ("C", 10.0, 296.0, 1000.0),
+                                                       ("SPACE_1", 0.0, 3.0, 0.0)]):
+            n = parser.newElement("node", nodeXml)
+            parser.newElement("enum", n).text = str(i)
+            parser.newElement("name", n).text = name
+            parser.newElement("mass", n).text = str(mass)
+            parser.newElement("temperature", n).text = str(temp)
+            parser.newElement("capacitance", n).text = str(cap)
+        condXml = parser.newElement("list")
+        for (i, (n0, n1, g)) in enumerate([("REG", "B", "1.0"), ("A", "B", "100.0"),
+                                           ("A", "C", "0.5"), ("B", "C", "1.0")]):
+            c = parser.newElement("conduction", condXml)
+            parser.newElement("enum", c).text = str(i)
+            parser.newElement("node0", c).text = n0
+            parser.newElement("node1", c).text = n1
+            parser.newElement("conductivity", c).text = g
+        radXml = parser.newElement("list")
+        r = parser.newElement("radiation", radXml)
+        parser.newElement("node0", r).text = "A"
+        parser.newElement("node1", r).text = "SPACE_1"
+        parser.newElement("coefficient", r).text = "0.001"
+        etcXml = parser.newElement("list")
+        
+        ## @test  Invalid settings are rejected, and cannot execute before initialized.
+        lumper = NodeLumper()
+        self.assertRaises(ThermError, lumper.execute, nodeXml, condXml, radXml, etcXml, ["REG"])
+        self.assertRaises(ThermError, lumper.initialize, "test", 0.1, 0.0)
+        
+        ## @test  A is merged into B, conserving mass, capacitance and energy, and its links are
+        ##        rewritten to B.
+        lumper.initialize("test", 0.1)
+        with SuppressOutput():
+            lumped = lumper.execute(nodeXml, condXml, radXml, etcXml, ["REG"])
+        self.assertEqual(lumped, {"A": "B"})
+        self.assertEqual(lumper.mRemovedCount, 1)
+        self.assertEqual([parser.getChildText(n, "name") for n in nodeXml],
+                         ["REG", "B", "C", "SPACE_1"])
+        self.assertEqual(parser.getChildText(nodeXml[1], "enum"), "1")
+        self.assertAlmostEqual(float(parser.getChildText(nodeXml[1], "mass")), 11.0)
+        self.assertAlmostEqual(float(parser.getChildText(nodeXml[1], "capacitance")), 1001.0)
+        self.assertAlmostEqual(float(parser.getChildText(nodeXml[1], "temperature")),
+                               (300.0 + 290.0 * 1000.0) / 1001.0, 2)
+        self.assertEqual(len(condXml), 3)
+        self.assertEqual(parser.getChildText(condXml[1], "node0"), "B")
+        self.assertEqual(parser.getChildText(condXml[2], "enum"), "2")
+        self.assertEqual(parser.getChildText(radXml[0], "node0"), "B")
+        self.assertTrue(0.0 < lumper.mMaxResponseError < 0.01)
+
+    def test_63_stiffness_analysis(self):
+        print "\n(6.3) Test stiffness analysis.\n  ",
+        parser = XmlParser()
+        
+        ## Build node, conduction and potential data. FAST has a 0.01 s time constant, SLOW has a
+        ## 100 s time constant, and AIR is algebraic.
+        nodeXml = parser.newElement("list")
+        for (name, cap) in [("FAST", 1.0), ("SLOW", 10000.0), ("AIR", 0.0)]:
+            n = parser.newElement("node", nodeXml)
+            parser.newElement("name", n).text = name
+            parser.newElement("temperature", n).text = "296.0"
+            parser.newElement("capacitance", n).text = str(cap)
+        condXml = parser.newElement("list")
+        for (n0, n1, g) in [("FAST", "AIR", "50.0"), ("SLOW", "AIR", "50.0")]:
+            c = parser.newElement("conduction", condXml)
+            parser.newElement("node0", c).text = n0
+            parser.newElement("node1", c).text = n1
+            parser.newElement("conductivity", c).text = g
+        etcXml = parser.newElement("list")
+        p = parser.newElement("potential", etcXml)
+        parser.newElement("node", p).text = "FAST"
+        parser.newElement("conductivity", p).text = "50.0"
+        
+        ## @test  Invalid settings are rejected, and cannot execute before initialized.
+        analyzer = StiffnessAnalyzer()
+        self.assertRaises(ThermError, analyzer.execute, nodeXml, condXml, nodeXml, etcXml)
+        self.assertRaises(ThermError, analyzer.initialize, "test", 0.0, [1.0])
+        self.assertRaises(ThermError, analyzer.initialize, "test", 1.0, [])
+        
+        ## @test  Time constants, fast nodes and rate groups.
+        analyzer.initialize("test", 10.0, [0.01, 1.0, 10.0, 100.0])
+        with SuppressOutput():
+            analyzer.execute(nodeXml, condXml, parser.newElement("list"), etcXml)
+        self.assertAlmostEqual(analyzer.mTimeConstants["FAST"], 0.01)
+        self.assertAlmostEqual(analyzer.mTimeConstants["SLOW"], 200.0)
+        self.assertEqual(analyzer.mAlgebraicNodes, ["AIR"])
+        self.assertEqual(analyzer.mFastNodes, ["FAST"])
+        self.assertEqual(analyzer.mMinTimeConstantNode, "FAST")
+        self.assertEqual(analyzer.mRateGroups[100.0], ["FAST"])
+        self.assertEqual(analyzer.mRateGroups[0.01], ["SLOW"])
+        self.assertEqual(analyzer.mSuggestedRate, 100.0)
+
+    #-----------------------------------------------------------------------------------------------
+    def test_64_binary_config(self):
+        print "\n(6.4) Test binary config-file.\n  ",
+        parser = XmlParser()
+        
+        ## Build node, conduction, radiation and potential data.
+        nodeXml = parser.newElement("list")
+        for (name, temp, cap, group) in [("A", "300.5", "10.25", "grp"), ("B", "290.0", "1e3", None),
+                                         ("SPACE", "3.0", "0.0", None)]:
+            n = parser.newElement("node", nodeXml)
+            parser.newElement("name", n).text = name
+            parser.newElement("temperature", n).text = temp
+            parser.newElement("capacitance", n).text = cap
+            if group:
+                parser.newElement("editGroup", n).text = group
+        parser.newElement("group", parser.newElement("capEditing", nodeXml)).text = "grp"
+        condXml = parser.newElement("list")
+        for (n0, n1, g) in [("A", "B", "0.4"), ("B", "NOPE", "1.0")]:
+            c = parser.newElement("conduction", condXml)
+            parser.newElement("node0", c).text = n0
+            parser.newElement("node1", c).text = n1
+            parser.newElement("conductivity", c).text = g
+        parser.newElement("name", condXml[0]).text = "bracket"
+        radXml = parser.newElement("list")
+        r = parser.newElement("radiation", radXml)
+        parser.newElement("node0", r).text = "B"
+        parser.newElement("node1", r).text = "SPACE"
+        parser.newElement("coefficient", r).text = "0.123456"
+        etcXml = parser.newElement("list")
+        p = parser.newElement("potential", etcXml)
+        parser.newElement("name", p).text = "pot_A"
+        parser.newElement("node", p).text = "A"
+        parser.newElement("temperature", p).text = "310.0"
+        parser.newElement("conductivity", p).text = "1e12"
+        
+        tmpDir = tempfile.mkdtemp()
+        try:
+            ## Print the xml-files and write the binary config-file.
+            files = [os.path.join(tmpDir, f) for f in ["n.xml", "c.xml", "r.xml", "e.xml"]]
+            for (xml, f) in zip([nodeXml, condXml, radXml, etcXml], files):
+                ThermPrinter().printThermXml(xml, f, thisScript)
+            binFile = os.path.join(tmpDir, "test.bin")
+            writer = BinaryConfigWriter()
+            with SuppressOutput():
+                writer.write("test", binFile, nodeXml, condXml, radXml, etcXml)
+                tables = writer.read(binFile)
+            
+                ## @test  The binary config-file verifies against the xml-files.
+                writer.verify("test", binFile, files[0], files[1], files[2], files[3])
+            
+            ## @test  Tables, with the link to an unregistered node skipped.
+            self.assertEqual(tables["groups"], [("grp",)])
+            self.assertEqual(tables["nodes"], [("A", 300.5, 10.25, 0), ("B", 290.0, 1000.0, -1),
+                                               ("SPACE", 3.0, 0.0, -1)])
+            self.assertEqual(tables["conductions"], [("bracket", 0, 1, 0.4)])
+            self.assertEqual(tables["radiations"], [("rad B to SPACE", 1, 2, 0.123456)])
+            self.assertEqual(tables["potentials"], [("pot_A", 0, 310.0, 1e12)])
+            
+            ## @test  Verification fails if the xml-files differ.
+            parser.getElements(radXml[0], "coefficient")[0].text = "0.5"
+            ThermPrinter().printThermXml(radXml, files[2], thisScript)
+            with SuppressOutput():
+                self.assertRaises(ThermError, writer.verify, "test", binFile, files[0], files[1],
+                                  files[2], files[3])
+            
+            ## @test  A corrupted file fails its checksum.
+            f = open(binFile, 'r+b')
+            f.seek(-1, 2)
+            f.write("\xff")
+            f.close()
+            with SuppressOutput():
+                self.assertRaises(ThermError, writer.read, binFile)
+                self.assertRaises(ThermError, writer.read, files[0])
+        finally:
+            shutil.rmtree(tmpDir)
+
+    #-----------------------------------------------------------------------------------------------
+    def test_65_network_partition(self):
+        print "\n(6.5) Test network partition advisor.\n  ",
+        parser = XmlParser()
+        
+        ## Build two 3x3 grids of nodes, joined by one weak conduction, plus a space node that both
+        ## grids radiate to.
+        nodeXml = parser.newElement("list")
+        condXml = parser.newElement("list")
+        radXml = parser.newElement("list")
+        for name in ["%s_%i%i" % (g, i, j) for g in "AB" for i in range(3) for j in range(3)] + \
+                    ["SPACE"]:
+            n = parser.newElement("node", nodeXml)
+            parser.newElement("name", n).text = name
+            parser.newElement("temperature", n).text = "300.0"
+            parser.newElement("capacitance", n).text = "0.0" if "SPACE" == name else "100.0"
+        links = [("B_11", "A_11", "0.1")]
+        for g in "AB":
+            for i in range(3):
+                for j in range(3):
+                    if i < 2:
+                        links.append(("%s_%i%i" % (g, i, j), "%s_%i%i" % (g, i + 1, j), "10.0"))
+                    if j < 2:
+                        links.append(("%s_%i%i" % (g, i, j), "%s_%i%i" % (g, i, j + 1), "10.0"))
+        for (n0, n1, g) in links:
+            c = parser.newElement("conduction", condXml)
+            parser.newElement("node0", c).text = n0
+            parser.newElement("node1", c).text = n1
+            parser.newElement("conductivity", c).text = g
+        for node in ["A_00", "B_22"]:
+            r = parser.newElement("radiation", radXml)
+            parser.newElement("node0", r).text = node
+            parser.newElement("node1", r).text = "SPACE"
+            parser.newElement("coefficient", r).text = "1.0"
+        
+        ## @test  Invalid settings are rejected, and cannot execute before initialized.
+        partitioner = NetworkPartitioner()
+        self.assertRaises(ThermError, partitioner.execute, nodeXml, condXml, radXml)
+        self.assertRaises(ThermError, partitioner.initialize, "test", 0)
+        self.assertRaises(ThermError, partitioner.initialize, "test", 1.5)
+        self.assertRaises(ThermError, partitioner.initialize, "test", 2, 1.0)
+        
+        ## @test  The grids are split at the weak conduction, and the space node is not split.
+        partitioner.initialize("test", 2)
+        with SuppressOutput():
+            partitioner.execute(nodeXml, condXml, radXml)
+        self.assertEqual(partitioner.mBoundaryNode, "SPACE")
+        self.assertEqual(sorted([sorted(p) for p in partitioner.mParts]),
+                         [["A_%i%i" % (i, j) for i in range(3) for j in range(3)],
+                          ["B_%i%i" % (i, j) for i in range(3) for j in range(3)]])
+        self.assertEqual(len(partitioner.mInterfaceLinks), 1)
+        self.assertEqual(partitioner.mInterfaceLinks[0][:4],
+                         ["conduction", "cond B_11 to A_11", "B_11", "A_11"])
+        self.assertAlmostEqual(partitioner.mCutConductance, 0.1)
+        self.assertAlmostEqual(partitioner.mMaxInterfaceFraction, 0.1 / 40.1)
+        self.assertAlmostEqual(partitioner.mMinInterfaceTimeConstant, 1000.0)
+        
+        ## @test  Balanced node counts for more sub-networks than components.
+        partitioner.initialize("test", 3, 0.0)
+        with SuppressOutput():
+            partitioner.execute(nodeXml, condXml, radXml)
+        self.assertEqual(sorted([len(p) for p in partitioner.mParts]), [6, 6, 6])
+        
+        ## @test  The report lists the sub-networks, registered nodes and interface couplings.
+        tmpDir = tempfile.mkdtemp()
+        try:
+            report = os.path.join(tmpDir, "partition.xml")
+            partitioner.writeReport(report, thisScript, ["A_00"])
+            root = parser.loadFile(report)
+            self.assertEqual(len(parser.getElements(root, "subNetwork")), 3)
+            self.assertEqual(len(parser.getElements(root, "interface")),
+                             len(partitioner.mInterfaceLinks))
+            registered = [n.text for n in root.findall("subNetwork/node")
+                          if "true" == n.get("isRegistered")]
+            self.assertEqual(registered, ["A_00"])
+        finally:
+            shutil.rmtree(tmpDir)
+
 # =================================================================================================
 # Primary function
 # =================================================================================================
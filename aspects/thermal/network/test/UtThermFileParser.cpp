@@ -27,6 +27,7 @@ UtThermFileParser::UtThermFileParser()
     tPanFile(),
     tEtcFile(),
     tThermInputFile(),
+    tBinFile(),
     tNumNodes(),
     tNode(),
     tNodeName(),
@@ -152,6 +153,10 @@ void UtThermFileParser::setUp()
     /// - Declare the input-files.
     tThermInputFile = "ThermInput_base.xml";
 
+    /// - Declare the binary config-file, written by ThermAspectGenerate from the node, cond, rad
+    ///   and etc-files above.
+    tBinFile = "ThermBin_base.bin";
+
     /// - nominal node data from the test case
     tNumNodes = 22;
     tNode = 15;
@@ -623,3 +628,73 @@ void UtThermFileParser::testThermInput()
 
     std::cout << " Pass";
 }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @details  Tests that the bin-file gives the same data as the node, cond, rad and etc-files, and
+///           that invalid bin-files are rejected.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+void UtThermFileParser::testBinFile()
+{
+    std::cout << "\n ThermFileParser 13: Testing read of binary config-file..........";
+
+    /// - Create an article that reads the bin-file in place of the node, cond, rad and etc-files.
+    FriendlyThermFileParser article;
+    article.mBinFile = tBinFile;
+    article.mHtrFile = tHtrFile;
+    article.mPanFile = tPanFile;
+
+    /// @test  Node count from the bin-file.
+    CPPUNIT_ASSERT_NO_THROW_MESSAGE("preCountNodes", article.preCountNodes() );
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("preCountNodes", tNumNodes, article.numNodes);
+
+    /// @test  Read bin-file.
+    CPPUNIT_ASSERT_NO_THROW_MESSAGE("initialize", article.initialize("article_bin") );
+
+    /// @test  Node and capacitance link data.
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numNodes", tArticle->numNodes, article.numNodes);
+    CPPUNIT_ASSERT_MESSAGE("vNodeNames", tArticle->vNodeNames == article.vNodeNames);
+    CPPUNIT_ASSERT_MESSAGE("mNodeMap", tArticle->mNodeMap == article.mNodeMap);
+    CPPUNIT_ASSERT_MESSAGE("vCapEditGroupList", tArticle->vCapEditGroupList == article.vCapEditGroupList);
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numLinksCap", tArticle->numLinksCap, article.numLinksCap);
+    CPPUNIT_ASSERT_MESSAGE("vCapNames", tArticle->vCapNames == article.vCapNames);
+    CPPUNIT_ASSERT_MESSAGE("vCapPorts", tArticle->vCapPorts == article.vCapPorts);
+    CPPUNIT_ASSERT_MESSAGE("vCapTemperatures", tArticle->vCapTemperatures == article.vCapTemperatures);
+    CPPUNIT_ASSERT_MESSAGE("vCapCapacitances", tArticle->vCapCapacitances == article.vCapCapacitances);
+    CPPUNIT_ASSERT_MESSAGE("vCapEditGroupIdentifiers",
+            tArticle->vCapEditGroupIdentifiers == article.vCapEditGroupIdentifiers);
+
+    /// @test  Conduction link data.
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numLinksCond", tArticle->numLinksCond, article.numLinksCond);
+    CPPUNIT_ASSERT_MESSAGE("vCondNames", tArticle->vCondNames == article.vCondNames);
+    CPPUNIT_ASSERT_MESSAGE("vCondPorts0", tArticle->vCondPorts0 == article.vCondPorts0);
+    CPPUNIT_ASSERT_MESSAGE("vCondPorts1", tArticle->vCondPorts1 == article.vCondPorts1);
+    CPPUNIT_ASSERT_MESSAGE("vCondConductivities", tArticle->vCondConductivities == article.vCondConductivities);
+
+    /// @test  Radiation link data.
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numLinksRad", tArticle->numLinksRad, article.numLinksRad);
+    CPPUNIT_ASSERT_MESSAGE("vRadNames", tArticle->vRadNames == article.vRadNames);
+    CPPUNIT_ASSERT_MESSAGE("vRadPorts0", tArticle->vRadPorts0 == article.vRadPorts0);
+    CPPUNIT_ASSERT_MESSAGE("vRadPorts1", tArticle->vRadPorts1 == article.vRadPorts1);
+    CPPUNIT_ASSERT_MESSAGE("vRadCoefficients", tArticle->vRadCoefficients == article.vRadCoefficients);
+
+    /// @test  Potential link data.
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numLinksPot", tArticle->numLinksPot, article.numLinksPot);
+    CPPUNIT_ASSERT_MESSAGE("vPotNames", tArticle->vPotNames == article.vPotNames);
+    CPPUNIT_ASSERT_MESSAGE("vPotPorts", tArticle->vPotPorts == article.vPotPorts);
+    CPPUNIT_ASSERT_MESSAGE("vPotTemperatures", tArticle->vPotTemperatures == article.vPotTemperatures);
+    CPPUNIT_ASSERT_MESSAGE("vPotConductivities", tArticle->vPotConductivities == article.vPotConductivities);
+
+    /// @test  Heater and panel links still come from their xml-files.
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numLinksHtr", tArticle->numLinksHtr, article.numLinksHtr);
+    CPPUNIT_ASSERT_EQUAL_MESSAGE("numLinksPan", tArticle->numLinksPan, article.numLinksPan);
+
+    /// @test  Exception thrown on a missing bin-file.
+    article.mBinFile = "calabria.bin";
+    CPPUNIT_ASSERT_THROW_MESSAGE("bin-file doesn't exist", article.readBinFile(), TsParseException);
+
+    /// @test  Exception thrown on a file that is not a bin-file.
+    article.mBinFile = tNodeFile;
+    CPPUNIT_ASSERT_THROW_MESSAGE("non-bin file", article.readBinFile(), TsParseException);
+
+    std::cout << " Pass";
+}
@@ -75,6 +75,8 @@ class UtThermFileParser: public CppUnit::TestFixture
         void testSrc();
         /// @brief  Tests for correct edit of data by reading of ThermInput file.
         void testThermInput();
+        /// @brief  Tests for the same data from the bin-file as from the xml-files.
+        void testBinFile();
 
     private:
         CPPUNIT_TEST_SUITE(UtThermFileParser);
@@ -89,6 +91,7 @@ class UtThermFileParser: public CppUnit::TestFixture
         CPPUNIT_TEST(testPot);
         CPPUNIT_TEST(testSrc);
         CPPUNIT_TEST(testThermInput);
+        CPPUNIT_TEST(testBinFile);
         CPPUNIT_TEST_SUITE_END();
 
         /// @brief  (s)  Nominal time step
@@ -107,6 +110,7 @@ class UtThermFileParser: public CppUnit::TestFixture
         std::string tPanFile;  /**< (--)  name of panel config-file to parse */
         std::string tEtcFile;  /**< (--)  name of et.cetera config-file to parse */
         std::string tThermInputFile;   /**< (--)  name of thermal input-file to parse */
+        std::string tBinFile;  /**< (--)  name of binary config-file to parse */
 
         /// - Node Attributes
         ////////////////////////////////////////////////////////////////////////////////////////////
@@ -8,11 +8,15 @@
 LIBRARY DEPENDENCY:
   ((simulation/hs/TsHsMsg.o)
    (software/exceptions/TsInitializationException.o)
-   (core/Gunns.o))
+   (core/Gunns.o)
+   (core/GunnsBasicLink.o)
+   (core/GunnsFluidNode.o))
 */
 
 #include <sstream>
 #include "GunnsNetworkBase.hh"
+#include "core/GunnsBasicLink.hh"
+#include "core/GunnsFluidNode.hh"
 #include "simulation/hs/TsHsMsg.hh"
 #include "software/exceptions/TsInitializationException.hh"
 
@@ -206,3 +210,97 @@ const std::string GunnsNetworkBase::createNodeName(const int node) const
     stream << ".Node_" << node;
     return stream.str();
 }
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @returns  int (--) The number of states per node in a node states snapshot.
+///
+/// @details  Returns the number of states per node in the node states snapshot from getNodeStates.
+///           This is SNAP_MASS_FRACTIONS plus the number of fluid constituents in this network's
+///           fluid config, or just SNAP_MASS_FRACTIONS for networks with no fluid config.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+int GunnsNetworkBase::getNumNodeStates()
+{
+    const PolyFluidConfigData* fluidConfig = getFluidConfig();
+    if (fluidConfig) {
+        return SNAP_MASS_FRACTIONS + fluidConfig->mNTypes;
+    }
+    return SNAP_MASS_FRACTIONS;
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[out] states (--) Array to copy the node states into.
+/// @param[in]  size   (--) Number of elements in the states array.
+///
+/// @returns  int (--) The number of node states copied, or zero if the array is too small.
+///
+/// @details  Copies the states of this network's nodes, not including the ground node, into the
+///           given array, in one row of getNumNodeStates() values per node, in the order of the
+///           SnapshotNodeStates enumeration.  In a super-network, these are this network's nodes in
+///           the super-network's node list.  The fluid states are zero in networks with no fluid
+///           config.
+///
+/// @note     This is intended for test scripts to take a snapshot of the whole network's state in
+///           one call, rather than reading each node's states separately.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+int GunnsNetworkBase::getNodeStates(double* states, const int size)
+{
+    const int numNodes  = getNumLocalNodes() - 1;
+    const int numStates = getNumNodeStates();
+    if (!states or numNodes < 1 or size < numNodes * numStates) {
+        return 0;
+    }
+
+    /// - The node list array is of the derived node type, so fluid nodes must be indexed as such.
+    const bool fluid = (0 != getFluidConfig());
+    GunnsFluidNode* fluidNodes = static_cast<GunnsFluidNode*>(netNodeList.mNodes);
+    for (int node = 0; node < numNodes; ++node) {
+        double* row = &states[node * numStates];
+        for (int i = 0; i < numStates; ++i) {
+            row[i] = 0.0;
+        }
+        if (fluid) {
+            GunnsFluidNode& fluidNode = fluidNodes[netSuperNodesOffset + node];
+            const PolyFluid* content  = fluidNode.getContent();
+            row[SNAP_POTENTIAL]       = fluidNode.getPotential();
+            row[SNAP_NET_FLUX]        = fluidNode.getNetFlux();
+            row[SNAP_VOLUME]          = fluidNode.getVolume();
+            row[SNAP_MASS]            = content->getMass();
+            row[SNAP_TEMPERATURE]     = content->getTemperature();
+            row[SNAP_ENTHALPY]        = content->getSpecificEnthalpy();
+            for (int i = SNAP_MASS_FRACTIONS; i < numStates; ++i) {
+                row[i] = content->getMassFraction(i - SNAP_MASS_FRACTIONS);
+            }
+        } else {
+            const GunnsBasicNode& basicNode = netNodeList.mNodes[netSuperNodesOffset + node];
+            row[SNAP_POTENTIAL] = basicNode.getPotential();
+            row[SNAP_NET_FLUX]  = basicNode.getNetFlux();
+        }
+    }
+    return numNodes * numStates;
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[out] states (--) Array to copy the link states into.
+/// @param[in]  size   (--) Number of elements in the states array.
+///
+/// @returns  int (--) The number of link states copied, or zero if the array is too small.
+///
+/// @details  Copies the states of this network's links into the given array, in one row of
+///           SNAP_N_LINK_STATES values per link, in the order of the SnapshotLinkStates enumeration
+///           and of the links in the netLinks vector.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+int GunnsNetworkBase::getLinkStates(double* states, const int size) const
+{
+    const int numLinks = getNumLinks();
+    if (!states or numLinks < 1 or size < numLinks * SNAP_N_LINK_STATES) {
+        return 0;
+    }
+
+    for (int link = 0; link < numLinks; ++link) {
+        double* row = &states[link * SNAP_N_LINK_STATES];
+        row[SNAP_LINK_FLUX]           = netLinks[link]->getFlux();
+        row[SNAP_LINK_POTENTIAL_DROP] = netLinks[link]->getPotentialDrop();
+        row[SNAP_LINK_POWER]          = netLinks[link]->getPower();
+    }
+    return numLinks * SNAP_N_LINK_STATES;
+}
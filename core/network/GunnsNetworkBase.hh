@@ -48,11 +48,34 @@ class GunnsSuperNetworkBase;
 ///           This is a pure virtual class and can't be instantiated directly.  It is intended for
 ///           all GunnShow-generated networks, ThermalNetwork and hand-written networks to extend
 ///           this class and implement its pure virtual functions.
+///
+///           The getNodeStates and getLinkStates methods copy the states of all of this network's
+///           nodes and links into a flat array in one call.  These are intended for test scripts
+///           that would otherwise read the states one at a time through the Trick/SWIG interface.
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 class GunnsNetworkBase
 {
     TS_MAKE_SIM_COMPATIBLE(GunnsNetworkBase);
     public:
+        /// @brief  Enumeration of the states of each node in a node states snapshot.  Fluid nodes
+        ///         have one more state for each fluid constituent's mass fraction, starting at
+        ///         SNAP_MASS_FRACTIONS.
+        enum SnapshotNodeStates {
+            SNAP_POTENTIAL      = 0, ///< Node potential (pressure for fluid nodes).
+            SNAP_NET_FLUX       = 1, ///< Node net flux.
+            SNAP_VOLUME         = 2, ///< (m3) Node volume.
+            SNAP_MASS           = 3, ///< (kg) Node fluid mass.
+            SNAP_TEMPERATURE    = 4, ///< (K) Node fluid temperature.
+            SNAP_ENTHALPY       = 5, ///< (J/kg) Node fluid specific enthalpy.
+            SNAP_MASS_FRACTIONS = 6  ///< (--) First node fluid constituent mass fraction.
+        };
+        /// @brief  Enumeration of the states of each link in a link states snapshot.
+        enum SnapshotLinkStates {
+            SNAP_LINK_FLUX           = 0, ///< Link flux.
+            SNAP_LINK_POTENTIAL_DROP = 1, ///< Link potential drop.
+            SNAP_LINK_POWER          = 2, ///< (W) Link power.
+            SNAP_N_LINK_STATES       = 3  ///< Number of states per link.
+        };
         Gunns                        netSolver;           /**<    (--)                     Network solver object. */
         GunnsNodeList                netNodeList;         /**< *o (--) trick_chkpnt_io(**) Network node list structure. */
         /// @brief  Default constructor.
@@ -97,6 +120,18 @@ class GunnsNetworkBase
         pthread_mutex_t* getMutex();
         /// @brief  Sets the mutex locking enable flag to the given value.
         void         setMutexEnabled(const bool flag);
+        /// @brief  Returns the number of links in this network.
+        int          getNumLinks() const;
+        /// @brief  Returns the number of states per node in a node states snapshot.
+        int          getNumNodeStates();
+        /// @brief  Copies the states of this network's non-ground nodes into the given array.
+        int          getNodeStates(double* states, const int size);
+        /// @brief  Copies the states of this network's links into the given array.
+        int          getLinkStates(double* states, const int size) const;
+        /// @brief  Copies the node states into the array at the given address, for Python callers.
+        int          getNodeStatesAt(const unsigned long address, const int size);
+        /// @brief  Copies the link states into the array at the given address, for Python callers.
+        int          getLinkStatesAt(const unsigned long address, const int size) const;
 
     protected:
         std::string                  mName;               /**< ** (--) trick_chkpnt_io(**) Network instance name for H&S messages. */
@@ -247,4 +282,44 @@ inline void GunnsNetworkBase::setMutexEnabled(const bool flag)
     netMutexEnabled = flag;
 }
 
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @returns  int (--) The number of links in this network.
+///
+/// @details  Returns the size of the netLinks vector.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+inline int GunnsNetworkBase::getNumLinks() const
+{
+    return static_cast<int>(netLinks.size());
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]  address (--) Address of the array to copy the node states into.
+/// @param[in]  size    (--) Number of elements in the array.
+///
+/// @returns  int (--) The number of node states copied, or zero if the array is too small.
+///
+/// @details  This is the same as getNodeStates, but takes the array address as an integer, so that
+///           Python callers can pass the address of a NumPy array's data (array.ctypes.data).  The
+///           array must be contiguous and of type float64.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+inline int GunnsNetworkBase::getNodeStatesAt(const unsigned long address, const int size)
+{
+    return getNodeStates(reinterpret_cast<double*>(address), size);
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in]  address (--) Address of the array to copy the link states into.
+/// @param[in]  size    (--) Number of elements in the array.
+///
+/// @returns  int (--) The number of link states copied, or zero if the array is too small.
+///
+/// @details  This is the same as getLinkStates, but takes the array address as an integer, so that
+///           Python callers can pass the address of a NumPy array's data (array.ctypes.data).  The
+///           array must be contiguous and of type float64.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+inline int GunnsNetworkBase::getLinkStatesAt(const unsigned long address, const int size) const
+{
+    return getLinkStates(reinterpret_cast<double*>(address), size);
+}
+
 #endif
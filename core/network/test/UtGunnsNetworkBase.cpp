@@ -428,5 +428,71 @@ void UtGunnsNetworkBase::testUpdateStandalone()
     CPPUNIT_ASSERT(0 == pthread_mutex_trylock(mutex));
     pthread_mutex_unlock(mutex);
 
+    UT_PASS;
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @details  Tests for GUNNS network base class node & link states snapshot methods.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+void UtGunnsNetworkBase::testSnapshot()
+{
+    UT_RESULT;
+
+    tArticle->initialize();
+    tArticle->netNodes[0].setPotential(1.0);
+    tArticle->netNodes[1].setPotential(2.0);
+    tArticle->netNodes[2].setPotential(3.0);
+    tArticle->mLink.mFlux          = 4.0;
+    tArticle->mLink.mPotentialDrop = 5.0;
+    tArticle->mLink.mPower         = 6.0;
+
+    /// @test snapshot sizes for a basic network.
+    const int numStates = GunnsNetworkBase::SNAP_MASS_FRACTIONS;
+    CPPUNIT_ASSERT_EQUAL(numStates, tArticle->getNumNodeStates());
+    CPPUNIT_ASSERT_EQUAL(1,         tArticle->getNumLinks());
+
+    /// @test node states of the non-ground nodes, with zero fluid states.
+    double nodeStates[3 * numStates + 1];
+    for (int i = 0; i < 3 * numStates + 1; ++i) {
+        nodeStates[i] = -1.0;
+    }
+    CPPUNIT_ASSERT_EQUAL(3 * numStates, tArticle->getNodeStates(nodeStates, 3 * numStates + 1));
+    for (int node = 0; node < 3; ++node) {
+        const double* row = &nodeStates[node * numStates];
+        CPPUNIT_ASSERT_EQUAL(node + 1.0, row[GunnsNetworkBase::SNAP_POTENTIAL]);
+        CPPUNIT_ASSERT_EQUAL(0.0,        row[GunnsNetworkBase::SNAP_NET_FLUX]);
+        CPPUNIT_ASSERT_EQUAL(0.0,        row[GunnsNetworkBase::SNAP_VOLUME]);
+        CPPUNIT_ASSERT_EQUAL(0.0,        row[GunnsNetworkBase::SNAP_MASS]);
+        CPPUNIT_ASSERT_EQUAL(0.0,        row[GunnsNetworkBase::SNAP_TEMPERATURE]);
+        CPPUNIT_ASSERT_EQUAL(0.0,        row[GunnsNetworkBase::SNAP_ENTHALPY]);
+    }
+    CPPUNIT_ASSERT_EQUAL(-1.0, nodeStates[3 * numStates]);
+
+    /// @test link states.
+    double linkStates[GunnsNetworkBase::SNAP_N_LINK_STATES];
+    CPPUNIT_ASSERT_EQUAL(3, tArticle->getLinkStates(linkStates, 3));
+    CPPUNIT_ASSERT_EQUAL(4.0, linkStates[GunnsNetworkBase::SNAP_LINK_FLUX]);
+    CPPUNIT_ASSERT_EQUAL(5.0, linkStates[GunnsNetworkBase::SNAP_LINK_POTENTIAL_DROP]);
+    CPPUNIT_ASSERT_EQUAL(6.0, linkStates[GunnsNetworkBase::SNAP_LINK_POWER]);
+
+    /// @test the array address versions of the snapshot methods.
+    nodeStates[0] = 0.0;
+    linkStates[0] = 0.0;
+    CPPUNIT_ASSERT_EQUAL(3 * numStates,
+                         tArticle->getNodeStatesAt(reinterpret_cast<unsigned long>(nodeStates), 3 * numStates));
+    CPPUNIT_ASSERT_EQUAL(1.0, nodeStates[0]);
+    CPPUNIT_ASSERT_EQUAL(3, tArticle->getLinkStatesAt(reinterpret_cast<unsigned long>(linkStates), 3));
+    CPPUNIT_ASSERT_EQUAL(4.0, linkStates[0]);
+
+    /// @test nothing is copied into a null or too small array.
+    nodeStates[0] = 0.0;
+    linkStates[0] = 0.0;
+    CPPUNIT_ASSERT_EQUAL(0, tArticle->getNodeStates(nodeStates, 3 * numStates - 1));
+    CPPUNIT_ASSERT_EQUAL(0, tArticle->getNodeStates(0, 3 * numStates));
+    CPPUNIT_ASSERT_EQUAL(0, tArticle->getLinkStates(linkStates, 2));
+    CPPUNIT_ASSERT_EQUAL(0, tArticle->getLinkStates(0, 3));
+    CPPUNIT_ASSERT_EQUAL(0.0, nodeStates[0]);
+    CPPUNIT_ASSERT_EQUAL(0.0, linkStates[0]);
+
     UT_PASS_LAST;
 }
@@ -105,6 +105,8 @@ class UtGunnsNetworkBase: public CppUnit::TestFixture
         void testUpdateSubNetwork();
         /// @brief    Tests update method when a standalone network.
         void testUpdateStandalone();
+        /// @brief    Tests the node & link states snapshot methods.
+        void testSnapshot();
 
     private:
         CPPUNIT_TEST_SUITE(UtGunnsNetworkBase);
@@ -116,6 +118,7 @@ class UtGunnsNetworkBase: public CppUnit::TestFixture
         CPPUNIT_TEST(testRestartStandalone);
         CPPUNIT_TEST(testUpdateSubNetwork);
         CPPUNIT_TEST(testUpdateStandalone);
+        CPPUNIT_TEST(testSnapshot);
         CPPUNIT_TEST_SUITE_END();
         std::string               tName;    /**< (--) Nominal name. */
         FriendlyGunnsNetworkBase* tArticle; /**< (--) Pointer to the article under test. */
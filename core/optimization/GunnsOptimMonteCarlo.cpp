@@ -237,11 +237,7 @@ void GunnsOptimMonteCarlo::updateSlavePre()
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 void GunnsOptimMonteCarlo::updateSlavePost()
 {
-    computeScalarCosts();
-    double cost = 0.0;
-    for (unsigned int i=0; i<mOutputs.size(); ++i) {
-        cost += mOutputs.at(i).mCost;
-    }
+    double cost = computeSlaveCost();
 
     /// - Write the total cost result for this run to the MC Master/Slave buffer.
     MC_WRITE(cost); // from GunnsInfraMacros
@@ -254,6 +250,24 @@ void GunnsOptimMonteCarlo::updateSlavePost()
     MC_WRITE(mRunIdReturned);
 }
 
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @returns  double (--) The total cost function result of all the model outputs.
+///
+/// @details  Computes the final cost of the scalar targets, and returns the sum of the costs of all
+///           the model outputs accumulated in this run so far.  This is called at the end of each
+///           Slave run, and by the Python sim worker pool (sims/SIM_mc/mc_pool.py) at the end of
+///           its worker runs, which aren't Trick MC Slave runs.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+double GunnsOptimMonteCarlo::computeSlaveCost()
+{
+    computeScalarCosts();
+    double cost = 0.0;
+    for (unsigned int i=0; i<mOutputs.size(); ++i) {
+        cost += mOutputs.at(i).mCost;
+    }
+    return cost;
+}
+
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 /// @details  Drives the inputs to the model, prior to each model step in the Slave run.  This
 ///           should be called by either a "scheduled" Trick job prior to the model step, or by the
@@ -389,6 +403,43 @@ void GunnsOptimMonteCarlo::addDriverDataRow(const std::string& values)
     }
 }
 
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in] index  (--) Index of the output variable, in the order they were added.
+/// @param[in] values (--) Target trajectory values of the output variable at the next time steps.
+///
+/// @throws   std::runtime_error
+///
+/// @details  Adds the given target trajectory values for one output variable, in bulk.  This is
+///           equivalent to adding the output's column of values with addOutputDataRow, but without
+///           formatting and parsing each row as a string.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+void GunnsOptimMonteCarlo::addOutputTrajectory(const unsigned int index, const std::vector<double>& values)
+{
+    if (index >= mOutputs.size()) {
+        throw std::runtime_error(mName + " addOutputTrajectory output index is out of range.");
+    }
+    mOutputs.at(index).mTargetTraj.insert(mOutputs.at(index).mTargetTraj.end(), values.begin(), values.end());
+    mOutputs.at(index).mIsScalarTarget = false;
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @param[in] index  (--) Index of the driver variable, in the order they were added.
+/// @param[in] values (--) Trajectory values of the driver variable at the next time steps.
+///
+/// @throws   std::runtime_error
+///
+/// @details  Adds the given trajectory values for one driver variable, in bulk.  This is equivalent
+///           to adding the driver's column of values with addDriverDataRow, but without formatting
+///           and parsing each row as a string.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+void GunnsOptimMonteCarlo::addDriverTrajectory(const unsigned int index, const std::vector<double>& values)
+{
+    if (index >= mDrivers.size()) {
+        throw std::runtime_error(mName + " addDriverTrajectory driver index is out of range.");
+    }
+    mDrivers.at(index).mTrajectory.insert(mDrivers.at(index).mTrajectory.end(), values.begin(), values.end());
+}
+
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 /// @param[out] data   (--) Reference to a vector of doubles to be added to.
 /// @param[in]  values (--) Comma-separated string of values.
@@ -82,6 +82,14 @@ class GunnsOptimMonteCarlo
         void addDriver(double* address);
         /// @brief Adds the set of values to drive the model driver input variables to for the next time step.
         void addDriverDataRow(const std::string& values);
+        /// @brief Adds the given values to the target trajectory of the model output variable at the given index.
+        void addOutputTrajectory(const unsigned int index, const std::vector<double>& values);
+        /// @brief Adds the given values to the trajectory of the model driver input variable at the given index.
+        void addDriverTrajectory(const unsigned int index, const std::vector<double>& values);
+        /// @brief Returns the number of model output variables.
+        unsigned int getNumOutputs() const;
+        /// @brief Returns the number of model driver input variables.
+        unsigned int getNumDrivers() const;
         /// @brief Sets the amount of detail printed to the console.
         void setVerbosityLevel(const unsigned int verbosity);
         /// @brief Trick "monte_slave_init" job, initializes the Slave role.
@@ -102,6 +110,8 @@ class GunnsOptimMonteCarlo
         void updateSlaveInputs();
         /// @brief Trick "scheduled job", drives outputs from the model cyclically in each Slave run.
         void updateSlaveOutputs();
+        /// @brief Returns the total cost function result of the model outputs for this run so far.
+        double computeSlaveCost();
 
     protected:
         std::string                             mName;             /**< *o (1) trick_chkpnt_io(**) Name of this instance for output messages. */
@@ -166,4 +176,24 @@ inline bool GunnsOptimMonteCarlo::isInitialized() const
     return mInitFlag;
 }
 
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @return   unsigned int (--) The number of model output variables.
+///
+/// @details  Returns the number of model output variables added by addOutput.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+inline unsigned int GunnsOptimMonteCarlo::getNumOutputs() const
+{
+    return mOutputs.size();
+}
+
+////////////////////////////////////////////////////////////////////////////////////////////////////
+/// @return   unsigned int (--) The number of model driver input variables.
+///
+/// @details  Returns the number of model driver input variables added by addDriver.
+////////////////////////////////////////////////////////////////////////////////////////////////////
+inline unsigned int GunnsOptimMonteCarlo::getNumDrivers() const
+{
+    return mDrivers.size();
+}
+
 #endif
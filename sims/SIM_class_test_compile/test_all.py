@@ -18,9 +18,8 @@
 #
 # This requires Trick 19 or later, and Python 3.
 #
-# This could be parallelized to run faster, but would take a lot of effort to set up.
-# Each core could run a separate class build, but would have to use separate ClassTest.sm
-# files and sim folders to avoid stepping on each other.
+# See test_parallel.py for a parallel version of this, that builds each class in a separate sim
+# folder per core, and skips the classes that haven't changed since their last passing build.
 
 import os
 import sys
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+#
+# @copyright Copyright 2023 United States Government as represented by the Administrator of the
+#            National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# This is a parallel, cached version of test_all.py.  It builds the SIM_class_test_compile sim for
+# every C++ class listed in gunns/lib/trick_if/S_source.hh, minus those listed in
+# class_ignore_list.py, the same as test_all.py, but:
+# - Each of the -j workers builds in its own copy of this sim folder, parallel/worker_<n>, with its
+#   own ClassTest.sm, so the classes build concurrently without stepping on each other.
+# - Each class is hashed with its header, its source file, and all of their transitive includes
+#   under GUNNS_HOME, plus this sim's files and the GUNNS libraries it links.  Classes whose hash
+#   is the same as their last passing build, in class_test_cache.json, are skipped.  --all
+#   rebuilds them anyway.
+# - The pass/fail/skip result, build time and build log file of each class are written to
+#   class_test_results.json, and the build output of each failed class is printed.
+#
+# A class passes if trick-CP succeeds, and its build/MAKE_err has no 'error', 'undefined' or
+# 'unresolved', the same criteria as test_all.py.  This exits with status 1 if any class fails.
+#
+# This requires Trick 19 or later, and Python 3.  Run from this sim folder:
+# $ python3 test_parallel.py [-j 8] [--all] [GunnsFluidTank GunnsElectBattery ...]
+
+import argparse
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.join(os.environ['GUNNS_HOME'], 'test', 'utils'))
+from include_hash import IncludeHasher
+
+# The files copied into each worker's sim folder, which are also part of every class's hash.
+SIM_FILES    = ['S_define', 'S_overrides.mk', 'gen_sm.py', 'class_custom_construction.py']
+WORKER_DIR   = 'parallel'
+CACHE_FILE   = 'class_test_cache.json'
+RESULTS_FILE = 'class_test_results.json'
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Build the class compile test sim for each class, in parallel.')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='number of concurrent class builds, default is the number of cores')
+    parser.add_argument('-a', '--all', action='store_true',
+                        help='build all classes, even those unchanged since their last passing build')
+    parser.add_argument('-t', '--timeout', type=float, default=1800.0,
+                        help='build timeout (s) of each class, default 1800')
+    parser.add_argument('classes', nargs='*', help='only test these classes')
+    return parser.parse_args()
+
+def listClasses(sourceFile, ignoreList):
+    """Returns the list of the (class type, header path) of the classes to test, from the
+       trickified library's S_source.hh, same as test_all.py."""
+    classes = []
+    with open(sourceFile, 'r') as fsources:
+        # each line is similar to:
+        # #include "aspects/dynamics/GunnsDynEuler321.hh"
+        for line in fsources:
+            classpath = line.strip()[len('#include'):].strip().strip('"') if line.strip() else ''
+            if classpath.endswith('.hh'):
+                classtype = os.path.basename(classpath).split('.')[0]
+                if classtype not in ignoreList:
+                    classes.append((classtype, classpath))
+    return classes
+
+def setupWorkers(numWorkers):
+    """Stamps out a copy of this sim folder for each worker, and returns the queue of their paths."""
+    workers = queue.Queue()
+    for worker in range(numWorkers):
+        path = os.path.abspath(os.path.join(WORKER_DIR, 'worker_' + str(worker)))
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        for name in SIM_FILES:
+            shutil.copy2(name, os.path.join(path, name))
+        workers.put(path)
+    return workers
+
+def buildClass(workers, classtype, classpath, timeout):
+    """Builds the sim for the class in the next free worker folder, and returns its result."""
+    worker = workers.get()
+    try:
+        logName = os.path.join(worker, classtype + '.log')
+        start   = time.time()
+        with open(logName, 'w') as log:
+            commands = [['make', 'clean'], ['python3', 'gen_sm.py', classpath], ['trick-CP']]
+            status = 0
+            for command in commands:
+                try:
+                    status = subprocess.call(command, cwd=worker, stdout=log, stderr=subprocess.STDOUT,
+                                             timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    log.write('\n' + ' '.join(command) + ' timed out after ' + str(timeout) + ' s\n')
+                    status = -1
+                if status != 0 and command[0] != 'make':
+                    break
+        errors = ''
+        errName = os.path.join(worker, 'build', 'MAKE_err')
+        if os.path.isfile(errName):
+            with open(errName, 'r', errors='replace') as f:
+                errors = f.read()
+        failed = status != 0 or 'error' in errors or 'undefined' in errors or 'unresolved' in errors
+        # Keep the failed build's log, as the next class in this folder will overwrite it.
+        if failed:
+            keptLog = os.path.abspath(os.path.join(WORKER_DIR, classtype + '.log'))
+            with open(logName, 'a') as log:
+                log.write(errors)
+            shutil.copy(logName, keptLog)
+            logName = keptLog
+        return {'class': classtype, 'header': classpath, 'status': 'fail' if failed else 'pass',
+                'seconds': round(time.time() - start, 1), 'log': logName}
+    finally:
+        workers.put(worker)
+
+def main():
+    args = parseArgs()
+    gunnsHome = os.environ['GUNNS_HOME']
+    exec(compile(open('class_ignore_list.py', "rb").read(), 'class_ignore_list.py', 'exec'), globals())
+    exec(compile(open('class_custom_construction.py', "rb").read(), 'class_custom_construction.py', 'exec'),
+         globals())
+
+    classes = listClasses(os.path.join(gunnsHome, 'lib', 'trick_if', 'S_source.hh'), class_ignore_list)
+    if args.classes:
+        classes = [entry for entry in classes if entry[0] in args.classes]
+
+    # The hash of every class includes this sim's files and the linked GUNNS libraries.
+    hasher = IncludeHasher([gunnsHome, os.path.join(gunnsHome, 'ms-utils'),
+                            os.path.join(gunnsHome, 'gunns-ts-models')])
+    common = [os.path.abspath(name) for name in SIM_FILES] \
+           + [os.path.join(gunnsHome, 'lib', 'trick', 'libgunns.a'),
+              os.path.join(gunnsHome, 'lib', 'trick_if', 'libgunns.o')]
+    commonHash = hasher.hash(common)
+
+    cache = {}
+    if os.path.isfile(CACHE_FILE):
+        with open(CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+
+    results = []
+    toBuild = []
+    for (classtype, classpath) in classes:
+        header = os.path.join(gunnsHome, classpath)
+        source = os.path.splitext(header)[0] + '.cpp'
+        custom = repr(class_custom_construction.get(classtype))
+        classHash = hasher.hash([header, source], commonHash + custom)
+        if not args.all and cache.get(classtype) == classHash:
+            results.append({'class': classtype, 'header': classpath, 'status': 'skip',
+                            'seconds': 0.0, 'log': None})
+        else:
+            toBuild.append((classtype, classpath, classHash))
+
+    print('Building ' + str(len(toBuild)) + ' classes with ' + str(args.jobs) + ' workers, skipping '
+          + str(len(results)) + ' unchanged classes.')
+    if toBuild:
+        workers = setupWorkers(min(args.jobs, len(toBuild)))
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            futures = dict((executor.submit(buildClass, workers, classtype, classpath, args.timeout),
+                            classHash) for (classtype, classpath, classHash) in toBuild)
+            for future in as_completed(futures):
+                classHash = futures[future]
+                result = future.result()
+                results.append(result)
+                print(result['status'].upper() + ' ' + result['class'] + ' (' + str(result['seconds']) + ' s)')
+                # Update the cache as each class finishes, so an interrupted run keeps its progress.
+                if result['status'] == 'pass':
+                    cache[result['class']] = classHash
+                else:
+                    cache.pop(result['class'], None)
+                with open(CACHE_FILE + '.tmp', 'w') as f:
+                    json.dump(cache, f, indent=1, sort_keys=True)
+                os.replace(CACHE_FILE + '.tmp', CACHE_FILE)
+
+    results.sort(key=lambda result: result['class'])
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump(results, f, indent=1)
+
+    failed = [result for result in results if result['status'] == 'fail']
+    for result in failed:
+        print('\n\nBuild output of failed class ' + result['class'] + ':\n')
+        with open(result['log'], 'r', errors='replace') as f:
+            print(f.read())
+    counts = dict((status, len([result for result in results if result['status'] == status]))
+                  for status in ('pass', 'fail', 'skip'))
+    print('\nPassed: ' + str(counts['pass']) + ', failed: ' + str(counts['fail']) + ', skipped: '
+          + str(counts['skip']) + '.  Results are in ' + RESULTS_FILE + '.')
+    if failed:
+        print('TEST FAILED')
+        sys.exit(1)
+    print('TEST PASSED')
+
+if __name__ == "__main__":
+    main()
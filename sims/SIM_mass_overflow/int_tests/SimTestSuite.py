@@ -7,40 +7,18 @@ INT_TESTER_HOME = os.environ["GUNNS_HOME"]+"/test/utils/intTester/"
 # Integration test includes
 #===============================================================================================
 execfile(INT_TESTER_HOME+"TestSuite.py")
-execfile("int_tests/TestOverflow1.py")
-execfile("int_tests/TestOverflow2.py")
-execfile("int_tests/TestOverflow3.py")
-execfile("int_tests/TestOverflow4.py")
-execfile("int_tests/TestOverflow5.py")
-execfile("int_tests/TestOverflow6.py")
-execfile("int_tests/TestOverflow7.py")
-execfile("int_tests/TestOverflow8.py")
-execfile("int_tests/TestOverflow9.py")
-execfile("int_tests/TestOverflow10.py")
-execfile("int_tests/TestOverflow11.py")
-execfile("int_tests/TestOverflow12.py")
+execfile(INT_TESTER_HOME+"ConservationTest.py")
+execfile("int_tests/FluidTypes.py")
+execfile("int_tests/FluidNetworkConstants.py")
+execfile("int_tests/ConservationTable.py")
 execfile("int_tests/TestOverflow12err.py")
-execfile("int_tests/TestOverflow13.py")
-execfile("int_tests/TestOverflow14.py")
 execfile("int_tests/TestOverflow14err.py")
 execfile("int_tests/TestOverflow15.py")
-execfile("int_tests/TestOverflow16.py")
-execfile("int_tests/TestOverflow17.py")
-execfile("int_tests/TestOverflow18.py")
-execfile("int_tests/TestOverflow19.py")
-execfile("int_tests/TestOverflow20.py")
-execfile("int_tests/TestOverflow21.py")
-execfile("int_tests/TestOverflow22.py")
 execfile("int_tests/TestOverflow23.py")
-execfile("int_tests/TestOverflow24.py")
 execfile("int_tests/TestOverflow25.py")
-execfile("int_tests/TestOverflow26.py")
-execfile("int_tests/TestOverflow27.py")
 execfile("int_tests/TestOverflow28.py")
-execfile("int_tests/TestOverflow29.py")
 execfile("int_tests/TestOverflow30.py")
 execfile("int_tests/TestOverflow31.py")
-execfile("int_tests/TestOverflow32.py")
 execfile("int_tests/TestOverflow33.py")
 execfile("int_tests/TestOverflow34.py")
 execfile("int_tests/TestOverflow35.py")
@@ -52,7 +30,6 @@ execfile("int_tests/TestOverflow40.py")
 execfile("int_tests/TestOverflow41.py")
 execfile("int_tests/TestOverflow42.py")
 execfile("int_tests/TestOverflow43.py")
-execfile("int_tests/TestOverflow44.py")
 execfile("int_tests/TestOverflow45.py")
 execfile("int_tests/TestOverflow45over.py")
 execfile("int_tests/TestOverflow46.py")
@@ -110,589 +87,40 @@ trick.add_read(0.0, """printTestSuiteHeader()""" )
 tearDownTime = 0.1
 simTestSuiteRunner = TestSuite(tearDownTime)
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest1 = TestOverflow1(
-# Test Name String
-"""GUNNS Mass Overflow Test 1""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 1       Mass Overflow Test 1
- Author              Jason Harvey
- Date                05/28/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow
-                     core/GunnsFluidCapacitor
-                     core/GunnsFluidConductor
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest2 = TestOverflow2(
-# Test Name String
-"""GUNNS Mass Overflow Test 2""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 2       Mass Overflow Test 2
- Author              Jason Harvey
- Date                05/28/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow2
-                     core/GunnsFluidSource
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest3 = TestOverflow3(
-# Test Name String
-"""GUNNS Mass Overflow Test 3""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 3       Mass Overflow Test 3
- Author              Jason Harvey
- Date                05/29/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow3
-                     aspects/fluid/conductor/GunnsFluidValve
-                     aspects/fluid/conductor/GunnsFluidPipe
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest4 = TestOverflow4(
-# Test Name String
-"""GUNNS Mass Overflow Test 4""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 4       Mass Overflow Test 4
- Author              Jason Harvey
- Date                05/29/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow4
-                     aspects/fluid/conductor/GunnsFluidHeatExchanger
-                     aspects/fluid/conductor/GunnsFluidSensor
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest5 = TestOverflow5(
-# Test Name String
-"""GUNNS Mass Overflow Test 5""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 5       Mass Overflow Test 5
- Author              Jason Harvey
- Date                05/29/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow5
-                     aspects/fluid/conductor/GunnsFluidSimpleQd
-                     aspects/fluid/conductor/GunnsFluidLeak
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest6 = TestOverflow6(
-# Test Name String
-"""GUNNS Mass Overflow Test 6""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 6       Mass Overflow Test 6
- Author              Jason Harvey
- Date                06/06/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow6
-                     aspects/fluid/conductor/GunnsFluid3WayValve
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest7 = TestOverflow7(
-# Test Name String
-"""GUNNS Mass Overflow Test 7""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 7       Mass Overflow Test 7
- Author              Jason Harvey
- Date                06/06/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow7
-                     aspects/fluid/conductor/GunnsFluid3WayCheckValve
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest8 = TestOverflow8(
-# Test Name String
-"""GUNNS Mass Overflow Test 8""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 8       Mass Overflow Test 8
- Author              Keaton Dodd
- Date                06/11/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow8
-                     aspects/fluid/conductor/GunnsFluidCheckValve
-                     aspects/fluid/conductor/GunnsFluidHatch
-                
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest9 = TestOverflow9(
-# Test Name String
-"""GUNNS Mass Overflow Test 9""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 9       Mass Overflow Test 9
- Author              Keaton Dodd
- Date                06/12/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow9
-                     aspects/fluid/conductor/GunnsFluidCondensingHxSeperator
-                     aspects/fluid/conductor/GunnsCondensingHx
-                
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-overflowTest10 = TestOverflow10(
-"""GUNNS Mass Overflow Test 10""",
-# Test Start Message
-"""
-=================================================================================================
- Test Number 10      Mass Overflow Test 10
- Author              Keaton Dodd
- Date                06/13/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow10
-                     aspects/fluid/conductor/GunnsFluidPhaseChangeConductor
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-overflowTest13 = TestOverflow13(
-"""GUNNS Mass Overflow Test 13""",
-# Test Start Message
-"""
-=================================================================================================
- Test Number 13      Mass Overflow Test 13
- Author              Jason Harvey
- Date                06/13/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow13
-                     aspects/fluid/conductor/GunnsFluidPressureSensitiveValve
-                     aspects/fluid/conductor/GunnsFluidRegulatorValve
-                     aspects/fluid/conductor/GunnsFluidReliefValve
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest14 = TestOverflow14(
-# Test Name String
-"""GUNNS Mass Overflow Test 14""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 14      Mass Overflow Test 14
- Author              Jason Harvey
- Date                06/13/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow14
-                     core/GunnsFluidPotential
- 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest14err = TestOverflow14err(
-# Test Name String
-"""GUNNS Mass Overflow Test 14 Expected Conservation Errors""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 14err   Mass Overflow Test 14 Expected Conservation Errors
- Author              Jason Harvey
- Date                06/13/2019
---------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow14
-                     core/GunnsFluidPotential
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in this
-                        network do not match between run start and run end, because of expected
-                        conservation errors due to the design limitation when there is a closed loop
-                        of links and overflowing nodes.
---------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
---------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest11 = TestOverflow11(
-# Test Name String
-"""GUNNS Mass Overflow Test 11""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 11   Mass Overflow Test 11
- Author              Jason Harvey
- Date                06/14/2019
---------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow11
-                     aspects/fluid/conductor/GunnsFluidBalancedPrv
-                     aspects/fluid/conductor/GunnsFluidLiquidWaterSensor
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
---------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
---------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest12 = TestOverflow12(
-# Test Name String
-"""GUNNS Mass Overflow Test 12""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 12      Mass Overflow Test 12
- Author              Jason Harvey
- Date                06/14/2019
---------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow12
-                     aspects/fluid/conductor/GunnsFluidHatch
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
-                        overflows during the run
---------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
---------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest12err = TestOverflow12err(
-# Test Name String
-"""GUNNS Mass Overflow Test 12 Expected Conservation Errors""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 12err   Mass Overflow Test 12
- Author              Jason Harvey
- Date                06/14/2019
---------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow12err
-                     aspects/fluid/conductor/GunnsFluidHatch
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in this
-                        network do not match between run start and run end, because of expected
-                        conservation errors due to the design limitation when there is a closed loop
-                        of links and overflowing nodes.
---------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
---------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-overflowTest15 = TestOverflow15(
-# Test Name String
-"""GUNNS Mass Overflow Test 15""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 15      Mass Overflow Test 15
- Author              Jason Harvey
- Date                06/17/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow15
-                     core/GunnsFluidExternalDemand
-                     core/GunnsFluidExternalSupply
- 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-
-overflowTest16 = TestOverflow16(
-# Test Name String
-"""GUNNS Mass Overflow Test 16""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 16      Mass Overflow Test 16
- Author              Jason Harvey
- Date                06/18/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow16
-                     aspects/fluid/conductor/GunnsFluidEqConductor
- 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest17 = TestOverflow17(
-# Test Name String
-"""GUNNS Mass Overflow Test 17""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 17      Mass Overflow Test 17
- Author              Jason Harvey
- Date                06/21/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow17
-                     aspects/fluid/capacitor/GunnsFluidTank
- 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest18 = TestOverflow18(
-# Test Name String
-"""GUNNS Mass Overflow Test 18""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 18      Mass Overflow Test 18
- Author              Jason Harvey
- Date                06/21/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow18
-                     aspects/fluid/capacitor/GunnsFluidBalloon
- 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
+# Construct a ConservationTest for each row of the conservation table, with its start message
+# from the table's template.  Tests that need a custom message or checks of their own are
+# constructed explicitly below.
+conservationTests = {}
+for number in sorted(conservationTable):
+    conservationTests[number] = ConservationTest(
+        "GUNNS Mass Overflow Test " + str(number),
+        conservationTable[number].startMessage(number),
+        "",
+        overflowConservation, conservationTable[number].check)
 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest19 = TestOverflow19(
+overflowTest14err = TestOverflow14err(
 # Test Name String
-"""GUNNS Mass Overflow Test 19""",
- # Test Start Message
- """
+"""GUNNS Mass Overflow Test 14 Expected Conservation Errors""",
+# Test Start Message
+"""
 =================================================================================================
  Test Suite          GUNNS SIM_mass_overflow
- Test Number 19      Mass Overflow Test 19
+ Test Number 14err   Mass Overflow Test 14 Expected Conservation Errors
  Author              Jason Harvey
- Date                06/25/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow19
-                     aspects/fluid/conductor/GunnsGasTurbine
-                     aspects/fluid/conductor/GunnsSimpleRocket
+ Date                06/13/2019
+--------------------------------------------------------------------------------------------------
+ Items under test    sims/networks/fluid/test/overfow/MassOverflow14
+                     core/GunnsFluidPotential
 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
+ Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in this
+                        network do not match between run start and run end, because of expected
+                        conservation errors due to the design limitation when there is a closed loop
+                        of links and overflowing nodes.
+--------------------------------------------------------------------------------------------------
  Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
                      2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
+--------------------------------------------------------------------------------------------------
  Test Output
 
 """,
@@ -700,48 +128,49 @@ overflowTest19 = TestOverflow19(
 "")
 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest20 = TestOverflow20(
+overflowTest12err = TestOverflow12err(
 # Test Name String
-"""GUNNS Mass Overflow Test 20""",
- # Test Start Message
- """
+"""GUNNS Mass Overflow Test 12 Expected Conservation Errors""",
+# Test Start Message
+"""
 =================================================================================================
  Test Suite          GUNNS SIM_mass_overflow
- Test Number 20      Mass Overflow Test 20
+ Test Number 12err   Mass Overflow Test 12
  Author              Jason Harvey
- Date                06/27/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow20
-                     aspects/fluid/hi-fi/GunnsFluidHiFiOrifice
-                     aspects/fluid/hi-fi/GunnsFluidHiFiValve
+ Date                06/14/2019
+--------------------------------------------------------------------------------------------------
+ Items under test    sims/networks/fluid/test/overfow/MassOverflow12err
+                     aspects/fluid/conductor/GunnsFluidHatch
 
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
+ Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in this
+                        network do not match between run start and run end, because of expected
+                        conservation errors due to the design limitation when there is a closed loop
+                        of links and overflowing nodes.
+--------------------------------------------------------------------------------------------------
  Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
                      2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
+--------------------------------------------------------------------------------------------------
  Test Output
 
 """,
 # Test finished message (no longer used)
 "")
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest21 = TestOverflow21(
+overflowTest15 = TestOverflow15(
 # Test Name String
-"""GUNNS Mass Overflow Test 21""",
+"""GUNNS Mass Overflow Test 15""",
  # Test Start Message
  """
 =================================================================================================
  Test Suite          GUNNS SIM_mass_overflow
- Test Number 21      Mass Overflow Test 21
+ Test Number 15      Mass Overflow Test 15
  Author              Jason Harvey
- Date                06/26/2019
+ Date                06/17/2019
 -------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow21
-                     core/GunnsFluidFlowController
-
+ Items under test    sims/networks/fluid/test/overfow/MassOverflow15
+                     core/GunnsFluidExternalDemand
+                     core/GunnsFluidExternalSupply
+ 
  Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
                         network  matches between run start and run end, when there are node
 -------------------------------------------------------------------------------------------------
@@ -753,34 +182,8 @@ overflowTest21 = TestOverflow21(
 """,
 # Test finished message (no longer used)
 "")
-
+ 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest22 = TestOverflow22(
-# Test Name String
-"""GUNNS Mass Overflow Test 22""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 22      Mass Overflow Test 22
- Author              Jason Harvey
- Date                06/26/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow22
-                     core/GunnsFluidJumper
-                     core/GunnsFluidSocket
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
 overflowTest23 = TestOverflow23(
@@ -811,34 +214,6 @@ overflowTest23 = TestOverflow23(
 # Test finished message (no longer used)
 "")
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest24 = TestOverflow24(
-# Test Name String
-"""GUNNS Mass Overflow Test 24""",
- # Test Start Message
- """
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 24      Mass Overflow Test 24
- Author              Keaton Dodd
- Date                06/28/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow24
-                     aspects/fluid/potential/GunnsGasFan
-                     aspects/fluid/potential/GunnsLiquidCentrifugalPump
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all nodes in each
-                        network  matches between run start and run end, when there are node
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
 overflowTest25 = TestOverflow25(
 # Test Name String
@@ -869,63 +244,6 @@ overflowTest25 = TestOverflow25(
 "")
 
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest26 = TestOverflow26(
-# Test Name String
-"""GUNNS Mass Overflow Test 26""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 26      Mass Overflow Test 26
- Author              Keaton Dodd 
- Date                07/08/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow26
-                     aspects/fluid/source/GunnsFluidEvaporation
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all fluids in the
-                        network matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest27 = TestOverflow27(
-# Test Name String
-"""GUNNS Mass Overflow Test 27""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 27      Mass Overflow Test 27
- Author              Keaton Dodd
- Date                07/09/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow27
-                     aspects/fluid/source/GunnsFluidReactor
-                     aspects/fluid/source/GunnsFluidHotReactor
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all fluids in the
-                        network matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
 overflowTest28 = TestOverflow28(
 # Test Name String
@@ -954,34 +272,6 @@ overflowTest28 = TestOverflow28(
 # Test finished message (no longer used)
 "")
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest29 = TestOverflow29(
-# Test Name String
-"""GUNNS Mass Overflow Test 29""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 29      Mass Overflow Test 29
- Author              Keaton Dodd
- Date                07/10/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow29
-                     aspects/fluid/source/GunnsFluidHeater
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all fluids in the
-                        network matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
- 
 
 # Construct a test by giving it a name string, a starting message string, and a finished message string
 overflowTest30 = TestOverflow30(
@@ -1040,35 +330,6 @@ overflowTest31 = TestOverflow31(
 "")
 
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest32 = TestOverflow32(
-# Test Name String
-"""GUNNS Mass Overflow Test 32""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 32      Mass Overflow Test 32
- Author              Keaton Dodd
- Date                07/12/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow32
-                     aspects/fluid/source/GunnsFluidSeperatorGas
-                     aspects/fluid/source/GunnsFluidGasDisplacementPump
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all fluids in the
-                        network matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
 # Construct a test by giving it a name string, a starting message string, and a finished message string
 overflowTest33 = TestOverflow33(
 # Test Name String
@@ -1379,34 +640,6 @@ overflowTest43 = TestOverflow43(
 # Test finished message (no longer used)
 "")
 
-# Construct a test by giving it a name string, a starting message string, and a finished message string
-overflowTest44 = TestOverflow44(
-# Test Name String
-"""GUNNS Mass Overflow Test 44""",
-# Test Start Message
-"""
-=================================================================================================
- Test Suite          GUNNS SIM_mass_overflow
- Test Number 44      Mass Overflow Test 44
- Author              Keaton Dodd
- Date                07/25/2019
--------------------------------------------------------------------------------------------------
- Items under test    sims/networks/fluid/test/overfow/MassOverflow44
-                     aspects/fluid/conductor/GunnsFluidHxDynHtc
-
- Test Objectives     1) Verify total mass & energy, constituent masses of all fluids in the
-                        network matches between run start and run end, when there are node
-                        overflows during the run
--------------------------------------------------------------------------------------------------
- Initial Conditions  1) network at default initial conditions from the GunnDraw drawing
-                     2) overrides from RUN_test/input.py.
--------------------------------------------------------------------------------------------------
- Test Output
-
-""",
-# Test finished message (no longer used)
-"")
-
 # Construct a test by giving it a name string, a starting message string, and a finished message string
 overflowTest45 = TestOverflow45(
 # Test Name String
@@ -1547,58 +780,36 @@ overflowTest48 = TestOverflow48(
 # Test finished message (no longer used)
 "")
 
-# After constructing your test, register the test with your test suite.
-simTestSuiteRunner.registerTest(overflowTest1)
-simTestSuiteRunner.registerTest(overflowTest2)
-simTestSuiteRunner.registerTest(overflowTest3)
-simTestSuiteRunner.registerTest(overflowTest4)
-simTestSuiteRunner.registerTest(overflowTest5)
-simTestSuiteRunner.registerTest(overflowTest6)
-simTestSuiteRunner.registerTest(overflowTest7)
-simTestSuiteRunner.registerTest(overflowTest8)
-simTestSuiteRunner.registerTest(overflowTest9)
-simTestSuiteRunner.registerTest(overflowTest10)
-simTestSuiteRunner.registerTest(overflowTest13)
-simTestSuiteRunner.registerTest(overflowTest14)
-simTestSuiteRunner.registerTest(overflowTest14err)
-simTestSuiteRunner.registerTest(overflowTest11)
-simTestSuiteRunner.registerTest(overflowTest12)
-simTestSuiteRunner.registerTest(overflowTest12err)
-simTestSuiteRunner.registerTest(overflowTest15)
-simTestSuiteRunner.registerTest(overflowTest16)
-simTestSuiteRunner.registerTest(overflowTest17)
-simTestSuiteRunner.registerTest(overflowTest18)
-simTestSuiteRunner.registerTest(overflowTest19)
-simTestSuiteRunner.registerTest(overflowTest20)
-simTestSuiteRunner.registerTest(overflowTest21)
-simTestSuiteRunner.registerTest(overflowTest22)
-simTestSuiteRunner.registerTest(overflowTest23)
-simTestSuiteRunner.registerTest(overflowTest24)
-simTestSuiteRunner.registerTest(overflowTest25)
-simTestSuiteRunner.registerTest(overflowTest26)
-simTestSuiteRunner.registerTest(overflowTest27)
-simTestSuiteRunner.registerTest(overflowTest28)
-simTestSuiteRunner.registerTest(overflowTest29)
-simTestSuiteRunner.registerTest(overflowTest30)
-simTestSuiteRunner.registerTest(overflowTest31)
-simTestSuiteRunner.registerTest(overflowTest32)
-simTestSuiteRunner.registerTest(overflowTest33)
-simTestSuiteRunner.registerTest(overflowTest34)
-simTestSuiteRunner.registerTest(overflowTest35)
-simTestSuiteRunner.registerTest(overflowTest36)
-simTestSuiteRunner.registerTest(overflowTest37)
-simTestSuiteRunner.registerTest(overflowTest38)
-simTestSuiteRunner.registerTest(overflowTest39)
-simTestSuiteRunner.registerTest(overflowTest40)
-simTestSuiteRunner.registerTest(overflowTest41)
-simTestSuiteRunner.registerTest(overflowTest42)
-simTestSuiteRunner.registerTest(overflowTest43)
-simTestSuiteRunner.registerTest(overflowTest44)
-simTestSuiteRunner.registerTest(overflowTest45)
-simTestSuiteRunner.registerTest(overflowTest45over)
-simTestSuiteRunner.registerTest(overflowTest46)
-simTestSuiteRunner.registerTest(overflowTest47)
-simTestSuiteRunner.registerTest(overflowTest48)
+# After constructing your test, register the test with your test suite, along with its network's
+# update job, which is turned off when the test suite is sharded and this test is in another
+# shard (see run_shards.py).
+for number in sorted(conservationTests):
+    simTestSuiteRunner.registerTest(conservationTests[number],
+                                    ["massOverflow." + conservationTable[number].networkName(number) + ".update"])
+simTestSuiteRunner.registerTest(overflowTest14err, ["massOverflow.fluid14err.update"])
+simTestSuiteRunner.registerTest(overflowTest12err, ["massOverflow.fluid12err.update"])
+simTestSuiteRunner.registerTest(overflowTest15, ["massOverflow.fluid15.update"])
+simTestSuiteRunner.registerTest(overflowTest23, ["massOverflow.fluid23.update"])
+simTestSuiteRunner.registerTest(overflowTest25, ["massOverflow.fluid25.update"])
+simTestSuiteRunner.registerTest(overflowTest28, ["massOverflow.fluid28.update"])
+simTestSuiteRunner.registerTest(overflowTest30, ["massOverflow.fluid30.update"])
+simTestSuiteRunner.registerTest(overflowTest31, ["massOverflow.fluid31.update"])
+simTestSuiteRunner.registerTest(overflowTest33, ["massOverflow.fluid33.update"])
+simTestSuiteRunner.registerTest(overflowTest34, ["massOverflow.fluid34.update"])
+simTestSuiteRunner.registerTest(overflowTest35, ["massOverflow.fluid35.update"])
+simTestSuiteRunner.registerTest(overflowTest36, ["massOverflow.fluid36.update"])
+simTestSuiteRunner.registerTest(overflowTest37, ["massOverflow.fluid37.update"])
+simTestSuiteRunner.registerTest(overflowTest38, ["massOverflow.fluid38.update"])
+simTestSuiteRunner.registerTest(overflowTest39, ["massOverflow.fluid39.update"])
+simTestSuiteRunner.registerTest(overflowTest40, ["massOverflow.fluid40.update"])
+simTestSuiteRunner.registerTest(overflowTest41, ["massOverflow.fluid41.update"])
+simTestSuiteRunner.registerTest(overflowTest42, ["massOverflow.fluid42.update"])
+simTestSuiteRunner.registerTest(overflowTest43, ["massOverflow.fluid43.update"])
+simTestSuiteRunner.registerTest(overflowTest45, ["massOverflow.fluid45.update"])
+simTestSuiteRunner.registerTest(overflowTest45over, ["massOverflow.fluid45over.update"])
+simTestSuiteRunner.registerTest(overflowTest46, ["massOverflow.fluid46.update"])
+simTestSuiteRunner.registerTest(overflowTest47, ["massOverflow.fluid47.update"])
+simTestSuiteRunner.registerTest(overflowTest48, ["massOverflow.fluid48.update"])
 
 # To run all registered tests within the test suite, add a read job to call runAllTests().
 trick.add_read(0.0, """simTestSuiteRunner.runAllTests()""" )
@@ -72,36 +72,21 @@ trick_mc.mc.add_variable(mcvar)
 for var in output_vars:
     mc.monteCarlo.addOutput(var[0], trick.get_address(var[0]), var[1], var[2])
 
-# Add the scripted input driver data to the model
-try:
-    with open('input_driver_data.csv', 'r') as f:
-        lines = f.readlines()
-        var_list = lines[0].strip().split(',')
-        for var in var_list[1:]:
-            mc.monteCarlo.addDriver(trick.get_address(var))
-        for line in lines[1:]:
-            mc.monteCarlo.addDriverDataRow(line.strip())
-        f.close()
-except:
-    pass
-
-# Add the desired output target data to the model
-try:
-    with open('output_target_data.csv', 'r') as f:
-        lines = f.readlines()
-        var_list = lines[0].strip().split(',')
-#        for var in var_list[1:]:
-#            mc.monteCarlo.addOutTargetDouble(var, trick.get_address(var))
-        for line in lines[1:]:
-            mc.monteCarlo.addOutputDataRow(line.strip())
-        f.close()
-except:
-    pass
+# Add the scripted input driver data and the desired output target data to the model.
+import os
+import sys
+sys.path.insert(0, os.getcwd())
+import mc_data
+if os.path.exists('input_driver_data.csv'):
+    mc_data.loadDrivers(mc.monteCarlo, 'input_driver_data.csv', trick.get_address)
+if os.path.exists('output_target_data.csv'):
+    mc_data.loadTargets(mc.monteCarlo, 'output_target_data.csv', [var[0] for var in output_vars])
 
 # Enable Monte Carlo.
 trick.mc_set_enabled(1)
 
-# Add a Monte Carlo slave for each core.
+# Add a Monte Carlo slave for each core.  For short runs, the persistent sim worker pool in
+# mc_pool.py (RUN_mc/input_worker.py) avoids the startup of a new Slave process for each run.
 #import multiprocessing
 #for i in range(multiprocessing.cpu_count()):
 #    trick.mc_add_slave("localhost")
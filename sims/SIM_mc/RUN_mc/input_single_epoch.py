@@ -5,7 +5,7 @@
 trick.sim_services.exec_set_trap_sigfpe(1)
 
 # Create a PSO configuration data object.
-thePsoConfig = trick.GunnsOptimPsoConfigData()
+thePsoConfig = trick.GunnsOptimParticleSwarmConfigData()
 
 # Load the configuration for this epoch
 f = "RUN_mc/epoch_configuration.py"
@@ -43,7 +43,7 @@ mc.monteCarlo.mOptimizer.setConfigData(thePsoConfig)
 # Add the Slave input variables (currently only doubles are supported).
 for var in input_vars:
     # Register MC variable with the Master/Optimizer
-    mc.monteCarlo.addInput(trick.get_address(var[0]), var[2], var[3], var[0])
+    mc.monteCarlo.addInput(var[0], trick.get_address(var[0]), var[2], var[3])
     # Create a calculated variable and add it to Monte Carlo.
     mcvar = trick.MonteVarCalculated(var[0], var[1])
     trick_mc.mc.add_variable(mcvar)
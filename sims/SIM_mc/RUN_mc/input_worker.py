@@ -0,0 +1,50 @@
+# @copyright Copyright 2023 United States Government as represented by the Administrator of the
+#            National Aeronautics and Space Administration.  All Rights Reserved. */
+#
+# Input file for the sim workers of the persistent worker pool, see mc_pool.py.  This sets up the
+# model outputs, drivers and targets the same as input.py, but without Monte Carlo or an optimizer:
+# the pool's manager is the optimizer, and sends the input variable vectors of the runs to the
+# workers.  This isn't run directly, but by SimWorkerPool.
+#
+#trick setup
+trick.sim_services.exec_set_trap_sigfpe(1)
+
+import os
+import sys
+sys.path.insert(0, os.getcwd())
+import mc_data
+import mc_pool
+
+# Apply constraints between input variables, same as input.py.
+constraint = trick.GunnsOptimMonteCarloConstraint(trick.LinearFit(0.0, 2.0, 0.0, 0.01),
+                                                  trick.get_address('mc.model.netConfig.conductor1.mMaxConductivity'))
+
+# List of tuples of [name, units, min range, max range, constraint], in the order of the pool's
+# input variable vectors.  The ranges are given to the pool's optimizer.
+input_vars = [
+    ['mc.model.netConfig.conductor1.mMaxConductivity', '1', 0.0, 0.01,   0],
+    ['mc.model.netConfig.conductor2.mMaxConductivity', '1', 0.0, 0.02,   0],
+    #['mc.model.netConfig.conductor2.mMaxConductivity', '1', 0.0, 0.02,   constraint],
+    ['mc.model.netConfig.valve1.mMaxConductivity',     '1', 0.0, 0.005,  0],
+    ['mc.model.netConfig.valve2.mMaxConductivity',     '1', 0.0, 0.0025, 0],
+    ]
+
+# List of tuples of [name, target value, cost weight]
+output_vars = [
+    ['mc.model.netNodes[1].mContent.mPressure', 101.0447089840857,     1.0],
+    ['mc.model.netNodes[2].mContent.mPressure',  90.37713522203975,    1.0],
+    ['mc.model.conductor1.mFlowRate',             0.01824900229844743, 1.0],
+    ['mc.model.conductor2.mFlowRate',             0.03649800459689486, 1.0],
+    ]
+
+# Add the model output variables.
+for var in output_vars:
+    mc.monteCarlo.addOutput(var[0], trick.get_address(var[0]), var[1], var[2])
+
+# Add the scripted input driver data and the desired output target data to the model.
+mc_data.loadDrivers(mc.monteCarlo, 'input_driver_data.csv', trick.get_address)
+mc_data.loadTargets(mc.monteCarlo, 'output_target_data.csv', [var[0] for var in output_vars])
+
+# Serve runs to the pool until it closes.  Each run is forked from here, sets its input variables,
+# then continues through init and runs to the stop time, same as an MC Slave run in input.py.
+mc_pool.serve(globals(), input_vars, 10.1, [var[0] for var in output_vars])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Memoized run results for optimizer runs.
+#
+# Optimizers often evaluate the same input variable vector more than once: the PSO's min/max
+# corner initializations, gradient descent probes, converged particles, and every run again when a
+# tuning session is repeated or restarted.  This cache stores the cost and model outputs of each
+# run, keyed by its input variable vector, quantized to a number of significant digits, so the
+# repeat runs can be skipped.
+#
+# Costs are only valid for the same model and data, so each entry is also keyed by a context hash
+# of the sim executable (the model build), the input file and the driver and target data files.
+# Entries of other contexts are ignored, so a rebuild or new data never returns stale costs.
+#
+# The store is an append-only file of JSON lines, one per run, so it is never rewritten and many
+# sessions can share it.  A partial last line from a crash is skipped when loading, and ended with a
+# newline before the next append so it doesn't corrupt the appended entry.  SimWorkerPool
+# (mc_pool.py) consults this before dispatching its runs.
+
+import hashlib
+import json
+import os
+
+class RunCache(object):
+    """Cache of the costs of runs, by their input variable vectors, in an append-only store.
+
+       Attributes
+       fileName      The path/name of the store file.
+       context       The context hash of the model and data the costs are for.
+       digits        The number of significant digits the input variables are quantized to.
+       costs         Dictionary of the costs in this context, by the quantized input vector.
+       outputs       Dictionary of the model outputs of the cached runs, where stored, by the
+                     quantized input vector.
+       numHits       The number of lookups that found a cost.
+       numMisses     The number of lookups that didn't find a cost.
+       needsNewline  True if the store doesn't end with a newline, from a partial last line, so
+                     one must be written before the next append.
+    """
+
+    def __init__(self, fileName, context, digits=10):
+        """ RunCache class constructor """
+        self.fileName     = fileName
+        self.context      = context
+        self.digits       = digits
+        self.costs        = {}
+        self.outputs      = {}
+        self.numHits      = 0
+        self.numMisses    = 0
+        self.needsNewline = False
+        self.load()
+
+    @staticmethod
+    def hashFiles(fileNames):
+        """Returns the context hash of the contents of the files.  Missing files hash as empty, so
+           optional data files don't need to exist."""
+        digest = hashlib.sha256()
+        for fileName in fileNames:
+            digest.update(os.path.basename(fileName).encode() + b'\0')
+            if os.path.exists(fileName):
+                with open(fileName, 'rb') as f:
+                    for block in iter(lambda: f.read(1 << 20), b''):
+                        digest.update(block)
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def key(self, vector):
+        """Returns the cache key of the input variable vector, its values quantized to the number
+           of significant digits."""
+        return tuple(float('%.*g' % (self.digits, value)) for value in vector)
+
+    def load(self):
+        """Loads the costs of this context from the store, if it exists."""
+        if not os.path.exists(self.fileName):
+            return
+        with open(self.fileName, 'r') as f:
+            for line in f:
+                self.needsNewline = not line.endswith('\n')
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('context') == self.context:
+                    self.costs[tuple(entry['inputs'])] = entry['cost']
+                    if entry.get('outputs') is not None:
+                        self.outputs[tuple(entry['inputs'])] = entry['outputs']
+
+    def lookup(self, vector):
+        """Returns the cached cost of the input variable vector, or None."""
+        cost = self.costs.get(self.key(vector))
+        if cost is None:
+            self.numMisses += 1
+        else:
+            self.numHits += 1
+        return cost
+
+    def lookupOutputs(self, vector):
+        """Returns the cached model outputs of the input variable vector, or None."""
+        return self.outputs.get(self.key(vector))
+
+    def store(self, vector, cost, outputs=None):
+        """Caches the cost and model outputs of the input variable vector, and appends them to the
+           store.  Failed runs, with no cost, aren't cached."""
+        if cost is None:
+            return
+        key = self.key(vector)
+        if key in self.costs:
+            return
+        self.costs[key] = cost
+        entry = {'context': self.context, 'inputs': list(key), 'cost': cost}
+        if outputs is not None:
+            self.outputs[key] = list(outputs)
+            entry['outputs']  = list(outputs)
+        with open(self.fileName, 'a') as f:
+            if self.needsNewline:
+                f.write('\n')
+                self.needsNewline = False
+            f.write(json.dumps(entry) + '\n')
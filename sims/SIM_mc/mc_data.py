@@ -0,0 +1,101 @@
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Loader of the Monte Carlo driver and target data CSV files, for the input files.
+#
+# The driver (input_driver_data.csv) and target (output_target_data.csv) files are Trick-style CSV
+# logs: a header row of the variable names, with optional {units}, the first of which is the sim
+# time, then one row per model step.  Rather than pass each row to GunnsOptimMonteCarlo as a string
+# for it to parse, this parses the whole file at once with NumPy and passes each variable's whole
+# column to the model in one call (addDriverTrajectory, addOutputTrajectory).
+#
+# A parsed file of at least CACHE_BYTES is also saved next to it as a NumPy .npy file, which later
+# loads memory-mapped instead of parsing the CSV again, until the CSV changes.
+#
+# The header is validated against the model's variables before anything is loaded: the driver
+# columns against the given driver names, and the target columns against the names and order of
+# the model outputs, since the targets are assigned to the outputs by position.  The data must be
+# all finite numbers.  Errors raise ValueError with the file, column and row.
+#
+# Example, in an input file after the outputs are added:
+#
+#   import mc_data
+#   mc_data.loadDrivers(mc.monteCarlo, 'input_driver_data.csv', trick.get_address)
+#   mc_data.loadTargets(mc.monteCarlo, 'output_target_data.csv', [var[0] for var in output_vars])
+
+import os
+import re
+
+import numpy
+
+# Parsed files at least this big are cached as memory-mapped .npy files.
+CACHE_BYTES = 1 << 20
+
+def columnName(cell):
+    """Returns the variable name of the header cell, without its {units}."""
+    return re.sub(r'\{.*\}$', '', cell.strip())
+
+def readCsv(fileName):
+    """Returns the list of the variable names in the CSV file's header, and the 2-D array of its
+       data, one row per model step.  Big files are cached, and loaded memory-mapped when the cache
+       is newer than the CSV file."""
+    with open(fileName, 'r') as f:
+        names = [columnName(cell) for cell in f.readline().split(',')]
+    cacheName = fileName + '.npy'
+    if os.path.exists(cacheName) and os.path.getmtime(cacheName) >= os.path.getmtime(fileName):
+        data = numpy.load(cacheName, mmap_mode='r')
+    else:
+        data = numpy.loadtxt(fileName, delimiter=',', skiprows=1, ndmin=2)
+        if os.path.getsize(fileName) >= CACHE_BYTES:
+            try:
+                numpy.save(cacheName, data)
+            except (IOError, OSError):
+                pass
+    if data.shape[0] > 0 and data.shape[1] != len(names):
+        raise ValueError(fileName + ' has ' + str(len(names)) + ' columns in its header but '
+                         + str(data.shape[1]) + ' in its data.')
+    return (names, data)
+
+def validateData(fileName, names, data):
+    """Raises ValueError if the data aren't all finite."""
+    bad = numpy.argwhere(~numpy.isfinite(data))
+    if len(bad) > 0:
+        (row, col) = bad[0]
+        raise ValueError(fileName + ' has a non-finite value in column ' + names[col] + ', data row '
+                         + str(row + 1) + '.')
+
+def loadDrivers(monteCarlo, fileName, getAddress, drivers=None):
+    """Loads the driver trajectories from the CSV file.  If the model has no drivers yet, the
+       file's variables are added as the drivers, with their addresses from getAddress, such as
+       trick.get_address.  Otherwise the file's variables must be the given driver names, in the
+       order they were added.  Returns the number of model steps loaded."""
+    (names, data) = readCsv(fileName)
+    names = names[1:]
+    if monteCarlo.getNumDrivers() == 0:
+        addresses = [getAddress(name) for name in names]
+        for (name, address) in zip(names, addresses):
+            if address is None:
+                raise ValueError(fileName + ' driver ' + name + ' is not a sim variable.')
+        for address in addresses:
+            monteCarlo.addDriver(address)
+    elif drivers is None or list(drivers) != names:
+        raise ValueError(fileName + ' drivers ' + str(names) + " don't match the model drivers "
+                         + str(drivers) + '.')
+    validateData(fileName, ['time'] + names, data)
+    for col in range(len(names)):
+        monteCarlo.addDriverTrajectory(col, data[:, col + 1].tolist())
+    return data.shape[0]
+
+def loadTargets(monteCarlo, fileName, outputs):
+    """Loads the target trajectories of the model outputs from the CSV file.  The file's variables
+       must be the given output names, in the order the outputs were added.  Returns the number of
+       model steps loaded."""
+    (names, data) = readCsv(fileName)
+    names = names[1:]
+    if list(outputs) != names or monteCarlo.getNumOutputs() != len(names):
+        raise ValueError(fileName + ' targets ' + str(names) + " don't match the model outputs "
+                         + str(list(outputs)) + '.')
+    validateData(fileName, ['time'] + names, data)
+    for col in range(len(names)):
+        monteCarlo.addOutputTrajectory(col, data[:, col + 1].tolist())
+    return data.shape[0]
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Batched Python optimizer plugins.
+#
+# The C++ optimizers (GunnsOptimFactory PSO and GRADIENT_DESCENT) propose one Slave run at a time
+# to the Trick MC Master.  A Python optimizer plugin instead proposes a whole batch of input
+# variable vectors, such as a population of differential evolution or CMA-ES, and is told all of
+# their costs at once.  The batches are evaluated by a SimWorkerPool (mc_pool.py), which keeps all
+# of its workers busy, optionally through a SurrogateScreen (mc_surrogate.py).  The input variables
+# and their ranges, constraints, model outputs and targets are the ones registered in the worker
+# input file, the same as in input.py.
+#
+# A plugin subclasses BatchOptimizer and implements propose and tell, which are abstract, so an
+# incomplete plugin fails when it is constructed.  DifferentialEvolution is provided.
+# StandInObjective is a local, Trick-free cost function with the same batch interface as the pool,
+# for developing and testing plugins.
+#
+# Run this from the sim directory, on the stand-in objective or on sim workers:
+#   python3 mc_optim.py [--generations N] [--population N] [--workers N]
+
+import abc
+import argparse
+import random
+
+class BatchOptimizer(abc.ABC):
+    """Abstract base class of the batched optimizer plugins.
+
+       Attributes
+       inputs      List of the (name, minimum, maximum) of the input variables.
+       generation  The number of batches told so far.
+       maxGenerations The number of batches to optimize over.
+       bestVector  The input vector of the lowest cost so far, or None.
+       bestCost    The lowest cost so far, or None.
+       random      The plugin's random generator.
+    """
+
+    def __init__(self, inputs, maxGenerations=100, seed=42):
+        """ BatchOptimizer class constructor """
+        for (name, minimum, maximum) in inputs:
+            if minimum is None or maximum is None or not minimum <= maximum:
+                raise ValueError('input ' + name + ' needs a min range <= max range.')
+        self.inputs         = list(inputs)
+        self.generation     = 0
+        self.maxGenerations = maxGenerations
+        self.bestVector     = None
+        self.bestCost       = None
+        self.random         = random.Random(seed)
+
+    @abc.abstractmethod
+    def propose(self):
+        """Returns the list of the input vectors of the next batch to evaluate."""
+
+    @abc.abstractmethod
+    def tell(self, vectors, costs):
+        """Updates the optimizer with the costs of the proposed batch of vectors.  Failed or
+           unevaluated runs have cost None.  Subclasses must call this base method, which tracks
+           the best vector and counts the generations."""
+        for (vector, cost) in zip(vectors, costs):
+            if cost is not None and (self.bestCost is None or cost < self.bestCost):
+                self.bestCost   = cost
+                self.bestVector = list(vector)
+        self.generation += 1
+
+    def isDone(self):
+        return self.generation >= self.maxGenerations
+
+    def clip(self, vector):
+        """Returns the vector limited to the input variable ranges."""
+        return [min(max(value, minimum), maximum)
+                for (value, (name, minimum, maximum)) in zip(vector, self.inputs)]
+
+    def randomVector(self):
+        return [self.random.uniform(minimum, maximum) for (name, minimum, maximum) in self.inputs]
+
+class DifferentialEvolution(BatchOptimizer):
+    """Differential evolution (DE/rand/1/bin) plugin.  Each generation proposes one trial vector
+       per population member, which replaces the member if its cost is no worse.
+
+       Attributes
+       populationSize The number of population members.
+       weight      The differential weight F.
+       crossover   The crossover probability CR.
+       population  List of the population member vectors.
+       costs       List of the population member costs, None until evaluated.
+    """
+
+    def __init__(self, inputs, populationSize=30, maxGenerations=100, weight=0.7, crossover=0.9,
+                 seed=42):
+        """ DifferentialEvolution class constructor """
+        BatchOptimizer.__init__(self, inputs, maxGenerations, seed)
+        if populationSize < 4:
+            raise ValueError('differential evolution needs a population of at least 4.')
+        self.populationSize = populationSize
+        self.weight         = weight
+        self.crossover      = crossover
+        self.population     = [self.randomVector() for member in range(populationSize)]
+        self.costs          = [None] * populationSize
+
+    def propose(self):
+        # The first generation evaluates the initial population.
+        if self.generation == 0:
+            return [list(member) for member in self.population]
+        trials = []
+        numVars = len(self.inputs)
+        for member in range(self.populationSize):
+            (a, b, c) = self.random.sample([other for other in range(self.populationSize)
+                                            if other != member], 3)
+            forced = self.random.randrange(numVars)
+            trial  = list(self.population[member])
+            for var in range(numVars):
+                if var == forced or self.random.random() < self.crossover:
+                    trial[var] = self.population[a][var] + self.weight \
+                               * (self.population[b][var] - self.population[c][var])
+            trials.append(self.clip(trial))
+        return trials
+
+    def tell(self, vectors, costs):
+        for (member, (vector, cost)) in enumerate(zip(vectors, costs)):
+            if cost is None:
+                continue
+            if self.costs[member] is None or cost <= self.costs[member]:
+                self.population[member] = list(vector)
+                self.costs[member]      = cost
+        BatchOptimizer.tell(self, vectors, costs)
+
+class StandInObjective(object):
+    """Local stand-in for the sim's cost function, for testing optimizer plugins without Trick.
+       The cost is the sum of the squared errors of the inputs from a target vector, each scaled
+       by its range, plus optional Gaussian noise.  It has the same evaluate interface as
+       SimWorkerPool.
+
+       Attributes
+       inputs      List of the (name, minimum, maximum) of the input variables.
+       target      The input vector of zero cost.
+       noise       The standard deviation of the noise added to the cost.
+       numRuns     The number of vectors evaluated.
+    """
+
+    def __init__(self, inputs, target=None, noise=0.0, seed=1):
+        """ StandInObjective class constructor """
+        self.inputs  = list(inputs)
+        self.random  = random.Random(seed)
+        self.target  = target if target is not None else \
+                       [minimum + 0.4 * (maximum - minimum) for (name, minimum, maximum) in inputs]
+        self.noise   = noise
+        self.numRuns = 0
+
+    def evaluate(self, vectors, epoch=None):
+        costs = []
+        for vector in vectors:
+            cost = 0.0
+            for (value, target, (name, minimum, maximum)) in zip(vector, self.target, self.inputs):
+                cost += ((value - target) / ((maximum - minimum) or 1.0)) ** 2
+            if self.noise > 0.0:
+                cost += self.random.gauss(0.0, self.noise)
+            costs.append(cost)
+        self.numRuns += len(vectors)
+        return costs
+
+def optimize(optimizer, evaluate, verbose=True):
+    """Runs the optimizer plugin to completion, evaluating each of its batches with the evaluate
+       function, such as SimWorkerPool.evaluate.  Returns the best vector and its cost."""
+    while not optimizer.isDone():
+        vectors = optimizer.propose()
+        optimizer.tell(vectors, evaluate(vectors))
+        if verbose:
+            print('generation ' + str(optimizer.generation) + ' best cost: ' + repr(optimizer.bestCost))
+    return (optimizer.bestVector, optimizer.bestCost)
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Optimize with a batched Python optimizer plugin.')
+    parser.add_argument('-g', '--generations', type=int, default=100, help='number of generations')
+    parser.add_argument('-p', '--population', type=int, default=30, help='population size')
+    parser.add_argument('-w', '--workers', type=int, default=0,
+                        help='number of sim workers, default 0 uses the stand-in objective')
+    return parser.parse_args()
+
+def main():
+    args = parseArgs()
+    if args.workers > 0:
+        from mc_pool import SimWorkerPool
+        with SimWorkerPool(args.workers) as pool:
+            optimizer = DifferentialEvolution(pool.inputs, args.population, args.generations)
+            (vector, cost) = optimize(optimizer, pool.evaluate)
+    else:
+        inputs = [('x' + str(var), 0.0, 1.0) for var in range(4)]
+        optimizer = DifferentialEvolution(inputs, args.population, args.generations)
+        (vector, cost) = optimize(optimizer, StandInObjective(inputs).evaluate)
+    names = [name for (name, minimum, maximum) in optimizer.inputs]
+    print('Best cost: ' + repr(cost))
+    for (name, value) in zip(names, vector):
+        print('  ' + name + ' = ' + repr(value))
+
+if __name__ == "__main__":
+    main()
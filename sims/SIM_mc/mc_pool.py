@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Persistent sim worker pool for optimizer runs.
+#
+# For short runs, most of a Trick MC Slave run, or of a fresh sim per pso.py epoch, is process
+# startup and input processing rather than the run itself.  This pool starts a number of long-lived
+# sim workers once, each with RUN_mc/input_worker.py.  Each worker processes the input file once,
+# up to the point just before initialization, and then serves runs: for each input variable vector
+# it receives, it forks a copy of itself from that point, the same way Trick MC Slaves fork their
+# runs.  The copy sets the input variables, initializes the network with them, runs to the stop
+# time and sends back the run's cost (GunnsOptimMonteCarlo::computeSlaveCost).  So every run
+# starts from the same initial state without starting a new process, and the runs of all the
+# workers go in parallel.
+#
+# The pool and the workers talk over a local socket (multiprocessing.connection), authenticated
+# with a random key.  The manager side is SimWorkerPool, and the sim side is serve(), called at
+# the end of the worker input file.
+#
+# With a cache file, the pool first looks up each run's cost in the run cache (mc_cache.py), and
+# only dispatches the runs it hasn't already run with the same sim build and data.  Identical runs
+# in one batch are only run once.
+#
+# With a ResultStore (mc_results.py), the pool appends the inputs, model outputs and cost of each
+# run to the store as the run finishes.  Runs whose costs came from the cache, or that duplicate
+# another run of the batch, are also added, with their cached or duplicated outputs.
+#
+# Example, from the sim directory, to evaluate a batch of input vectors on one worker per core:
+#
+#   from mc_pool import SimWorkerPool
+#   with SimWorkerPool(cacheFile='mc_run_cache.jsonl') as pool:
+#       costs = pool.evaluate([[0.01, 0.02, 0.005, 0.0025], [0.005, 0.01, 0.0025, 0.001]])
+
+import glob
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError, Pipe
+from multiprocessing.connection import Client, Listener, wait
+
+from mc_cache import RunCache
+
+# Environment variables that give each worker the pool's address, key and its worker ID.
+ADDRESS_ENV = 'MC_WORKER_ADDRESS'
+AUTHKEY_ENV = 'MC_WORKER_AUTHKEY'
+WORKER_ENV  = 'MC_WORKER_ID'
+
+class SimWorkerPool(object):
+    """Manages a pool of long-lived sim workers and distributes runs to them.
+
+       Attributes
+       numWorkers  The number of sim worker processes.
+       inputFile   The worker input file, which must call serve() at its end.
+       sim         The sim executable.
+       outputDir   The directory of the workers' own Trick output directories.
+       workers     List of the worker processes, by worker ID.
+       connections List of the worker connections, by worker ID.
+       numRuns     The total number of runs evaluated.
+       numSimRuns  The number of those runs that were dispatched to the workers.
+       cache       The RunCache of the run costs, or None.
+       results     The ResultStore the runs are added to, or None.
+       numBatches  The number of batches evaluated, which is the default epoch of a batch.
+       inputs      List of the (name, minimum, maximum) of the input variables, as registered in
+                   the worker input file, for the optimizer.
+    """
+
+    def __init__(self, numWorkers=None, inputFile='RUN_mc/input_worker.py', sim=None,
+                 outputDir='RUN_mc/workers', cacheFile=None,
+                 dataFiles=('input_driver_data.csv', 'output_target_data.csv'), results=None):
+        """ SimWorkerPool class constructor """
+        if numWorkers is None:
+            numWorkers = os.cpu_count() or 1
+        if sim is None:
+            sims = sorted(glob.glob('S_main*.exe'))
+            if not sims:
+                raise RuntimeError('no S_main*.exe found, build the sim first')
+            sim = sims[0]
+        self.numWorkers  = numWorkers
+        self.inputFile   = inputFile
+        self.sim         = os.path.abspath(sim)
+        self.outputDir   = outputDir
+        self.workers     = []
+        self.connections = []
+        self.numRuns     = 0
+        self.numSimRuns  = 0
+        self.listener    = None
+        self.cache       = None
+        self.results     = results
+        self.numBatches  = 0
+        self.inputs      = []
+        if cacheFile is not None:
+            context = RunCache.hashFiles([self.sim, self.inputFile] + list(dataFiles))
+            self.cache = RunCache(cacheFile, context)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def start(self, timeout=600.0):
+        """Starts the sim workers and waits for each of them to connect.  Raises RuntimeError if a
+           worker exits before it connects, or they haven't all connected within the timeout (s)."""
+        authkey = os.urandom(16)
+        self.listener = Listener(('localhost', 0), authkey=authkey)
+        (host, port) = self.listener.address
+        for workerId in range(self.numWorkers):
+            outputDir = os.path.join(self.outputDir, 'worker_' + str(workerId))
+            os.makedirs(outputDir, exist_ok=True)
+            env = dict(os.environ)
+            env[ADDRESS_ENV] = host + ':' + str(port)
+            env[AUTHKEY_ENV] = authkey.hex()
+            env[WORKER_ENV]  = str(workerId)
+            with open(self.workerOutput(workerId), 'w') as out:
+                self.workers.append(subprocess.Popen([self.sim, self.inputFile, '-O', outputDir],
+                                                     env=env, stdout=out, stderr=subprocess.STDOUT))
+        # The workers connect in any order, and say which one they are and their input variables.
+        # The connections are accepted in a thread, so this can check that the workers are still
+        # running while it waits.
+        accepted = queue.Queue()
+        def acceptWorkers():
+            try:
+                for count in range(self.numWorkers):
+                    connection = self.listener.accept()
+                    accepted.put(connection.recv() + (connection,))
+            except (OSError, EOFError, AuthenticationError):
+                pass
+        threading.Thread(target=acceptWorkers, daemon=True).start()
+        self.connections = [None] * self.numWorkers
+        deadline = time.time() + timeout
+        try:
+            for count in range(self.numWorkers):
+                while True:
+                    try:
+                        (workerId, self.inputs, connection) = accepted.get(timeout=0.5)
+                        break
+                    except queue.Empty:
+                        self.checkWorkers()
+                        if time.time() > deadline:
+                            raise RuntimeError('sim workers did not connect within ' + str(timeout)
+                                               + ' s, see their worker.out in ' + self.outputDir)
+                self.connections[workerId] = connection
+        except BaseException:
+            self.terminate()
+            raise
+
+    def workerOutput(self, workerId):
+        return os.path.join(self.outputDir, 'worker_' + str(workerId), 'worker.out')
+
+    def checkWorkers(self):
+        """Raises RuntimeError naming the output file of the first worker that has exited."""
+        for (workerId, worker) in enumerate(self.workers):
+            if worker.poll() is not None:
+                raise RuntimeError('sim worker ' + str(workerId) + ' exited with '
+                                   + str(worker.returncode) + ', see ' + self.workerOutput(workerId))
+
+    def terminate(self):
+        """Kills the workers, after a failed start."""
+        for worker in self.workers:
+            if worker.poll() is None:
+                worker.kill()
+        self.close()
+
+    def evaluate(self, vectors, epoch=None):
+        """Returns the list of the costs of the input variable vectors, in their order.  The costs
+           are looked up in the cache if there is one, and the rest are run on the workers.  The
+           cost of a run whose sim failed is None.  The runs are added to the result store with
+           the given epoch, which defaults to the batch number."""
+        if epoch is None:
+            epoch = self.numBatches
+        self.numBatches += 1
+        self.numRuns    += len(vectors)
+        if self.cache is None:
+            return self.run(vectors, epoch)
+        costs   = [self.cache.lookup(vector) for vector in vectors]
+        hits    = [index for index in range(len(vectors)) if costs[index] is not None]
+        misses  = {}
+        for (index, vector) in enumerate(vectors):
+            if costs[index] is None:
+                misses.setdefault(self.cache.key(vector), []).append(index)
+        keys    = list(misses.keys())
+        (results, outputs) = self.dispatch([vectors[misses[key][0]] for key in keys], epoch)
+        for (key, cost, runOutputs) in zip(keys, results, outputs):
+            self.cache.store(vectors[misses[key][0]], cost, runOutputs)
+            for index in misses[key]:
+                costs[index] = cost
+            # The run was added to the result store when it finished; add its duplicates too.
+            if self.results is not None:
+                for index in misses[key][1:]:
+                    self.results.add(epoch, vectors[index], runOutputs, cost)
+        if self.results is not None:
+            for index in hits:
+                self.results.add(epoch, vectors[index], self.cache.lookupOutputs(vectors[index]),
+                                 costs[index])
+            self.results.flush()
+        return costs
+
+    def run(self, vectors, epoch=0):
+        """Runs each input variable vector on the next idle worker, and returns the list of their
+           costs in the order of the vectors.  The cost of a run whose sim failed is None.  Each
+           run is added to the result store as it finishes."""
+        return self.dispatch(vectors, epoch)[0]
+
+    def dispatch(self, vectors, epoch=0):
+        """Same as run, but returns the lists of both the costs and the model outputs of the
+           runs.  The outputs of a run whose sim failed are None."""
+        costs   = [None] * len(vectors)
+        outputs = [None] * len(vectors)
+        pending = list(enumerate(vectors))
+        pending.reverse()
+        busy    = {}
+        idle    = list(self.connections)
+        while pending or busy:
+            while pending and idle:
+                connection = idle.pop()
+                (index, vector) = pending.pop()
+                connection.send((index, [float(value) for value in vector]))
+                busy[connection] = index
+            for connection in wait(list(busy.keys())):
+                try:
+                    (index, cost, outputs[index]) = connection.recv()
+                except EOFError:
+                    raise RuntimeError('sim worker exited, see its worker.out in ' + self.outputDir)
+                costs[index] = cost
+                if self.results is not None:
+                    self.results.add(epoch, vectors[index], outputs[index], cost)
+                del busy[connection]
+                idle.append(connection)
+        self.numSimRuns += len(vectors)
+        if self.results is not None:
+            self.results.flush()
+        return (costs, outputs)
+
+    def close(self):
+        """Tells the workers to exit, and waits for them."""
+        for connection in self.connections:
+            if connection is not None:
+                try:
+                    connection.send(None)
+                    connection.close()
+                except (OSError, EOFError):
+                    pass
+        for worker in self.workers:
+            worker.wait()
+        if self.listener is not None:
+            self.listener.close()
+        self.connections = []
+        self.workers     = []
+        self.listener    = None
+
+def serve(simGlobals, inputVars, stopTime, outputVars=()):
+    """Serves runs to the pool from a sim worker; call this at the end of the worker input file
+       with its globals(), the input variables, in the order of the pool's input vectors, the run
+       stop time (s) and the list of the model output variable names.  The input variables are
+       given as the input_vars of input.py, [name, units, min range, max range, constraint], or
+       just their names.  This loops, forking a run for each input vector it receives, until the
+       pool closes.  In each run, this returns to the input file with the inputs set and their
+       constraints applied, so the sim then initializes and runs, and sends back the cost and the
+       output values at the stop time.
+    """
+    trick = simGlobals['trick']
+    names = []
+    specs = []
+    constraints = []
+    for var in inputVars:
+        if isinstance(var, str):
+            var = [var, '1', None, None]
+        names.append(var[0])
+        specs.append((var[0], var[2], var[3]))
+        if len(var) > 4 and var[4]:
+            constraints.append((var[0], var[4]))
+    (host, port) = os.environ[ADDRESS_ENV].split(':')
+    connection = Client((host, int(port)), authkey=bytes.fromhex(os.environ[AUTHKEY_ENV]))
+    connection.send((int(os.environ[WORKER_ENV]), specs))
+    while True:
+        try:
+            run = connection.recv()
+        except EOFError:
+            run = None
+        if run is None:
+            connection.close()
+            os._exit(0)
+        (index, values) = run
+        sys.stdout.flush()
+        # The run sends its result to this parent, which replies to the pool exactly once per run.
+        (reader, writer) = Pipe(duplex=False)
+        pid = os.fork()
+        if pid == 0:
+            reader.close()
+            break
+        writer.close()
+        try:
+            result = reader.recv()
+        except EOFError:
+            # The run exited before it could send its cost.
+            result = (index, None, None)
+        reader.close()
+        os.waitpid(pid, 0)
+        connection.send(result)
+
+    # This is the forked run: set its inputs and have it send its cost at the stop time.
+    for (name, value) in zip(names, values):
+        exec(name + ' = ' + repr(value), simGlobals)
+    for (name, constraint) in constraints:
+        exec(name + ' = ' + repr(constraint.evaluate()), simGlobals)
+
+    def finish():
+        outputs = [float(eval(name, simGlobals)) for name in outputVars]
+        writer.send((index, simGlobals['mc'].monteCarlo.computeSlaveCost(), outputs))
+        writer.close()
+        trick.stop()
+
+    simGlobals['mc_pool_finish'] = finish
+    trick.add_read(stopTime, 'mc_pool_finish()')
+    trick.stop(stopTime + 1.0)
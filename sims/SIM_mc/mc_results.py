@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Streaming result store of optimizer runs.
+#
+# Each finished run's input variables, model outputs and cost are appended to one columnar store,
+# as they finish, instead of being left in separate run directories.  The store is a directory of
+# one raw float64 file per column, c0.f8, c1.f8..., and an index.json of the column names and
+# number of rows, the same column directory format as test/utils/intTester/log_convert.py, so it
+# loads memory-mapped with LogData.load.  The columns are the run number, epoch, cost, then the
+# inputs and outputs.  Failed runs have NaN cost.  Rows are only ever appended, and index.json is
+# replaced atomically after the rows are written, so a crash leaves at most some unindexed rows,
+# which are dropped when the store is reopened.
+#
+# Running statistics are kept as the rows are added, so a campaign can be analyzed at any time
+# without re-reading the runs: the best run so far, the sensitivity of the cost to each input (the
+# correlation coefficient of the input with the cost), and the convergence of each epoch (its
+# number of runs, minimum and mean cost, and the best cost so far).
+#
+# SimWorkerPool (mc_pool.py) adds each run to its store as the run finishes.  To print the
+# statistics of a store, from the sim directory:
+#   python3 mc_results.py mc_results
+
+from array import array
+import json
+import math
+import os
+import sys
+
+class RunningStats(object):
+    """Statistics of the runs, updated one run at a time.
+
+       Attributes
+       inputNames  List of the input variable names.
+       numRuns     The number of successful runs.
+       numFailed   The number of failed runs, with no cost.
+       bestCost    The lowest cost so far, or None.
+       bestRun     The run number of the lowest cost so far.
+       bestInputs  The input variables of the lowest cost so far.
+       sums        List of the sums of each input, its square, and its product with the cost.
+       costSums    The sums of the cost and its square.
+       epochs      Dictionary of the [runs, minimum cost, cost sum, best cost so far], by epoch.
+    """
+
+    def __init__(self, inputNames):
+        """ RunningStats class constructor """
+        self.inputNames = list(inputNames)
+        self.numRuns    = 0
+        self.numFailed  = 0
+        self.bestCost   = None
+        self.bestRun    = None
+        self.bestInputs = None
+        self.sums       = [[0.0, 0.0, 0.0] for name in inputNames]
+        self.costSums   = [0.0, 0.0]
+        self.epochs     = {}
+
+    def add(self, run, epoch, inputs, cost):
+        """Adds a run's inputs and cost.  A failed run has cost None or NaN."""
+        if cost is None or math.isnan(cost):
+            self.numFailed += 1
+            return
+        self.numRuns += 1
+        if self.bestCost is None or cost < self.bestCost:
+            self.bestCost   = cost
+            self.bestRun    = run
+            self.bestInputs = list(inputs)
+        for (sums, value) in zip(self.sums, inputs):
+            sums[0] += value
+            sums[1] += value * value
+            sums[2] += value * cost
+        self.costSums[0] += cost
+        self.costSums[1] += cost * cost
+        stats = self.epochs.setdefault(epoch, [0, cost, 0.0, cost])
+        stats[0] += 1
+        stats[1]  = min(stats[1], cost)
+        stats[2] += cost
+        stats[3]  = self.bestCost
+
+    def sensitivity(self):
+        """Returns the list of the correlation coefficient of each input with the cost, or None for
+           inputs or costs that haven't varied."""
+        n = float(self.numRuns)
+        costVar = n * self.costSums[1] - self.costSums[0] ** 2
+        result = []
+        for (sum, sumSquares, sumProducts) in self.sums:
+            inputVar = n * sumSquares - sum * sum
+            if n < 2 or inputVar <= 0.0 or costVar <= 0.0:
+                result.append(None)
+            else:
+                result.append((n * sumProducts - sum * self.costSums[0]) / math.sqrt(inputVar * costVar))
+        return result
+
+    def summary(self):
+        """Returns a dictionary of the statistics."""
+        return {'runs':        self.numRuns,
+                'failed':      self.numFailed,
+                'best_cost':   self.bestCost,
+                'best_run':    self.bestRun,
+                'best_inputs': dict(zip(self.inputNames, self.bestInputs or [])),
+                'sensitivity': dict(zip(self.inputNames, self.sensitivity())),
+                'epochs':      [{'epoch': epoch, 'runs': stats[0], 'min_cost': stats[1],
+                                 'mean_cost': stats[2] / stats[0], 'best_cost': stats[3]}
+                                for (epoch, stats) in sorted(self.epochs.items())]}
+
+    def report(self):
+        """Returns the statistics as printable text."""
+        lines = ['Runs: ' + str(self.numRuns) + ', failed: ' + str(self.numFailed)]
+        if self.bestCost is not None:
+            lines.append('Best cost: ' + repr(self.bestCost) + ' in run ' + str(self.bestRun))
+            for (name, value) in zip(self.inputNames, self.bestInputs):
+                lines.append('  ' + name + ' = ' + repr(value))
+        lines.append('Sensitivity (correlation with cost):')
+        for (name, value) in zip(self.inputNames, self.sensitivity()):
+            lines.append('  ' + name + ': ' + ('-' if value is None else '%+.3f' % value))
+        lines.append('Epoch      runs      min cost     mean cost     best cost')
+        for entry in self.summary()['epochs']:
+            lines.append('%5d %9d %13.6g %13.6g %13.6g' % (entry['epoch'], entry['runs'],
+                         entry['min_cost'], entry['mean_cost'], entry['best_cost']))
+        return '\n'.join(lines)
+
+class ResultStore(object):
+    """Append-only columnar store of runs, with their running statistics.
+
+       Attributes
+       dirName     The store directory.
+       inputNames  List of the input variable names.
+       outputNames List of the model output variable names.
+       names       List of all the column names.
+       numRows     The number of rows written and indexed.
+       pending     List of the rows added but not yet written.
+       flushRows   The number of pending rows that are written at once.
+       stats       The RunningStats of the runs.
+    """
+
+    def __init__(self, dirName, inputNames=None, outputNames=None, flushRows=100):
+        """ ResultStore class constructor.  An existing store is reopened with its own names, and
+            its statistics are restored from its rows. """
+        self.dirName   = dirName
+        self.numRows   = 0
+        self.pending   = []
+        self.flushRows = flushRows
+        index = os.path.join(dirName, 'index.json')
+        if os.path.exists(index):
+            with open(index, 'r') as f:
+                index = json.load(f)
+            if inputNames is not None and (list(inputNames) != index['inputs']
+                                           or list(outputNames or []) != index['outputs']):
+                raise ValueError(dirName + " has different inputs or outputs than given.")
+            self.inputNames  = index['inputs']
+            self.outputNames = index['outputs']
+            self.numRows     = index['numRows']
+        elif inputNames is None:
+            raise ValueError(dirName + ' is not a result store, and no inputs were given.')
+        else:
+            if not os.path.isdir(dirName):
+                os.makedirs(dirName)
+            self.inputNames  = list(inputNames)
+            self.outputNames = list(outputNames or [])
+        self.names = ['run', 'epoch', 'cost'] + self.inputNames + self.outputNames
+        self.stats = RunningStats(self.inputNames)
+        self.restore()
+
+    def columnFile(self, col):
+        return os.path.join(self.dirName, 'c' + str(col) + '.f8')
+
+    def restore(self):
+        """Drops any unindexed rows from a crash, and adds the indexed rows to the statistics."""
+        columns = []
+        for col in range(len(self.names)):
+            values = array('d')
+            if os.path.exists(self.columnFile(col)):
+                with open(self.columnFile(col), 'rb') as f:
+                    values.fromfile(f, self.numRows)
+                with open(self.columnFile(col), 'r+b') as f:
+                    f.truncate(8 * self.numRows)
+            columns.append(values)
+        numInputs = len(self.inputNames)
+        for row in range(self.numRows):
+            self.stats.add(int(columns[0][row]), int(columns[1][row]),
+                           [columns[3 + col][row] for col in range(numInputs)], columns[2][row])
+
+    def add(self, epoch, inputs, outputs, cost):
+        """Adds a finished run, and returns its run number.  A failed run has cost and outputs
+           None."""
+        run = self.numRows + len(self.pending)
+        if outputs is None:
+            outputs = [float('nan')] * len(self.outputNames)
+        if len(inputs) != len(self.inputNames) or len(outputs) != len(self.outputNames):
+            raise ValueError('run ' + str(run) + ' has ' + str(len(inputs)) + ' inputs and '
+                             + str(len(outputs)) + ' outputs, the store has '
+                             + str(len(self.inputNames)) + ' and ' + str(len(self.outputNames)))
+        row = [float(run), float(epoch), float('nan') if cost is None else float(cost)] \
+            + [float(value) for value in inputs] + [float(value) for value in outputs]
+        self.pending.append(row)
+        self.stats.add(run, epoch, row[3:3 + len(self.inputNames)], row[2])
+        if len(self.pending) >= self.flushRows:
+            self.flush()
+        return run
+
+    def flush(self):
+        """Appends the pending rows to the column files, then updates the index."""
+        if not self.pending:
+            return
+        for col in range(len(self.names)):
+            with open(self.columnFile(col), 'ab') as f:
+                array('d', [row[col] for row in self.pending]).tofile(f)
+        self.numRows += len(self.pending)
+        self.pending = []
+        index = os.path.join(self.dirName, 'index.json')
+        with open(index + '.tmp', 'w') as f:
+            json.dump({'names': self.names, 'units': ['--'] * len(self.names),
+                       'numRows': self.numRows, 'inputs': self.inputNames,
+                       'outputs': self.outputNames, 'stats': self.stats.summary()}, f, indent=1)
+        os.replace(index + '.tmp', index)
+
+    def close(self):
+        self.flush()
+
+def main():
+    if len(sys.argv) != 2:
+        print('usage: python3 mc_results.py <result store directory>')
+        sys.exit(1)
+    print(ResultStore(sys.argv[1]).stats.report())
+
+if __name__ == "__main__":
+    main()
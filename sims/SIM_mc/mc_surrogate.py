@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Surrogate model pre-screening of optimizer runs.
+#
+# A population optimizer such as the PSO runs a full sim for every candidate every epoch, even
+# though most candidates are clearly worse than the best found so far.  This fits a cheap model of
+# the cost, a cubic radial basis function interpolant with a linear tail, to the history of the
+# input variable vectors and their costs from the real runs.  The model ranks each batch of
+# candidates, and only the most promising fraction of them, plus a random exploration quota of the
+# rest, are sent to real sim runs.  The costs of the rest are returned as None, the same as failed
+# runs, so the optimizer moves those candidates on without updating their bests.
+#
+# Until the history has enough points to fit the model, all candidates are run.  This needs NumPy.
+#
+# Example, with a SimWorkerPool (mc_pool.py):
+#
+#   from mc_pool import SimWorkerPool
+#   from mc_surrogate import SurrogateScreen
+#   with SimWorkerPool(cacheFile='mc_run_cache.jsonl') as pool:
+#       screen = SurrogateScreen(pool.evaluate, fraction=0.3, exploration=0.1)
+#       costs  = screen.evaluate(candidates)
+#
+# To compare the number of runs a DifferentialEvolution (mc_optim.py) needs to reach a cost
+# tolerance with and without the screen, on the local StandInObjective instead of the sim:
+#   python3 mc_surrogate.py [--tolerance T] [--variables N] [--population N] [--seeds N]
+
+import argparse
+import random
+
+import numpy
+
+class RbfSurrogate(object):
+    """Cubic radial basis function interpolant of cost, with a linear polynomial tail, over input
+       variable vectors scaled to the unit box of the fitted points.
+
+       Attributes
+       points      The scaled input vectors of the fitted points, one per row.
+       weights     The RBF weights of the fitted points.
+       coeffs      The coefficients of the linear tail, constant first.
+       lower       The lower bounds of the fitted points, for scaling.
+       scale       The ranges of the fitted points, for scaling.
+    """
+
+    def __init__(self):
+        """ RbfSurrogate class constructor """
+        self.points  = None
+        self.weights = None
+        self.coeffs  = None
+        self.lower   = None
+        self.scale   = None
+
+    def scaled(self, vectors):
+        return (numpy.asarray(vectors, dtype=numpy.float64) - self.lower) / self.scale
+
+    def fit(self, vectors, costs, smoothing=1.0e-10):
+        """Fits the model to the input vectors and their costs.  The smoothing regularizes nearly
+           duplicate points."""
+        vectors = numpy.asarray(vectors, dtype=numpy.float64)
+        costs   = numpy.asarray(costs,   dtype=numpy.float64)
+        self.lower = vectors.min(axis=0)
+        self.scale = vectors.max(axis=0) - self.lower
+        self.scale[self.scale <= 0.0] = 1.0
+        self.points = self.scaled(vectors)
+        (numPoints, numVars) = self.points.shape
+        tail   = numpy.hstack((numpy.ones((numPoints, 1)), self.points))
+        system = numpy.zeros((numPoints + numVars + 1, numPoints + numVars + 1))
+        system[:numPoints, :numPoints] = self.kernel(self.points, self.points) \
+                                       + smoothing * numpy.eye(numPoints)
+        system[:numPoints, numPoints:] = tail
+        system[numPoints:, :numPoints] = tail.T
+        rhs = numpy.concatenate((costs, numpy.zeros(numVars + 1)))
+        solution = numpy.linalg.lstsq(system, rhs, rcond=None)[0]
+        self.weights = solution[:numPoints]
+        self.coeffs  = solution[numPoints:]
+
+    def kernel(self, first, second):
+        distance = numpy.sqrt(((first[:, None, :] - second[None, :, :]) ** 2).sum(axis=2))
+        return distance ** 3
+
+    def predict(self, vectors):
+        """Returns the array of the model's costs of the input vectors."""
+        points = self.scaled(vectors)
+        return self.kernel(points, self.points).dot(self.weights) \
+             + self.coeffs[0] + points.dot(self.coeffs[1:])
+
+class SurrogateScreen(object):
+    """Screens batches of candidate input vectors with an RbfSurrogate of the run history, and
+       only runs the promising ones.
+
+       Attributes
+       evaluateRuns  The function that runs a list of input vectors and returns their costs, such
+                     as SimWorkerPool.evaluate.
+       fraction      The fraction of each batch, with the best model costs, that is run.
+       exploration   The fraction of the rest of each batch that is also run, chosen at random.
+       minHistory    The number of run points needed before the model is used.
+       maxPoints     The maximum number of the lowest-cost run points the model is fit to.
+       history       List of the (input vector, cost) of all the successful runs.
+       surrogate     The RbfSurrogate.
+       numCandidates The total number of candidates screened.
+       numRuns       The total number of candidates that were run.
+       random        The random generator of the exploration choices.
+    """
+
+    def __init__(self, evaluateRuns, fraction=0.3, exploration=0.1, minHistory=None, maxPoints=500,
+                 seed=42):
+        """ SurrogateScreen class constructor """
+        if not 0.0 < fraction <= 1.0 or not 0.0 <= exploration <= 1.0:
+            raise ValueError('fraction must be in (0, 1] and exploration in [0, 1]')
+        self.evaluateRuns  = evaluateRuns
+        self.fraction      = fraction
+        self.exploration   = exploration
+        self.minHistory    = minHistory
+        self.maxPoints     = maxPoints
+        self.history       = []
+        self.surrogate     = RbfSurrogate()
+        self.numCandidates = 0
+        self.numRuns       = 0
+        self.random        = random.Random(seed)
+
+    def addHistory(self, vectors, costs):
+        """Adds the costs of runs made elsewhere, such as from a previous session, to the history."""
+        for (vector, cost) in zip(vectors, costs):
+            if cost is not None:
+                self.history.append(([float(value) for value in vector], float(cost)))
+
+    def select(self, vectors):
+        """Returns the sorted indexes of the candidates to run."""
+        numVars    = len(vectors[0])
+        minHistory = self.minHistory if self.minHistory is not None else 2 * (numVars + 1)
+        if len(self.history) < minHistory:
+            return list(range(len(vectors)))
+        points = sorted(self.history, key=lambda point: point[1])[:self.maxPoints]
+        self.surrogate.fit([point[0] for point in points], [point[1] for point in points])
+        ranked   = list(numpy.argsort(self.surrogate.predict(vectors)))
+        numBest  = max(1, int(round(self.fraction * len(vectors))))
+        selected = ranked[:numBest]
+        rest     = ranked[numBest:]
+        numExplore = int(round(self.exploration * len(rest)))
+        selected  += self.random.sample(rest, numExplore)
+        return sorted(int(index) for index in selected)
+
+    def evaluate(self, vectors):
+        """Returns the list of the costs of the candidate input vectors, in their order.  The
+           candidates that weren't run have cost None."""
+        costs = [None] * len(vectors)
+        if not vectors:
+            return costs
+        selected = self.select(vectors)
+        results  = self.evaluateRuns([vectors[index] for index in selected])
+        for (index, cost) in zip(selected, results):
+            costs[index] = cost
+        self.addHistory([vectors[index] for index in selected], results)
+        self.numCandidates += len(vectors)
+        self.numRuns       += len(selected)
+        return costs
+
+def countRuns(screened, tolerance, numVars, population, maxGenerations, seed):
+    """Returns the number of objective runs a DifferentialEvolution needs to reach the cost
+       tolerance on the StandInObjective, with or without the screen, or None if it doesn't reach
+       it within the maximum generations."""
+    from mc_optim import DifferentialEvolution, StandInObjective
+    inputs    = [('x' + str(var), 0.0, 1.0) for var in range(numVars)]
+    objective = StandInObjective(inputs)
+    optimizer = DifferentialEvolution(inputs, population, maxGenerations, seed=seed)
+    evaluate  = objective.evaluate
+    if screened:
+        evaluate = SurrogateScreen(objective.evaluate, seed=seed).evaluate
+    while not optimizer.isDone():
+        vectors = optimizer.propose()
+        optimizer.tell(vectors, evaluate(vectors))
+        if optimizer.bestCost is not None and optimizer.bestCost <= tolerance:
+            return objective.numRuns
+    return None
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Compare the runs needed with and without the screen.')
+    parser.add_argument('-t', '--tolerance', type=float, default=1.0e-4, help='cost tolerance to reach')
+    parser.add_argument('-n', '--variables', type=int, default=4, help='number of input variables')
+    parser.add_argument('-p', '--population', type=int, default=30, help='population size')
+    parser.add_argument('-g', '--generations', type=int, default=500, help='maximum generations')
+    parser.add_argument('-s', '--seeds', type=int, default=5, help='number of random seeds to average')
+    return parser.parse_args()
+
+def main():
+    args = parseArgs()
+    print('Runs to reach cost ' + repr(args.tolerance) + ' on the ' + str(args.variables)
+          + '-variable stand-in objective, population ' + str(args.population) + ':')
+    print(' seed  unscreened    screened')
+    totals = [0, 0]
+    for seed in range(args.seeds):
+        runs = [countRuns(screened, args.tolerance, args.variables, args.population,
+                          args.generations, seed) for screened in (False, True)]
+        print('%5d %11s %11s' % (seed, runs[0], runs[1]))
+        if None not in runs:
+            totals = [total + count for (total, count) in zip(totals, runs)]
+    if totals[0] > 0:
+        print('Screened/unscreened runs: %.2f' % (float(totals[1]) / totals[0]))
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,35 @@
 # Copyright 2023 United States Government as represented by the Administrator of the
 # National Aeronautics and Space Administration.  All Rights Reserved.
 #
-# TODO
+# PSO swarm manager script:
 # - wraps the sim, loops over epochs, managing swarm state between epochs,
 #   calls the sim to do an MC run w/ parallel slaves as a system call for each epoch
 # - outputs final swarm state to a file, can use a file to init swarm state
+#
+# After each epoch, the swarm state the sim wrote to pso_state.csv (positions, velocities,
+# personal and global bests) is saved along with the manager's own state (epoch, inertia, random
+# generator state, cost history) to a versioned checkpoint file in the checkpoint directory.  An
+# epoch is only checkpointed once its sim finished successfully, so after a crash the campaign is
+# restarted with --resume, which restores the latest checkpoint and continues with the next epoch,
+# and completed epochs are never rerun.  Any other checkpoint can be resumed with --resume-from.
+#
+# Run this from the sim directory:
+#   python3 pso.py [--epochs N] [--resume | --resume-from pso_checkpoints/epoch_0002.json]
 
-import sys
-import subprocess
+import argparse
+import glob
+import json
+import os
 import random
+import subprocess
+import sys
 
 # compare total run time vs. series:
 # this   30x100, 10 s runs: 1m 45s
 # series 30x100, 10 s runs: 1m 24s
 # What about for longer runs?
-# this   30x100, 1000 s runs: 2m 05s 
-# series 30x100, 1000 s runs: 4m 55s 
+# this   30x100, 1000 s runs: 2m 05s
+# series 30x100, 1000 s runs: 4m 55s
 # Good, this starts to outperform serial as runs get to a more realistic length.
 
 MAX_EPOCH     = 4
@@ -24,18 +38,22 @@ INITIAL_DISTR = 'MIN_MAX_CORNERS'
 INERTIA_START = 0.5
 INERTIA_END   = 0.5
 
+# The swarm state file that the sim reads at init (FILE_CONTINUOUS) and writes at shutdown.
+SWARM_STATE_FILE   = "pso_state.csv"
+CHECKPOINT_DIR     = "pso_checkpoints"
+CHECKPOINT_VERSION = 1
+
 def write_epoch_config(epoch, distribution, inertia, seed):
     render = "# This is auto-generated by the PSO swarm manager script, defining the\n" \
-           + "# PSO model state for the current epoch.\n" \
+           + "# PSO model state for the current epoch: " + str(epoch) + ".\n" \
            + "#\n" \
            + "thePsoConfig.mRandomSeed       = " + str(seed) + "\n" \
            + "thePsoConfig.mInertiaWeight    = " + str(inertia) + "\n" \
            + "thePsoConfig.mInertiaWeightEnd = " + str(inertia) + "\n" \
-           + "thePsoConfig.mInitDistribution = trick.GunnsOptimPsoConfigData." + distribution + "\n"
+           + "thePsoConfig.mInitDistribution = trick.GunnsOptimParticleSwarmConfigData." + distribution + "\n"
     epoch_config_filename = "RUN_mc/epoch_configuration.py"
     with open(epoch_config_filename, 'w') as f:
         f.write(render)
-        f.close()
 
 # Return a new seed for the sim's random.  Sim's C++ srand takes an unsigned int,
 # so we want a seed between 0 and UINT_MAX 0xffffffff.
@@ -44,35 +62,144 @@ def write_epoch_config(epoch, distribution, inertia, seed):
 # the particles will see the same random numbers every epoch and won't act random.
 def getSimSeed():
     return random.randint(0, 0xffffffff)
-    
+
+# Return the inertia weight for the given epoch, annealed linearly from INERTIA_START at the
+# first epoch to INERTIA_END at the last.  Each epoch's sim runs a single epoch, so it can't
+# ramp the inertia itself.
+def epoch_inertia(epoch, max_epoch):
+    return INERTIA_START + (INERTIA_END - INERTIA_START) * (epoch - 1) / max(1, max_epoch - 1)
+
+# Return the global best cost from the swarm state file contents, or None.
+def global_best_cost(swarm_state):
+    for line in swarm_state.splitlines():
+        fields = line.split()
+        if len(fields) > 1 and fields[0] == 'global_best':
+            return float(fields[1])
+    return None
+
+def checkpoint_filename(epoch, checkpoint_dir):
+    return os.path.join(checkpoint_dir, "epoch_%04d.json" % epoch)
+
+# Save the swarm and manager state after the given completed epoch.  The file is written to a
+# temporary name and then renamed, so a crash never leaves a partial checkpoint.
+def write_checkpoint(checkpoint_dir, epoch, max_epoch, inertia, history):
+    with open(SWARM_STATE_FILE, 'r') as f:
+        swarm_state = f.read()
+    history.append({'epoch': epoch, 'inertia': inertia, 'global_best_cost': global_best_cost(swarm_state)})
+    state = random.getstate()
+    checkpoint = {
+        'version':      CHECKPOINT_VERSION,
+        'epoch':        epoch,
+        'max_epoch':    max_epoch,
+        'random_state': [state[0], list(state[1]), state[2]],
+        'history':      history,
+        'swarm_state':  swarm_state,
+    }
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    filename = checkpoint_filename(epoch, checkpoint_dir)
+    with open(filename + ".tmp", 'w') as f:
+        json.dump(checkpoint, f, indent=1)
+    os.replace(filename + ".tmp", filename)
+    print("PSO MANAGER saved checkpoint: " + filename)
+
+# Return the latest checkpoint file in the checkpoint directory, or None.
+def latest_checkpoint(checkpoint_dir):
+    files = sorted(glob.glob(os.path.join(checkpoint_dir, "epoch_*.json")))
+    return files[-1] if files else None
+
+# Restore the swarm state file and the manager's random state from the checkpoint file, and
+# return the checkpoint.
+def read_checkpoint(filename):
+    with open(filename, 'r') as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(filename + " has checkpoint version " + str(checkpoint.get('version'))
+                         + ", expected " + str(CHECKPOINT_VERSION))
+    with open(SWARM_STATE_FILE, 'w') as f:
+        f.write(checkpoint['swarm_state'])
+    state = checkpoint['random_state']
+    random.setstate((state[0], tuple(state[1]), state[2]))
+    print("PSO MANAGER resumed from checkpoint: " + filename + ", epoch " + str(checkpoint['epoch']))
+    return checkpoint
+
+# Return the modification time (ns) of the swarm state file, or None if there is none.
+def swarm_state_mtime():
+    if not os.path.exists(SWARM_STATE_FILE):
+        return None
+    return os.stat(SWARM_STATE_FILE).st_mtime_ns
+
+# Run the sim for one epoch, and return True if it finished successfully.
+def run_epoch():
+    sims = sorted(glob.glob("S_main*.exe"))
+    if not sims:
+        print("PSO MANAGER error: no S_main*.exe found, build the sim first.")
+        return False
+    # The sim reads the previous epoch's swarm state file, so it can't be removed first.  Instead,
+    # the sim must have rewritten it, changing its modification time.
+    before = swarm_state_mtime()
+    result = subprocess.run([os.path.abspath(sims[0]), "RUN_mc/input_single_epoch.py"])
+    if result.returncode != 0:
+        print("PSO MANAGER error: sim exited with " + str(result.returncode))
+        return False
+    after = swarm_state_mtime()
+    if after is None or after == before:
+        print("PSO MANAGER error: sim didn't write " + SWARM_STATE_FILE)
+        return False
+    return True
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the PSO one sim epoch at a time.')
+    parser.add_argument('-e', '--epochs', type=int, default=MAX_EPOCH,
+                        help='total number of epochs in the campaign, default ' + str(MAX_EPOCH))
+    parser.add_argument('-d', '--checkpoint-dir', default=CHECKPOINT_DIR,
+                        help='directory of the epoch checkpoint files, default ' + CHECKPOINT_DIR)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-r', '--resume', action='store_true',
+                       help='resume from the latest checkpoint in the checkpoint directory')
+    group.add_argument('-f', '--resume-from', default=None, help='resume from the given checkpoint file')
+    return parser.parse_args()
+
 def main():
     print("I am a PSO manager script")
-    
+    args = parse_args()
+
     # Set the random seed for repeatability.
     random.seed(42)
-    
-    # write the configuration file for the 0th epoch
-    write_epoch_config(1, INITIAL_DISTR, INERTIA_START, getSimSeed())
-    
+
+    # Resume after the last completed epoch of the checkpoint, if given.
+    first_epoch = 1
+    history     = []
+    checkpoint_file = args.resume_from
+    if args.resume:
+        checkpoint_file = latest_checkpoint(args.checkpoint_dir)
+        if checkpoint_file is None:
+            print("PSO MANAGER found no checkpoint in " + args.checkpoint_dir + ", starting a new swarm.")
+    if checkpoint_file is not None:
+        checkpoint  = read_checkpoint(checkpoint_file)
+        first_epoch = checkpoint['epoch'] + 1
+        history     = checkpoint['history']
+
     # main epoch loop
-    for epoch in range(1, MAX_EPOCH + 1):
+    for epoch in range(first_epoch, args.epochs + 1):
         print("!!!!!!!!!!!!!!!!!!!!!!")
         print("PSO MANAGER EPOCH: ", epoch)
         print("!!!!!!!!!!!!!!!!!!!!!!")
-        cmd_str = "./S_main* RUN_mc/input_single_epoch.py"
-        subprocess.run(cmd_str, shell=True)
-        
-        # TODO handle swarm state between epochs
-        # - First epoch starts the sim with the user-defined initial swarm state
-        #   subsequent epochs use the swarm state file
-        # - update the inertia weight annealing effect
-        seed = random.randint(0, 0xffffffff)
-        inertia = INERTIA_START + (INERTIA_END - INERTIA_START) * epoch / max(1, MAX_EPOCH - 1)
-        write_epoch_config(epoch, 'FILE_CONTINUOUS', inertia, getSimSeed())
-        
+
+        # The first epoch starts the sim with the user-defined initial swarm state, subsequent
+        # epochs continue from the swarm state file.
+        distribution = INITIAL_DISTR if epoch == 1 else 'FILE_CONTINUOUS'
+        inertia = epoch_inertia(epoch, args.epochs)
+        write_epoch_config(epoch, distribution, inertia, getSimSeed())
+        if not run_epoch():
+            print("PSO MANAGER stopped at epoch " + str(epoch) + ", rerun with --resume to continue.")
+            sys.exit(1)
+        write_checkpoint(args.checkpoint_dir, epoch, args.epochs, inertia, history)
+
+    if history:
+        print("PSO MANAGER global best cost by epoch:")
+        for entry in history:
+            print("  " + str(entry['epoch']) + ": " + str(entry['global_best_cost']))
     sys.exit(0)
 
 if __name__ == "__main__":
     main()
-
-
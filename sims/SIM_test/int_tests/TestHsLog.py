@@ -44,27 +44,29 @@ class TestHsLog(Test):
     def checkHsLogFinalState(self):
        print("-------------------------------------------------------------------------------------------------")
        correctLineCount = False
-       # Open the H&S log file
-       with open('logs/TS_Health_and_Status.out', 'r') as logFile:
-          # Verify the first 12 lines are successful network init messages
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.fluid.netSolver initialized with 3 links, 3 nodes, solver: NORMAL, islands: OFF, run: RUN."), " fluid network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.elect.netSolver initialized with 3 links, 3 nodes, solver: NORMAL, islands: OFF, run: RUN."), " elect network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.thermal.netSolver initialized with 9 links, 14 nodes, solver: NORMAL, islands: OFF, run: RUN."), " thermal network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superFluid.netSolver initialized with 6 links, 5 nodes, solver: NORMAL, islands: OFF, run: RUN."), " fluid super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superFluid   has sub-network: testSimObject.subFluid1."), " fluid super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superFluid   has sub-network: testSimObject.subFluid2."), " fluid super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superElect.netSolver initialized with 6 links, 5 nodes, solver: NORMAL, islands: OFF, run: RUN."), " elect super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superElect   has sub-network: testSimObject.subElect1."), " elect super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superElect   has sub-network: testSimObject.subElect2."), " elect super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superThermal.netSolver initialized with 18 links, 27 nodes, solver: NORMAL, islands: OFF, run: RUN."), " thermal super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superThermal   has sub-network: testSimObject.subThermal1."), " thermal super-network initialization ::")
-          self.testTrue(next(logFile).rstrip().endswith("testSimObject.superThermal   has sub-network: testSimObject.subThermal2."), " thermal super-network initialization ::")
+       # Stream the records from the H&S log file (see test/utils/intTester/HsLog.py)
+       hsLog = HsLog('logs/TS_Health_and_Status.out')
+       records = hsLog.records()
+       # Verify the first 12 records are successful network init messages
+       self.testTrue(next(records).message.endswith("testSimObject.fluid.netSolver initialized with 3 links, 3 nodes, solver: NORMAL, islands: OFF, run: RUN."), " fluid network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.elect.netSolver initialized with 3 links, 3 nodes, solver: NORMAL, islands: OFF, run: RUN."), " elect network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.thermal.netSolver initialized with 9 links, 14 nodes, solver: NORMAL, islands: OFF, run: RUN."), " thermal network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superFluid.netSolver initialized with 6 links, 5 nodes, solver: NORMAL, islands: OFF, run: RUN."), " fluid super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superFluid   has sub-network: testSimObject.subFluid1."), " fluid super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superFluid   has sub-network: testSimObject.subFluid2."), " fluid super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superElect.netSolver initialized with 6 links, 5 nodes, solver: NORMAL, islands: OFF, run: RUN."), " elect super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superElect   has sub-network: testSimObject.subElect1."), " elect super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superElect   has sub-network: testSimObject.subElect2."), " elect super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superThermal.netSolver initialized with 18 links, 27 nodes, solver: NORMAL, islands: OFF, run: RUN."), " thermal super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superThermal   has sub-network: testSimObject.subThermal1."), " thermal super-network initialization ::")
+       self.testTrue(next(records).message.endswith("testSimObject.superThermal   has sub-network: testSimObject.subThermal2."), " thermal super-network initialization ::")
 
-          # Verify the log file only has the above 12 lines in it
-          try:
-             next(logFile)
-          except StopIteration:
-             correctLineCount = True
+       # Verify the log file only has the above 12 records in it
+       try:
+          next(records)
+       except StopIteration:
+          correctLineCount = True
+       records.close()
 
        self.testTrue(correctLineCount, " no run messages from networks ::")
 
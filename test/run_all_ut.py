@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+"""Parallel unit test runner.  This is a parallel alternative to make_all_ut.sh & scan_all_ut.py.
+
+   It discovers each unit test folder, a test/ folder with a Makefile under core, aspects,
+   ms-utils and gunns-ts-models, and builds and runs them concurrently, up to the job limit.  The
+   gunns/lib/test library they share is cleaned and built once first, so the folders don't race to
+   build it: each folder's make unit-tests also makes lib/test, which is then already up to date.
+   --no-clean-lib skips the clean, but lib/test is still brought up to date first.
+
+   Each folder is cleaned and built (make clean; make unit-tests), then its tests, coverage and
+   valgrind run (make test), the same as make_all_ut.sh does with make, and each of these is timed.
+   The CppUnit output in output/unit-tests.log is parsed for the number of tests run and each failed
+   or errored test case, by fixture (suite) and test method, with its message and file & line.
+   Test mains using a CppUnit BriefTestProgressListener also list their passing cases.  A folder
+   fails if it didn't build, had no test output, had failed cases, or valgrind reported errors.
+
+   The results are written to a JUnit XML file with a testsuite per folder, and the slowest folders
+   and each failed case are printed.  The exit status is 1 if anything failed.  The output of each
+   folder's make is kept in the log folder.
+
+   By default, only the folders affected by changes since they last passed are run.  Each folder is
+   hashed with its sources, its Makefile, and the transitive includes of its sources under the
+   build's include roots, along with the source files of those included headers, since the tests
+   link their compiled code from lib/test, and the shared test makefile and valgrind suppressions.
+   A folder whose hash matches its last passing run in the cache file is skipped, and reported as
+   skipped in the JUnit XML.  --all runs every folder anyway.  For example, from gunns/test:
+
+     python3 run_all_ut.py -j 8 --junit ut_results.xml
+     python3 run_all_ut.py --all core/test aspects/fluid/capacitor/test
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils'))
+from include_hash import IncludeHasher
+
+# The roots searched for test folders, relative to GUNNS_HOME.
+ROOTS = ['core', 'aspects', 'ms-utils', 'gunns-ts-models']
+
+# Test folders that aren't run, relative to GUNNS_HOME, matching make_all_ut.sh.
+EXCLUDE = ['ms-utils/simulation/hs/test',
+           'ms-utils/software/exceptions/test',
+           'ms-utils/math/linear_algebra/cuda/test']
+
+# Files, relative to GUNNS_HOME, that are part of every folder's hash.
+COMMON_FILES = ['test/utils/Makefile.default', 'test/utils/gunns.supp', 'lib/test/Makefile']
+
+class FolderResult(object):
+    """The results of one unit test folder.
+
+       Attributes
+       folder      The test folder, relative to GUNNS_HOME.
+       built       True if the unit-tests executable was built.
+       buildTime   The clean & build time (s).
+       testTime    The test, coverage & valgrind time (s).
+       numRun      The number of test cases run, or None if there was no test output.
+       passed      List of the (suite, case) that passed, if the test main lists them.
+       failures    List of the (suite, case, kind, location, message) of the failed cases, where
+                   kind is 'F' for a failed assertion or 'E' for an error.
+       valgrind    The valgrind ERROR SUMMARY line if it reported errors, or None.
+       logName     The path/name of the folder's make output log.
+       skipped     True if the folder was skipped, unchanged since it last passed.
+    """
+
+    def __init__(self, folder, logName):
+        """ FolderResult class constructor """
+        self.skipped   = False
+        self.folder    = folder
+        self.built     = False
+        self.buildTime = 0.0
+        self.testTime  = 0.0
+        self.numRun    = None
+        self.passed    = []
+        self.failures  = []
+        self.valgrind  = None
+        self.logName   = logName
+
+    def isFailed(self):
+        if self.skipped:
+            return False
+        return not self.built or self.numRun is None or bool(self.failures) or self.valgrind is not None
+
+    def totalTime(self):
+        return self.buildTime + self.testTime
+
+# Matches the start of a failed case in the CppUnit TextTestRunner output, e.g.:
+# 1) test: UtGunnsBasicNode::testInitialize (F) line: 123 core/test/UtGunnsBasicNode.cpp
+failureRegex = re.compile(r'^\d+\) test: (\w+)::(\w+) \(([FE])\)\s*(?:line: (\d+) (\S+))?')
+# Matches the CppUnit BriefTestProgressListener line of a case, e.g.: UtGunnsBasicNode::testInitialize : OK
+briefRegex   = re.compile(r'^(\w+)::(\w+) : (OK|assertion|error)')
+okRegex      = re.compile(r'^OK \((\d+)')
+runRegex     = re.compile(r'^Run:\s+(\d+)\s+Failures:\s+(\d+)\s+Errors:\s+(\d+)')
+
+def parseCppUnit(text, result):
+    """Parses the CppUnit test output into the folder result."""
+    failure = None
+    for line in text.splitlines():
+        match = failureRegex.match(line)
+        if match:
+            (suite, case, kind, lineNum, fileName) = match.groups()
+            location = (fileName + ':' + lineNum) if fileName else ''
+            failure = [suite, case, kind, location, []]
+            result.failures.append(failure)
+            continue
+        match = okRegex.match(line)
+        if match:
+            result.numRun = int(match.group(1))
+            failure = None
+            continue
+        match = runRegex.match(line)
+        if match:
+            result.numRun = int(match.group(1))
+            continue
+        match = briefRegex.match(line)
+        if match:
+            if match.group(3) == 'OK':
+                result.passed.append((match.group(1), match.group(2)))
+            continue
+        if failure is not None and line.strip():
+            failure[4].append(line.strip())
+    result.failures = [(suite, case, kind, location, '\n'.join(message))
+                       for (suite, case, kind, location, message) in result.failures]
+
+def runMake(targets, folder, log):
+    """Runs make with the targets in the folder, appending its output to the log.  Returns the
+       elapsed time (s)."""
+    start = time.time()
+    log.write('\n**** make ' + ' '.join(targets) + ' in ' + folder + '\n')
+    log.flush()
+    subprocess.call(['make'] + targets, cwd=folder, stdout=log, stderr=subprocess.STDOUT)
+    return time.time() - start
+
+def runFolder(gunnsHome, folder, logDir):
+    """Builds and runs the tests of the folder, and returns its FolderResult."""
+    path    = os.path.join(gunnsHome, folder)
+    logName = os.path.join(logDir, folder.replace('/', '_') + '.log')
+    result  = FolderResult(folder, logName)
+    with open(logName, 'w') as log:
+        result.buildTime  = runMake(['clean'], path, log)
+        result.buildTime += runMake(['unit-tests'], path, log)
+        result.built = os.path.isfile(os.path.join(path, 'unit-tests'))
+        if result.built:
+            result.testTime = runMake(['test'], path, log)
+    testLog = os.path.join(path, 'output', 'unit-tests.log')
+    if os.path.isfile(testLog):
+        with open(testLog, 'r', errors='replace') as f:
+            parseCppUnit(f.read(), result)
+    valgrindLog = os.path.join(path, 'output', 'unit-tests-valgrind.log')
+    if os.path.isfile(valgrindLog):
+        with open(valgrindLog, 'r', errors='replace') as f:
+            for line in f:
+                if 'ERROR SUMMARY' in line and ' 0 errors' not in line:
+                    result.valgrind = line.strip()
+    return result
+
+def discover(gunnsHome):
+    """Returns the sorted list of the test folders, relative to GUNNS_HOME."""
+    folders = []
+    for root in ROOTS:
+        for (dirPath, dirNames, fileNames) in os.walk(os.path.join(gunnsHome, root)):
+            dirNames[:] = sorted(name for name in dirNames if name not in ('build', 'output'))
+            if os.path.basename(dirPath) == 'test' and 'Makefile' in fileNames:
+                folder = os.path.relpath(dirPath, gunnsHome)
+                if folder not in EXCLUDE:
+                    folders.append(folder)
+    return sorted(folders)
+
+def folderHash(hasher, gunnsHome, folder):
+    """Returns the hash of the folder's sources, Makefile and their dependencies."""
+    path  = os.path.join(gunnsHome, folder)
+    files = [os.path.join(path, name) for name in sorted(os.listdir(path))
+             if os.path.splitext(name)[1] in ('.cpp', '.hh', '.h', '.c') or name == 'Makefile']
+    return hasher.hash(files + [os.path.join(gunnsHome, name) for name in COMMON_FILES])
+
+def skippedResult(folder, cached):
+    """Returns the FolderResult of a folder skipped because it's unchanged since it last passed."""
+    result = FolderResult(folder, None)
+    result.skipped = True
+    result.built   = True
+    result.numRun  = cached.get('tests')
+    return result
+
+def tail(fileName, numLines=40):
+    with open(fileName, 'r', errors='replace') as f:
+        return ''.join(f.readlines()[-numLines:])
+
+def writeJunit(results, fileName):
+    """Writes the results to a JUnit XML file, with a testsuite per folder."""
+    root = ET.Element('testsuites')
+    for result in results:
+        suite = ET.SubElement(root, 'testsuite', name=result.folder)
+        if result.skipped:
+            suite.set('tests', '1')
+            suite.set('skipped', '1')
+            case = ET.SubElement(suite, 'testcase', classname=result.folder, name='cached')
+            ET.SubElement(case, 'skipped', message='unchanged since it last passed')
+            continue
+        errors   = len([failure for failure in result.failures if failure[2] == 'E'])
+        failures = len(result.failures) - errors
+        if not result.built or result.numRun is None:
+            errors += 1
+            case = ET.SubElement(suite, 'testcase', classname=result.folder, name='build',
+                                 time='%.3f' % result.buildTime)
+            message = 'failed to build' if not result.built else 'no test output'
+            ET.SubElement(case, 'error', message=message).text = tail(result.logName)
+        for (fixture, name) in result.passed:
+            ET.SubElement(suite, 'testcase', classname=result.folder + '.' + fixture, name=name)
+        for (fixture, name, kind, location, message) in result.failures:
+            case = ET.SubElement(suite, 'testcase', classname=result.folder + '.' + fixture, name=name)
+            ET.SubElement(case, 'error' if kind == 'E' else 'failure',
+                          message=location).text = message
+        if result.valgrind is not None:
+            failures += 1
+            case = ET.SubElement(suite, 'testcase', classname=result.folder, name='valgrind',
+                                 time='%.3f' % result.testTime)
+            ET.SubElement(case, 'failure', message=result.valgrind)
+        suite.set('tests', str(max(result.numRun or 0, len(suite))))
+        suite.set('failures', str(failures))
+        suite.set('errors', str(errors))
+        suite.set('time', '%.3f' % result.totalTime())
+        properties = ET.Element('properties')
+        properties.extend([ET.Element('property', name='buildTime', value='%.3f' % result.buildTime),
+                           ET.Element('property', name='testTime',  value='%.3f' % result.testTime)])
+        suite.insert(0, properties)
+    ET.ElementTree(root).write(fileName, encoding='utf-8', xml_declaration=True)
+
+def report(results, numSlowest, elapsed):
+    """Prints the slowest folders, then each failed folder and case, then the totals."""
+    print('\n**** Slowest test folders (build + test = total s):')
+    ran = [result for result in results if not result.skipped]
+    for result in sorted(ran, key=lambda result: -result.totalTime())[:numSlowest]:
+        print('%8.1f + %8.1f = %8.1f  %s' % (result.buildTime, result.testTime, result.totalTime(),
+                                              result.folder))
+    failed = [result for result in results if result.isFailed()]
+    for result in failed:
+        print('\n***TEST FAILURE*** ' + result.folder + ', see ' + result.logName)
+        if not result.built:
+            print('  failed to build:\n' + tail(result.logName, 20))
+        elif result.numRun is None:
+            print('  NO TEST OUTPUT')
+        for (fixture, name, kind, location, message) in result.failures:
+            print('  ' + ('ERROR ' if kind == 'E' else 'FAILED ') + fixture + '::' + name + ' '
+                  + location + '\n    ' + message.replace('\n', '\n    '))
+        if result.valgrind is not None:
+            print('  valgrind: ' + result.valgrind)
+    numRun = sum(result.numRun or 0 for result in ran)
+    numFailed = sum(len(result.failures) for result in ran)
+    print('\n**** ' + str(len(ran)) + ' folders, ' + str(numRun) + ' tests run, ' + str(numFailed)
+          + ' failed, ' + str(len(failed)) + ' folders failed, ' + str(len(results) - len(ran))
+          + ' unchanged folders skipped, in ' + '%.1f' % elapsed + ' s')
+    return failed
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Build and run the unit test folders in parallel.')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='number of folders built and run at once, default is the number of cores')
+    parser.add_argument('--junit', default='ut_results.xml', help='JUnit XML output file, default ut_results.xml')
+    parser.add_argument('--logs', default='ut_logs', help='folder of the make output logs, default ut_logs')
+    parser.add_argument('--slowest', type=int, default=10, help='number of slowest folders reported')
+    parser.add_argument('--no-clean-lib', '--no-lib', dest='no_clean_lib', action='store_true',
+                        help="don't clean gunns/lib/test first, only bring it up to date")
+    parser.add_argument('-a', '--all', action='store_true',
+                        help='run all folders, even those unchanged since they last passed')
+    parser.add_argument('--cache', default='ut_cache.json',
+                        help='cache file of the hashes of the folders that last passed, default ut_cache.json')
+    parser.add_argument('folders', nargs='*', help='test folders relative to GUNNS_HOME, default is all')
+    return parser.parse_args()
+
+def main():
+    args = parseArgs()
+    gunnsHome = os.environ['GUNNS_HOME']
+    folders = args.folders or discover(gunnsHome)
+    logDir = os.path.abspath(args.logs)
+    if not os.path.isdir(logDir):
+        os.makedirs(logDir)
+    start = time.time()
+
+    # Skip the folders whose hash matches their last passing run.
+    cache = {}
+    if os.path.isfile(args.cache):
+        with open(args.cache, 'r') as f:
+            cache = json.load(f)
+    hasher = IncludeHasher([gunnsHome, os.path.join(gunnsHome, 'ms-utils'),
+                            os.path.join(gunnsHome, 'gunns-ts-models')], followSources=True)
+    hashes  = dict((folder, folderHash(hasher, gunnsHome, folder)) for folder in folders)
+    results = []
+    if not args.all:
+        for folder in folders:
+            if cache.get(folder, {}).get('hash') == hashes[folder]:
+                results.append(skippedResult(folder, cache[folder]))
+        folders = [folder for folder in folders if cache.get(folder, {}).get('hash') != hashes[folder]]
+        print('**** Skipping ' + str(len(results)) + ' test folders unchanged since they last passed')
+
+    # Build the shared test library once, before the folders that use it.  This is done even
+    # without the clean, since each folder's make unit-tests makes lib/test too, and the folders
+    # would otherwise race to build it.
+    if folders:
+        print('**** Building lib/test')
+        with open(os.path.join(logDir, 'lib_test.log'), 'w') as log:
+            libPath = os.path.join(gunnsHome, 'lib', 'test')
+            if not args.no_clean_lib:
+                runMake(['clean'], libPath, log)
+            runMake([], libPath, log)
+
+    print('**** Running ' + str(len(folders)) + ' test folders with ' + str(args.jobs) + ' jobs')
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(runFolder, gunnsHome, folder, logDir) for folder in folders]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(('FAIL' if result.isFailed() else 'OK  ') + ' %8.1f s  ' % result.totalTime()
+                  + result.folder + ' (' + str(result.numRun or 0) + ' tests)')
+            # Update the cache as each folder finishes, so an interrupted run keeps its progress.
+            if result.isFailed():
+                cache.pop(result.folder, None)
+            else:
+                cache[result.folder] = {'hash': hashes[result.folder], 'tests': result.numRun,
+                                        'seconds': round(result.totalTime(), 1)}
+            with open(args.cache + '.tmp', 'w') as f:
+                json.dump(cache, f, indent=1, sort_keys=True)
+            os.replace(args.cache + '.tmp', args.cache)
+    results.sort(key=lambda result: result.folder)
+
+    writeJunit(results, args.junit)
+    failed = report(results, args.slowest, time.time() - start)
+    print('JUnit results in ' + args.junit)
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
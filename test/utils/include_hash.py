@@ -0,0 +1,80 @@
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+"""Hashes C++ source files with their transitive includes, to tell when the code that a test
+   builds has changed.  This is used by sims/SIM_class_test_compile/test_parallel.py and
+   test/run_all_ut.py to skip the tests that haven't changed since they last passed."""
+import hashlib
+import os
+import re
+import threading
+
+class IncludeHasher(object):
+    """Hashes source files with all of their transitive #include "..." files that are found under
+       the include roots.  System and other external includes aren't followed.  The hash and
+       includes of each file are memoized, so shared headers are only read once.
+
+       Attributes
+       roots        List of the include root folders, like the -I paths of the build.
+       followSources If True, each included header's source file of the same name (.cpp or .c) is
+                    also followed, for tests that link the compiled code of what they include.
+       fileHashes   Dictionary of the content hash of each file, by path.
+       fileIncludes Dictionary of the resolved include paths of each file, by path.
+    """
+
+    includeRegex = re.compile(r'^\s*#\s*include\s+"([^"]+)"', re.MULTILINE)
+
+    def __init__(self, roots, followSources=False):
+        """ IncludeHasher class constructor """
+        self.roots         = roots
+        self.followSources = followSources
+        self.fileHashes    = {}
+        self.fileIncludes  = {}
+        self.lock          = threading.Lock()
+
+    def resolve(self, include, fromDir):
+        for root in [fromDir] + self.roots:
+            path = os.path.normpath(os.path.join(root, include))
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def scan(self, path):
+        """Returns the resolved includes of the file, hashing it if not yet done."""
+        if path not in self.fileIncludes:
+            with open(path, 'rb') as f:
+                content = f.read()
+            self.fileHashes[path] = hashlib.sha256(content).hexdigest()
+            includes = []
+            for include in self.includeRegex.findall(content.decode('utf-8', 'replace')):
+                resolved = self.resolve(include, os.path.dirname(path))
+                if resolved is not None:
+                    includes.append(resolved)
+            if self.followSources and os.path.splitext(path)[1] in ('.hh', '.h'):
+                for extension in ('.cpp', '.c'):
+                    source = os.path.splitext(path)[0] + extension
+                    if os.path.isfile(source):
+                        includes.append(source)
+            self.fileIncludes[path] = includes
+        return self.fileIncludes[path]
+
+    def closure(self, paths):
+        """Returns the sorted list of the files and all of their transitive includes."""
+        seen  = set()
+        stack = [path for path in paths if os.path.isfile(path)]
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            stack.extend(self.scan(path))
+        return sorted(seen)
+
+    def hash(self, paths, extra=''):
+        """Returns the hash of the files, their transitive includes, and the extra string."""
+        with self.lock:
+            files = self.closure(paths)
+            digest = hashlib.sha256(extra.encode())
+            for path in files:
+                digest.update((path + ':' + self.fileHashes[path] + '\n').encode())
+        return digest.hexdigest()
@@ -0,0 +1,198 @@
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+# Include this after TestSuite.py, which includes Test.py and NetworkSnapshot.py.
+
+class ConservationCheck(object):
+    """One row of a conservation test table: the network to check and the quantities whose total
+       over all the network's nodes should be conserved between the start and check times.
+
+       Attributes
+       network     The sim network object, e.g. massOverflow.fluid.
+       quantities  List of the conserved quantities.  Each is 'mass' (total fluid mass), 'enthalpy'
+                   (total mass * specific enthalpy), a fluid constituent type name (the total mass of
+                   the constituent), or a tuple of constituent type names (their summed mass, for
+                   phase changes such as ('GUNNS_H2O', 'GUNNS_WATER')).
+       tolerance   The default relative tolerance of the conserved quantities.
+       tolerances  Dictionary of relative tolerances that override the default, by quantity.
+       added       Dictionary of the amounts expected to be added to quantities during the run, such
+                   as by sources in the network, by quantity.
+    """
+
+    def __init__(self, network, quantities, tolerance, tolerances=None, added=None):
+        """ ConservationCheck class constructor """
+        self.network    = network
+        self.quantities = list(quantities)
+        self.tolerance  = tolerance
+        self.tolerances = dict(tolerances or {})
+        self.added      = dict(added or {})
+
+class ConservationEngine(object):
+    """Runs the conservation checks of a table of ConservationTests.  Instead of each test
+       registering its own events, the engine schedules one shared event at the start time and one
+       at each check time, and at each of these evaluates all of its tests in one pass.  Each test
+       takes one snapshot of its network's node states (see NetworkSnapshot.py) and reduces it to
+       all its conserved totals with a single vector product.
+
+       Attributes
+       name        A name for the engine's events.  This should be sim-unique.
+       startTime   Sim time (s) of the start totals that the conserved quantities are checked against.
+       checkTimes  List of the sim times (s) that the conserved quantities are checked at.
+       fluidTypes  Dictionary of the fluid constituent types, by name, e.g. 'GUNNS_N2'.
+       tests       List of the ConservationTests added by their setup.
+       evaluateTime Wall time (s) spent evaluating the tests.
+    """
+
+    def __init__(self, name, startTime, checkTimes, fluidTypes):
+        """ ConservationEngine class constructor """
+        self.name         = name
+        self.startTime    = startTime
+        self.checkTimes   = sorted(checkTimes)
+        self.fluidTypes   = fluidTypes
+        self.tests        = []
+        self.evaluateTime = 0.0
+
+    def addTest(self, test):
+        """Adds the test to those evaluated by the shared events, scheduling the events with the
+           first test."""
+        if not self.tests:
+            self.scheduleEvent("Start", self.startTime, self.start)
+            for (index, time) in enumerate(self.checkTimes):
+                self.scheduleEvent("Check" + str(index), time, self.check)
+        self.tests.append(test)
+
+    def scheduleEvent(self, label, time, action):
+        print("Scheduling " + self.name + " conservation " + label + " for time : " + str(time) + " seconds.")
+        event = TestEvent(self.name + "Conservation" + label)
+        event.action = action
+        event.registerEvent(time)
+
+    def evaluate(self, test, label, function):
+        """Calls the test's start or check function, recording its wall time as the test's own, since
+           the shared event's wall time is recorded by the engine's event."""
+        simTime = trick.exec_get_sim_time()
+        start = perf_counter()
+        function()
+        test.recordCallbackTime(label, simTime, perf_counter() - start)
+
+    def start(self):
+        """Stores the start totals of all the tests."""
+        start = perf_counter()
+        for test in self.tests:
+            self.evaluate(test, "ConservationStart", test.start)
+        self.evaluateTime += perf_counter() - start
+
+    def check(self):
+        """Checks the totals of all the tests against their start totals."""
+        start = perf_counter()
+        print("-------------------------------------------------------------------------------------------------")
+        for test in self.tests:
+            self.evaluate(test, "ConservationCheck", test.check)
+        self.evaluateTime += perf_counter() - start
+        print("Checked conservation in " + str(len(self.tests)) + " networks in %.6f s." % self.evaluateTime)
+
+class ConservationTest(Test):
+    """A test of the conservation of mass, energy and constituent masses in a network, from a
+       ConservationCheck table row.  The test doesn't register its own events; its setup adds it to
+       the ConservationEngine, which evaluates it with all the other tests in the table.
+
+       Attributes
+       engine          The ConservationEngine that evaluates this test.
+       conservation    The ConservationCheck table row of this test.
+       snapshot        The NetworkSnapshot of the network, created at the start time.
+       startTotals     The totals of the conserved quantities at the start time, in their order.
+       selection       With NumPy, the matrix that selects the conserved quantities from the
+                       network's mass-weighted node state totals.
+       massTotal       With NumPy, flags of the conserved quantities that are the total mass.
+    """
+
+    def __init__(self, testName, testStartMessage, testFinishMessage, engine, conservation):
+        """ ConservationTest class constructor """
+        super(ConservationTest, self).__init__(testName, testStartMessage, testFinishMessage)
+        self.engine       = engine
+        self.conservation = conservation
+        self.snapshot     = None
+        self.startTotals  = None
+        self.selection    = None
+        self.massTotal    = None
+        self.lastTestTime = engine.checkTimes[-1]
+
+    def setup(self):
+        """Adds this test to the engine.  There is no tear down event, since there is no logged
+           data to check."""
+        print("\n"+self.testName + " has been initiated.")
+        print(self.testStartMessage)
+        self.testPassed = True
+        self.engine.addTest(self)
+
+    def fluidTypes(self, quantity):
+        """Returns the list of fluid constituent types summed in the given quantity."""
+        if isinstance(quantity, tuple):
+            return [self.engine.fluidTypes[name] for name in quantity]
+        return [self.engine.fluidTypes[quantity]]
+
+    def label(self, quantity):
+        """Returns the test case label of the given quantity, e.g. ' mass N2 error fraction ::'."""
+        if quantity == 'mass' or quantity == 'enthalpy':
+            return " " + quantity + " error fraction ::"
+        if not isinstance(quantity, tuple):
+            quantity = (quantity,)
+        return " mass " + "+".join([name.replace("GUNNS_", "") for name in quantity]) + " error fraction ::"
+
+    def initSelection(self):
+        """Builds the selection matrix that reduces the network's mass-weighted node state totals
+           to the conserved quantities in one product, and the flags of the quantities that are the
+           total mass, which isn't mass-weighted."""
+        numStates = self.snapshot.numStates
+        quantities = self.conservation.quantities
+        self.selection = numpy.zeros((numStates, len(quantities)))
+        self.massTotal = numpy.zeros(len(quantities))
+        for (column, quantity) in enumerate(quantities):
+            if quantity == 'mass':
+                self.massTotal[column] = 1.0
+            elif quantity == 'enthalpy':
+                self.selection[NetworkSnapshot.NODE_ENTHALPY, column] = 1.0
+            else:
+                for fluidType in self.fluidTypes(quantity):
+                    self.selection[self.snapshot.fractionColumn(fluidType), column] = 1.0
+
+    def totals(self):
+        """Returns the current totals of the conserved quantities, or None if the network snapshot
+           failed."""
+        if not self.snapshot.capture():
+            return None
+        if numpy is not None:
+            masses = self.snapshot.masses()
+            weighted = numpy.dot(masses, self.snapshot.nodeStates)
+            return numpy.dot(weighted, self.selection) + self.massTotal * numpy.sum(masses)
+        totals = []
+        for quantity in self.conservation.quantities:
+            if quantity == 'mass':
+                totals.append(self.snapshot.totalMass())
+            elif quantity == 'enthalpy':
+                totals.append(self.snapshot.totalEnthalpy())
+            else:
+                totals.append(sum([self.snapshot.totalConstituentMass(fluidType)
+                                   for fluidType in self.fluidTypes(quantity)]))
+        return totals
+
+    def start(self):
+        """Stores the start totals of the conserved quantities."""
+        self.snapshot = NetworkSnapshot(self.conservation.network)
+        if numpy is not None:
+            self.initSelection()
+        self.startTotals = self.totals()
+
+    def check(self):
+        """Tests the current totals of the conserved quantities, less any expected additions,
+           against their start totals."""
+        totals = self.totals()
+        if totals is None or self.startTotals is None:
+            self.testFalse(True, " network state snapshot ::")
+            return
+        for (column, quantity) in enumerate(self.conservation.quantities):
+            tolerance = self.conservation.tolerances.get(quantity, self.conservation.tolerance)
+            added     = self.conservation.added.get(quantity, 0.0)
+            start     = float(self.startTotals[column])
+            self.testNear(float(totals[column]) - added - start, 0.0, (1.0E-16 + tolerance * start),
+                          self.label(quantity))
@@ -0,0 +1,176 @@
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+from array import array
+import re
+
+class HsRecord(object):
+    """One message from a Health & Status text log (see ms-utils/simulation/hs/TsHsTextPlugin),
+       such as:
+
+       INFO | GUNNS        | +000 00:00:00 | 2023-01-22T12:00:00Z | core/GunnsBasicNode.cpp:123 | testSimObject.fluid.netSolver initialized...
+
+       Attributes
+       offset      Byte offset of the record's first line in the log file.
+       type        The message type: 'DBG', 'INFO', 'WARN', 'ERR', 'FAT' or 'NA'.
+       subsystem   The H&S subsystem, e.g. 'GUNNS'.
+       time        The mission elapsed time (s) of the message.
+       zulu        The UTC time stamp of the message, e.g. '2023-01-22T12:00:00Z'.
+       location    The source file, line and function that sent the message.
+       source      The object that sent the message, which is the first word of the message,
+                   e.g. 'testSimObject.fluid.netSolver' for GUNNS messages.
+       message     The full message text, including the source.  Continuation lines of multi-line
+                   messages, such as stack traces, are joined with newlines.
+    """
+    __slots__ = ('offset', 'type', 'subsystem', 'time', 'zulu', 'location', 'source', 'message')
+
+    def __init__(self, offset, type, subsystem, time, zulu, location, message):
+        """ HsRecord class constructor """
+        self.offset    = offset
+        self.type      = type
+        self.subsystem = subsystem
+        self.time      = time
+        self.zulu      = zulu
+        self.location  = location
+        self.message   = message
+        words = message.split(None, 1)
+        self.source = words[0] if words else ""
+
+    def text(self):
+        """Returns the message text after the source, e.g. 'initialized with 3 links...'."""
+        return self.message[len(self.source):].strip()
+
+class HsLog(object):
+    """Streaming reader of a Health & Status text log, e.g. logs/TS_Health_and_Status.out.  The
+       log is read one line at a time and parsed into HsRecords, so logs of any size can be
+       scanned in bounded memory.
+
+       buildIndex makes one pass over the log and indexes the byte offset of every record by its
+       source and by its type.  Queries on a source or type then read only the matching records,
+       seeking to them in the file, without rescanning the log.  The index holds only the offsets,
+       in compact arrays, not the messages.
+
+       Attributes
+       fileName    The path/name of the log file.
+       numRecords  The number of records in the log, set by buildIndex.
+       sourceIndex Dictionary of the arrays of record offsets, by source, set by buildIndex.
+       typeIndex   Dictionary of the arrays of record offsets, by type, set by buildIndex.
+    """
+
+    # Matches the fields of a record's first line.  The message itself may contain ' | '.
+    recordRegex = re.compile(r'^(DBG |INFO|WARN|ERR |FAT |NA  ) \| (.*?) \| ([+-])(\d+) (\d+):(\d+):(\d+) \| '
+                             r'(.*?) \| (.*?) \| (.*)$')
+
+    def __init__(self, fileName):
+        """ HsLog class constructor """
+        self.fileName    = fileName
+        self.numRecords  = 0
+        self.sourceIndex = None
+        self.typeIndex   = None
+
+    def parse(self, offset, line):
+        """Returns the HsRecord of the record's first line at the given offset, or None if the
+           line doesn't start a record."""
+        match = HsLog.recordRegex.match(line)
+        if match is None:
+            return None
+        (msgType, subsystem, sign, day, hour, minute, second, zulu, location, message) = match.groups()
+        time = float(int(day) * 86400 + int(hour) * 3600 + int(minute) * 60 + int(second))
+        if sign == '-':
+            time = -time
+        return HsRecord(offset, msgType.strip(), subsystem.strip(), time, zulu, location.strip(), message)
+
+    def lines(self, logFile):
+        """Yields the byte offset and decoded text, without the line ending, of each line from
+           the current position of the binary log file."""
+        offset = logFile.tell()
+        for line in iter(logFile.readline, b''):
+            yield (offset, line.decode('utf-8', 'replace').rstrip('\r\n'))
+            offset += len(line)
+
+    def readRecords(self, logFile):
+        """Yields the HsRecords from the current position of the binary log file.  Lines before
+           the first record are skipped."""
+        record = None
+        for (offset, line) in self.lines(logFile):
+            parsed = self.parse(offset, line)
+            if parsed is None:
+                if record is not None:
+                    record.message += '\n' + line
+                continue
+            if record is not None:
+                yield record
+            record = parsed
+        if record is not None:
+            yield record
+
+    def records(self):
+        """Yields all the HsRecords in the log, in order."""
+        with open(self.fileName, 'rb') as logFile:
+            for record in self.readRecords(logFile):
+                yield record
+
+    def buildIndex(self):
+        """Indexes the record offsets by source and type in one pass over the log.  Returns the
+           number of records."""
+        self.numRecords  = 0
+        self.sourceIndex = {}
+        self.typeIndex   = {}
+        for record in self.records():
+            self.numRecords += 1
+            for (index, key) in ((self.sourceIndex, record.source), (self.typeIndex, record.type)):
+                if key not in index:
+                    index[key] = array('L')
+                index[key].append(record.offset)
+        return self.numRecords
+
+    def sources(self):
+        """Returns the sorted list of the sources of the records, building the index if needed."""
+        if self.sourceIndex is None:
+            self.buildIndex()
+        return sorted(self.sourceIndex.keys())
+
+    def types(self):
+        """Returns the sorted list of the types of the records, building the index if needed."""
+        if self.typeIndex is None:
+            self.buildIndex()
+        return sorted(self.typeIndex.keys())
+
+    def offsets(self, source=None, type=None):
+        """Returns the offsets of the records with the given source and/or type, in order, building
+           the index if needed, or None for all records."""
+        if source is None and type is None:
+            return None
+        if self.sourceIndex is None:
+            self.buildIndex()
+        if source is None:
+            return self.typeIndex.get(type, array('L'))
+        bySource = self.sourceIndex.get(source, array('L'))
+        if type is None:
+            return bySource
+        byType = set(self.typeIndex.get(type, array('L')))
+        return [offset for offset in bySource if offset in byType]
+
+    def count(self, source=None, type=None):
+        """Returns the number of records with the given source and/or type."""
+        offsets = self.offsets(source, type)
+        if offsets is None:
+            if self.sourceIndex is None:
+                self.buildIndex()
+            return self.numRecords
+        return len(offsets)
+
+    def query(self, source=None, type=None):
+        """Yields the HsRecords with the given source and/or type, in order, reading only those
+           records from the log.  With no source or type, yields all records."""
+        offsets = self.offsets(source, type)
+        if offsets is None:
+            for record in self.records():
+                yield record
+            return
+        with open(self.fileName, 'rb') as logFile:
+            for offset in offsets:
+                logFile.seek(offset)
+                for record in self.readRecords(logFile):
+                    yield record
+                    break
@@ -0,0 +1,442 @@
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+from bisect  import bisect_left, bisect_right
+import csv
+import io
+import json
+import mmap
+import os
+import re
+import struct
+import warnings
+
+# NumPy is used for the column arrays and time lookups when it is available.  Without it, the
+# columns are Python lists of floats and the time lookups use bisect.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Python 2 Trick sims don't have perf_counter.
+try:
+    from time import perf_counter
+except ImportError:
+    from time import time as perf_counter
+
+# Trick variable type codes (TRICK_TYPE in trick/parameter_types.h) of the values in a binary log,
+# sorted by how they are read.
+TRICK_SIGNED_TYPES   = (1, 4, 6, 8, 12, 14, 21) # char, short, int, long, bitfield, long long, enum
+TRICK_UNSIGNED_TYPES = (2, 5, 7, 9, 13, 15, 17) # the unsigned types and bool
+TRICK_FLOAT_TYPES    = (10, 11)                 # float, double
+
+class LogData(object):
+    """Columnar store of a Trick data log. Each logged variable is stored as its own column array,
+       and the columns are indexed by variable name, so that lookups do not scan the log.  Column 0
+       is the sim time, and the time lookup is a binary search on it.
+
+       ASCII (CSV) logs are parsed into float64 columns.  Binary (.trk) logs from trick.DRBinary
+       are memory-mapped, and with NumPy each column is a read-only view of its values in the
+       file, in their logged type, without copying.
+
+       Attributes
+       fileName    The path/name of the loaded log file, or "" if nothing is loaded.
+       names       List of the logged variable names, in column order, without their units.
+       units       List of the logged variable units, in column order, e.g. 's' or '1'.
+       columns     List of the column arrays of values, in column order.
+       numRows     The number of data rows (recorded sim times) in the log, not including the
+                   header row.
+       numCols     The number of columns (recorded sim variables) in the log.
+    """
+
+    # Matches a CSV header cell such as 'sys.exec.out.time {s}' into its name and units.
+    headerRegex = re.compile(r'^\s*(.*?)\s*(?:\{(.*)\})?\s*$')
+
+    def __init__(self):
+        """ LogData class constructor """
+        self.fileName = ""
+        self.names    = []
+        self.units    = []
+        self.columns  = []
+        self.numRows  = 0
+        self.numCols  = 0
+        self.nameToColumn = {}
+
+    def load(self, fileName):
+        """Loads the columns from the given Trick CSV log file, or binary log file if its name
+           ends in .trk.  Returns True if the file was loaded, else False if there is no log file
+           or it can't be read.  Logs converted by log_convert.py, to a .npz file or a directory of
+           column files, are loaded with loadColumnar."""
+        if fileName.endswith('.trk'):
+            return self.loadBinary(fileName)
+        if fileName.endswith('.npz') or os.path.isdir(fileName):
+            return self.loadColumnar(fileName)
+        self.__init__()
+        try:
+            with open(fileName, 'r') as csvfile:
+                header = next(csv.reader([csvfile.readline()]), [])
+                self.setHeader(header)
+                self.appendRows(csvfile)
+        except IOError:
+            self.__init__()
+            return False
+        self.fileName = fileName
+        return True
+
+    def appendRows(self, csvfile):
+        """Reads the data rows from the given open CSV file (or file-like object), positioned after
+           the header row, and appends them to the columns."""
+        if numpy is not None:
+            data = self.loadNumpy(csvfile, self.numCols)
+        else:
+            data = self.loadCsv(csvfile, self.numCols)
+        if self.numRows == 0:
+            self.columns = data
+        elif numpy is not None:
+            self.columns = [numpy.concatenate((old, new)) for old, new in zip(self.columns, data)]
+        else:
+            for old, new in zip(self.columns, data):
+                old.extend(new)
+        self.numRows = len(self.columns[0]) if self.columns else 0
+
+    def loadBinary(self, fileName):
+        """Loads the columns from the given Trick binary log file.  The file starts with a header,
+           'Trick-<version>-<L|B>' for little or big endian, the number of variables, then each
+           variable's name length, name, units length, units, type and size.  Then come the
+           records of all the variables' values, one record per recorded sim time.  A partly
+           written last record is ignored.  Returns True if the file was loaded, else False if
+           there is no log file or it can't be read."""
+        self.__init__()
+        try:
+            with open(fileName, 'rb') as logFile:
+                if os.fstat(logFile.fileno()).st_size == 0:
+                    return False
+                buffer = mmap.mmap(logFile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError):
+            return False
+        try:
+            (endian, header, types, sizes, offset) = self.readBinaryHeader(buffer)
+        except (struct.error, ValueError, UnicodeDecodeError):
+            return False
+        recordSize = sum(sizes)
+        numRows = (len(buffer) - offset) // recordSize if recordSize > 0 else 0
+        if numpy is not None:
+            self.columns = self.mapBinaryColumns(buffer, endian, types, sizes, offset, numRows)
+        else:
+            self.columns = self.unpackBinaryColumns(buffer, endian, types, sizes, offset, numRows)
+        self.setHeader(header)
+        self.numRows  = numRows
+        self.fileName = fileName
+        return True
+
+    def loadColumnar(self, fileName):
+        """Loads the columns from a log converted by log_convert.py, either a compressed .npz file
+           of the columns, or a directory of one raw float64 file per column and an index.json of
+           the names, units and number of rows, whose columns are memory-mapped read-only.  This
+           needs NumPy.  Returns True if the log was loaded, else False if there is no converted
+           log or it can't be read."""
+        self.__init__()
+        if numpy is None:
+            return False
+        try:
+            if fileName.endswith('.npz'):
+                with numpy.load(fileName) as data:
+                    names = [str(name) for name in data['names']]
+                    units = [str(units) for units in data['units']]
+                    self.columns = [data['c' + str(col)] for col in range(len(names))]
+            else:
+                with open(os.path.join(fileName, 'index.json'), 'r') as indexFile:
+                    index = json.load(indexFile)
+                names = index['names']
+                units = index['units']
+                self.columns = [numpy.memmap(os.path.join(fileName, 'c' + str(col) + '.f8'),
+                                             dtype=numpy.float64, mode='r', shape=(index['numRows'],))
+                                if index['numRows'] > 0 else numpy.empty(0, dtype=numpy.float64)
+                                for col in range(len(names))]
+        except (IOError, OSError, KeyError, ValueError):
+            self.__init__()
+            return False
+        self.setHeader([name + ' {' + unit + '}' for name, unit in zip(names, units)])
+        self.numRows  = len(self.columns[0]) if self.columns else 0
+        self.fileName = fileName
+        return True
+
+    def readBinaryHeader(self, buffer):
+        """Reads the header of a Trick binary log.  Returns the struct byte order character, the
+           list of header cells as 'name {units}', the lists of variable types and sizes, and the
+           byte offset of the first record."""
+        tag = buffer[0:10].decode()
+        if not tag.startswith('Trick-') or tag[-1] not in 'LB':
+            raise ValueError('not a Trick binary log: ' + tag)
+        endian = '<' if tag[-1] == 'L' else '>'
+        offset = 10
+        def readInt():
+            value = struct.unpack_from(endian + 'i', buffer, offset)[0]
+            return (value, offset + 4)
+        def readString():
+            (length, start) = readInt()
+            return (buffer[start:start + length].decode(), start + length)
+        (numVars, offset) = readInt()
+        header = []
+        types  = []
+        sizes  = []
+        for var in range(numVars):
+            (name,  offset) = readString()
+            (units, offset) = readString()
+            (varType, offset) = readInt()
+            (size,    offset) = readInt()
+            header.append(name + ' {' + units + '}')
+            types.append(varType)
+            sizes.append(size)
+        return (endian, header, types, sizes, offset)
+
+    def binaryFormat(self, varType, size):
+        """Returns the NumPy dtype string of a logged variable's values, or None if they are not
+           numbers."""
+        if varType in TRICK_FLOAT_TYPES and size in (4, 8):
+            return 'f' + str(size)
+        if varType in TRICK_SIGNED_TYPES and size in (1, 2, 4, 8):
+            return 'i' + str(size)
+        if varType in TRICK_UNSIGNED_TYPES and size in (1, 2, 4, 8):
+            return 'u' + str(size)
+        return None
+
+    def mapBinaryColumns(self, buffer, endian, types, sizes, offset, numRows):
+        """Returns the list of column arrays of a Trick binary log, as strided views of the
+           memory-mapped records.  Columns whose values are not numbers are filled with NaN."""
+        fields  = []
+        formats = []
+        for col in range(len(types)):
+            fields.append('c' + str(col))
+            format = self.binaryFormat(types[col], sizes[col])
+            formats.append(endian + format if format else 'V' + str(sizes[col]))
+        records = numpy.ndarray(shape=(numRows,), buffer=buffer, offset=offset,
+                                dtype=numpy.dtype({'names': fields, 'formats': formats}))
+        columns = []
+        for col in range(len(types)):
+            if self.binaryFormat(types[col], sizes[col]):
+                columns.append(records[fields[col]])
+            else:
+                columns.append(numpy.full(numRows, numpy.nan))
+        return columns
+
+    def unpackBinaryColumns(self, buffer, endian, types, sizes, offset, numRows):
+        """Returns the list of columns of a Trick binary log, as lists of floats unpacked from the
+           records.  Columns whose values are not numbers are filled with NaN."""
+        codes = {'f4': 'f', 'f8': 'd', 'i1': 'b', 'i2': 'h', 'i4': 'i', 'i8': 'q',
+                 'u1': 'B', 'u2': 'H', 'u4': 'I', 'u8': 'Q'}
+        recordFormat = endian
+        numeric = []
+        for col in range(len(types)):
+            format = self.binaryFormat(types[col], sizes[col])
+            recordFormat += codes[format] if format else str(sizes[col]) + 'x'
+            if format:
+                numeric.append(col)
+        recordSize = struct.calcsize(recordFormat)
+        columns = [[] for col in range(len(types))]
+        for row in range(numRows):
+            record = struct.unpack_from(recordFormat, buffer, offset + row * recordSize)
+            for value, col in zip(record, numeric):
+                columns[col].append(float(value))
+        for col in range(len(types)):
+            if col not in numeric:
+                columns[col] = [float('nan')] * numRows
+        return columns
+
+    def loadNumpy(self, csvfile, numCols):
+        """Reads the data rows into a list of contiguous float64 column arrays.  Falls back to the
+           csv reader if the rows can't be read as a numeric table."""
+        start = csvfile.tell()
+        try:
+            # A log with only the header row is not an error, so don't warn about it.
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                table = numpy.loadtxt(csvfile, delimiter=',', dtype=numpy.float64, ndmin=2)
+        except ValueError:
+            csvfile.seek(start)
+            return [numpy.array(col, dtype=numpy.float64)
+                    for col in self.loadCsv(csvfile, numCols)]
+        if 0 == table.shape[0]:
+            return [numpy.empty(0, dtype=numpy.float64) for col in range(numCols)]
+        return [numpy.ascontiguousarray(col) for col in table.T]
+
+    def loadCsv(self, csvfile, numCols):
+        """Reads the data rows into a list of columns of floats with the csv reader.  Cells that
+           aren't numbers are stored as NaN."""
+        columns = [[] for col in range(numCols)]
+        for row in csv.reader(csvfile, delimiter=','):
+            if len(row) != numCols:
+                continue
+            for col in range(numCols):
+                try:
+                    columns[col].append(float(row[col]))
+                except ValueError:
+                    columns[col].append(float('nan'))
+        return columns
+
+    def setHeader(self, header):
+        """Splits the header cells into names and units, and builds the name to column index."""
+        self.names = []
+        self.units = []
+        self.nameToColumn = {}
+        for col, cell in enumerate(header):
+            name, units = self.headerRegex.match(cell).groups()
+            self.names.append(name)
+            self.units.append(units if units is not None else '')
+            # The first column logged under a name wins, like the original linear scan.
+            self.nameToColumn.setdefault(name, col)
+        self.numCols = len(self.names)
+
+    def isLoaded(self):
+        """Returns True if a log file is loaded."""
+        return self.numCols > 0
+
+    def lookupColumn(self, name):
+        """Returns the column number containing data for the given variable name, else None.
+           An exact name match is tried first, then a match of the name as a pattern (see
+           matchColumns), e.g. 'massOverflow.fluid.netNodes[*].mContent.mMass', then the first
+           column whose header contains the name."""
+        col = self.nameToColumn.get(name)
+        if col is not None:
+            return col
+        matches = self.matchColumns(name)
+        if matches:
+            return matches[0]
+        for col in range(0, self.numCols):
+            if name in self.names[col]:
+                return col
+        return None
+
+    def matchColumns(self, pattern):
+        """Returns the list of column numbers whose variable names match the given pattern, in
+           column order.  In the pattern, '*' matches any characters and '?' matches any one
+           character.  Everything else, including the brackets of array indexes, is literal."""
+        regex = re.compile('^' + re.escape(pattern).replace('\\*', '.*').replace('\\?', '.') + '$')
+        return [col for col in range(0, self.numCols) if regex.match(self.names[col])]
+
+    def lookupRow(self, time):
+        """Returns the first row with time value >= the given time, else None."""
+        if self.numCols == 0 or self.numRows == 0:
+            return None
+        if numpy is not None:
+            row = int(numpy.searchsorted(self.columns[0], time, side='left'))
+        else:
+            row = bisect_left(self.columns[0], time)
+        if row < self.numRows:
+            return row
+        return None
+
+    def lookupRows(self, startTime, endTime):
+        """Returns the (first, last + 1) rows with time values within [startTime, endTime], else
+           None if there are none."""
+        if self.numCols == 0 or self.numRows == 0:
+            return None
+        if numpy is not None:
+            first = int(numpy.searchsorted(self.columns[0], startTime, side='left'))
+            end   = int(numpy.searchsorted(self.columns[0], endTime,   side='right'))
+        else:
+            first = bisect_left(self.columns[0], startTime)
+            end   = bisect_right(self.columns[0], endTime)
+        if first < end:
+            return (first, end)
+        return None
+
+    def lookup(self, name, time):
+        """Combines lookupRow and lookupColumn and returns the data value as a float, else
+           None."""
+        col = self.lookupColumn(name)
+        row = self.lookupRow(time)
+        if col is not None and row is not None:
+            return float(self.columns[col][row])
+        return None
+
+    def column(self, name):
+        """Returns the column array of values for the given variable name, else None."""
+        col = self.lookupColumn(name)
+        if col is not None:
+            return self.columns[col]
+        return None
+
+    def times(self):
+        """Returns the column array of sim times, else None if nothing is loaded."""
+        if self.numCols == 0:
+            return None
+        return self.columns[0]
+
+class SharedLogData(object):
+    """A Trick data log that is shared by all the tests in a test suite.  The log is loaded once,
+       lazily when the first test asks for it, and every test is handed the same LogData, so that
+       the log is not re-parsed for each test.  Since the sim is still recording when the tests
+       tear down, rows added to the file since the last load are parsed and appended, instead of
+       reloading the whole file.  A binary log is simply mapped again, since that doesn't copy
+       its data.  When NumPy is available, the column arrays are made read-only so that one test
+       can't change the data that the other tests check.
+
+       Attributes
+       fileName    The path/name of the log file.
+       logData     The shared LogData, or None if it has not been loaded or can't be read.
+       offset      The number of bytes of the log file that have been loaded, always ending on a
+                   complete line of an ASCII log.
+       loadTime    Total wall time (s) taken to load the log.
+       numLoads    The number of times the log file has been read, including appended rows.
+       numServed   The number of times the shared log has been handed to a test.
+    """
+
+    def __init__(self, fileName):
+        """ SharedLogData class constructor """
+        self.fileName  = fileName
+        self.logData   = None
+        self.offset    = 0
+        self.loadTime  = 0.0
+        self.numLoads  = 0
+        self.numServed = 0
+
+    def get(self):
+        """Returns the shared LogData, loading it or any newly recorded rows first, else None if
+           there is no log file or it can't be read."""
+        try:
+            size = os.path.getsize(self.fileName)
+        except OSError:
+            size = 0
+        if size > self.offset:
+            start = perf_counter()
+            if self.fileName.endswith('.trk'):
+                self.mapBinary(size)
+            else:
+                self.readNewLines()
+            self.loadTime += perf_counter() - start
+        self.numServed += 1
+        return self.logData
+
+    def readNewLines(self):
+        """Reads the complete lines added to the log file since the last load.  The first line
+           read is the header."""
+        try:
+            with open(self.fileName, 'rb') as logFile:
+                logFile.seek(self.offset)
+                text = logFile.read()
+        except IOError:
+            return
+        # Leave any partly written last line for the next load.
+        end = text.rfind(b'\n') + 1
+        if end == 0:
+            return
+        self.offset += end
+        self.numLoads += 1
+        lines = io.StringIO(text[:end].decode())
+        if self.logData is None:
+            self.logData = LogData()
+            self.logData.setHeader(next(csv.reader([lines.readline()]), []))
+            self.logData.fileName = self.fileName
+        self.logData.appendRows(lines)
+        if numpy is not None:
+            for column in self.logData.columns:
+                column.flags.writeable = False
+
+    def mapBinary(self, size):
+        """Maps the binary log file again, to include the records added since the last load."""
+        logData = LogData()
+        if logData.loadBinary(self.fileName):
+            self.logData = logData
+            self.offset = size
+            self.numLoads += 1
@@ -0,0 +1,159 @@
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+import ctypes
+
+# NumPy is used for the state arrays when it is available.  Without it, the states are copied into
+# ctypes arrays and returned as Python lists.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class NetworkSnapshot(object):
+    """Snapshot of the states of all the nodes and links of a GUNNS network, copied from the sim
+       in one call to the network's getNodeStates and getLinkStates methods (see
+       core/network/GunnsNetworkBase.hh), rather than reading each node's states through SWIG one
+       at a time.  The snapshot is taken again with each call to capture.
+
+       The node states are a 2-D array with a row for each of the network's non-ground nodes and a
+       column for each state, in the order of the GunnsNetworkBase SnapshotNodeStates enumeration,
+       which is mirrored by the NODE_* constants below.  Fluid networks have one more column for
+       each fluid constituent's mass fraction, starting at column NODE_MASS_FRACTIONS.  The link
+       states are a 2-D array with a row for each of the network's links, and columns in the order
+       of the LINK_* constants below.  With NumPy these are float64 ndarrays, so conservation
+       checks over the whole network are vector reductions; otherwise they are lists of rows.
+
+       Attributes
+       network     The sim network object, e.g. massOverflow.fluid.
+       numNodes    The number of nodes in the snapshot, not including the ground node.
+       numLinks    The number of links in the snapshot.
+       numStates   The number of node states (columns) per node.
+       fluidTypes  List of the fluid constituent types of the mass fraction columns, in order.
+       nodeStates  The node states from the last capture, or None.
+       linkStates  The link states from the last capture, or None.
+    """
+
+    # Node state columns, from GunnsNetworkBase::SnapshotNodeStates.
+    NODE_POTENTIAL      = 0
+    NODE_NET_FLUX       = 1
+    NODE_VOLUME         = 2
+    NODE_MASS           = 3
+    NODE_TEMPERATURE    = 4
+    NODE_ENTHALPY       = 5
+    NODE_MASS_FRACTIONS = 6
+
+    # Link state columns, from GunnsNetworkBase::SnapshotLinkStates.
+    LINK_FLUX           = 0
+    LINK_POTENTIAL_DROP = 1
+    LINK_POWER          = 2
+    N_LINK_STATES       = 3
+
+    def __init__(self, network, fluidTypes=None):
+        """ NetworkSnapshot class constructor.  The fluid constituent types of the mass fraction
+            columns are read from the network's first node, unless they are given.
+        """
+        self.network    = network
+        self.numNodes   = network.getNumLocalNodes() - 1
+        self.numLinks   = network.getNumLinks()
+        self.numStates  = network.getNumNodeStates()
+        self.nodeStates = None
+        self.linkStates = None
+        numFractions = self.numStates - NetworkSnapshot.NODE_MASS_FRACTIONS
+        if fluidTypes is None:
+            fluidTypes = []
+            if numFractions > 0 and self.numNodes > 0:
+                content = network.netNodes[0].getContent()
+                fluidTypes = [int(content.getType(i)) for i in range(0, numFractions)]
+        self.fluidTypes = list(fluidTypes)
+
+    def capture(self):
+        """Copies the current node and link states from the sim into nodeStates and linkStates.
+           Returns False, and leaves the states as None, if the sim didn't copy all of them.
+        """
+        self.nodeStates = self.copyStates(self.network.getNodeStatesAt,
+                                          self.numNodes, self.numStates)
+        self.linkStates = self.copyStates(self.network.getLinkStatesAt,
+                                          self.numLinks, NetworkSnapshot.N_LINK_STATES)
+        return self.nodeStates is not None and self.linkStates is not None
+
+    def copyStates(self, getStatesAt, numRows, numCols):
+        """Calls the given network getStatesAt method to copy the states into a new array of
+           numRows by numCols, and returns the array, or None if not all the states were copied.
+        """
+        size = numRows * numCols
+        if size < 1:
+            return None
+        if numpy is not None:
+            states = numpy.zeros((numRows, numCols), dtype=numpy.float64)
+            if getStatesAt(states.ctypes.data, size) != size:
+                return None
+            return states
+        values = (ctypes.c_double * size)()
+        if getStatesAt(ctypes.addressof(values), size) != size:
+            return None
+        return [values[row * numCols:(row + 1) * numCols] for row in range(0, numRows)]
+
+    def nodeColumn(self, state):
+        """Returns the given state column of all the nodes, e.g. nodeColumn(NODE_MASS)."""
+        if numpy is not None:
+            return self.nodeStates[:, state]
+        return [row[state] for row in self.nodeStates]
+
+    def linkColumn(self, state):
+        """Returns the given state column of all the links, e.g. linkColumn(LINK_FLUX)."""
+        if numpy is not None:
+            return self.linkStates[:, state]
+        return [row[state] for row in self.linkStates]
+
+    def fractionColumn(self, fluidType):
+        """Returns the column number of the given fluid constituent type's mass fraction."""
+        return NetworkSnapshot.NODE_MASS_FRACTIONS + self.fluidTypes.index(int(fluidType))
+
+    def pressures(self):
+        return self.nodeColumn(NetworkSnapshot.NODE_POTENTIAL)
+
+    def volumes(self):
+        return self.nodeColumn(NetworkSnapshot.NODE_VOLUME)
+
+    def masses(self):
+        return self.nodeColumn(NetworkSnapshot.NODE_MASS)
+
+    def temperatures(self):
+        return self.nodeColumn(NetworkSnapshot.NODE_TEMPERATURE)
+
+    def enthalpies(self):
+        return self.nodeColumn(NetworkSnapshot.NODE_ENTHALPY)
+
+    def massFractions(self, fluidType):
+        return self.nodeColumn(self.fractionColumn(fluidType))
+
+    def fluxes(self):
+        return self.linkColumn(NetworkSnapshot.LINK_FLUX)
+
+    def totalMass(self):
+        """Returns the total fluid mass (kg) in all the nodes."""
+        if numpy is not None:
+            return float(numpy.sum(self.masses()))
+        return sum(self.masses())
+
+    def totalEnthalpy(self):
+        """Returns the total fluid enthalpy (J), mass * specific enthalpy, in all the nodes."""
+        if numpy is not None:
+            return float(numpy.dot(self.masses(), self.enthalpies()))
+        return sum([m * h for (m, h) in zip(self.masses(), self.enthalpies())])
+
+    def totalConstituentMass(self, fluidType):
+        """Returns the total mass (kg) of the given fluid constituent type in all the nodes."""
+        if numpy is not None:
+            return float(numpy.dot(self.masses(), self.massFractions(fluidType)))
+        return sum([m * x for (m, x) in zip(self.masses(), self.massFractions(fluidType))])
+
+    def totalConstituentMasses(self):
+        """Returns the total mass (kg) of each fluid constituent in all the nodes, in the order of
+           fluidTypes.
+        """
+        first = NetworkSnapshot.NODE_MASS_FRACTIONS
+        if numpy is not None:
+            return numpy.dot(self.masses(), self.nodeStates[:, first:])
+        return [self.totalConstituentMass(fluidType) for fluidType in self.fluidTypes]
@@ -6,7 +6,13 @@ from pprint          import pprint
 from sys             import path
 from time            import sleep
 from trick.unit_test import *
-import csv
+import os
+f = os.environ["GUNNS_HOME"]+"/test/utils/intTester/LogData.py"
+exec(compile(open(f, "rb").read(), f, 'exec'), globals(), locals())
+f = os.environ["GUNNS_HOME"]+"/test/utils/intTester/NetworkSnapshot.py"
+exec(compile(open(f, "rb").read(), f, 'exec'), globals(), locals())
+f = os.environ["GUNNS_HOME"]+"/test/utils/intTester/HsLog.py"
+exec(compile(open(f, "rb").read(), f, 'exec'), globals(), locals())
 
 class Test(object):
     """Test class. This class is sub-classed for each individual test to be run in an
@@ -29,12 +35,23 @@ class Test(object):
                           data logging for this test.  This should be set by the derived test class.
        testLogFileName    Stores the Trick data log path/filename so this test can open the log file
                           and test values within.  This is set automatically by the test suite.
-       testLogData        A table of the Trick data log values, loaded from the data log file.  This
-                          is updated automatically.
+       testLogData        A LogData columnar store of the Trick data log values, loaded from the data
+                          log file (see LogData.py).  This is updated automatically.
        testLogDataNumRows The number of data rows (recorded sim times) in the Trick data log, including
                           the header row.  This is updated automatically.
        testLogDataNumCols The number of data columns (recorded sim variables) in the Trick data log,
                           updated automatically.
+       testSharedLog      An optional SharedLogData (see LogData.py) that this test loads its log data
+                          from, instead of loading the log file itself.  This is set automatically by the
+                          test suite, so that all its tests share one loaded log.
+       testLogLoadTime    Wall time (s) spent in loadLogFile, updated automatically.
+       testTearDownChecksTime Wall time (s) spent in tearDownChecks, updated automatically.
+       testTearDownSimTime Sim time (s) that loadLogFile and tearDownChecks were run at, or None if the
+                          tear down hasn't run.  This is updated automatically.
+       testCallbackTimes  Dictionary of the timing of this test's event callbacks, by their label,
+                          e.g. 'TearDown' or the event name + 'Setup' or 'Evaluate'.  Each is a
+                          dictionary of the number of calls, the total and max wall time (s), and
+                          the list of sim times (s) called at.  This is updated automatically.
     """
 
     name = "unnamed test"
@@ -45,6 +62,10 @@ class Test(object):
     testLogData = None
     testLogDataNumRows = 0
     testLogDataNumCols = 0
+    testSharedLog = None
+    testLogLoadTime = 0.0
+    testTearDownChecksTime = 0.0
+    testTearDownSimTime = None
     def __init__(self, name, testStartMessage, testFinishMessage):
         """ Test class constructor """
         self.testName = name
@@ -56,6 +77,11 @@ class Test(object):
         self.testLogData = None
         self.testLogDataNumRows = 0
         self.testLogDataNumCols = 0
+        self.testSharedLog = None
+        self.testLogLoadTime = 0.0
+        self.testTearDownChecksTime = 0.0
+        self.testTearDownSimTime = None
+        self.testCallbackTimes = {}
 
     def setup(self):
         """A test setup function that is intended to be run before
@@ -65,7 +91,7 @@ class Test(object):
         """
         # Register the Tear Down Event so the test tear down function gets called after
         # all other event based tests have been run.
-        tearDownEvent = TestEvent(self.testName+"TearDown")
+        tearDownEvent = TestEvent(self.testName+"TearDown", self, "TearDown")
         tearDownEvent.action = self.tearDown
         tearDownEvent.registerEvent(self.lastTestTime+0.1)
         # print setup messages
@@ -77,27 +103,26 @@ class Test(object):
 
     def setLogFileName(self, filename):
         self.testLogFileName = filename
+
+    def setSharedLog(self, sharedLog):
+        self.testSharedLog = sharedLog
+        self.testLogFileName = sharedLog.fileName
         
     def loadLogFile(self):
-        """Loads self.testLogData with a matrix (list of lists) by [column][row] of
-           the log file's data, including log headers in the 0th row.  Does nothing,
-           leaving self.testLogData as None, if there is no log file or it can't be read."""
-        try:
-            with open(self.testLogFileName, 'r') as csvfile:
-                csvreader = csv.reader(csvfile, delimiter=',')
-                self.testLogDataNumRows = 0
-                self.testLogDataNumCols = 0
-                rows = []
-                for row in csvreader:
-                    self.testLogDataNumRows += 1
-                    self.testLogDataNumCols = len(row)
-                    rows.append(row)
-                self.testLogData = [[0 for x in range(self.testLogDataNumRows)] for y in range(self.testLogDataNumCols)]
-                for row in range(0, self.testLogDataNumRows):
-                    for col in range(0, self.testLogDataNumCols):
-                        self.testLogData[col][row] = rows[row][col]
-        except IOError:
-            pass
+        """Loads self.testLogData with a LogData columnar store of the log file's data, with one
+           float64 array per logged variable.  If this test has a shared log, this is the shared,
+           read-only LogData.  Does nothing, leaving self.testLogData as None, if there is no log
+           file or it can't be read."""
+        if self.testSharedLog is not None:
+            logData = self.testSharedLog.get()
+        else:
+            logData = LogData()
+            if not logData.load(self.testLogFileName):
+                logData = None
+        if logData is not None:
+            self.testLogData = logData
+            self.testLogDataNumRows = logData.numRows + 1
+            self.testLogDataNumCols = logData.numCols
         
     def tearDownChecks(self):
         """Overidden by the derived test class to perform checks at the end of the test.  This is the best place
@@ -120,8 +145,13 @@ class Test(object):
             return
 
         print("-------------------------------------------------------------------------------------------------")
+        self.testTearDownSimTime = self.currentSimTime()
+        start = perf_counter()
         self.loadLogFile()
+        self.testLogLoadTime = perf_counter() - start
+        start = perf_counter()
         self.tearDownChecks()
+        self.testTearDownChecksTime = perf_counter() - start
 #        print("Checking all tests conditions")
 #        # Loop through all test conditions and report pass/fail status
 #        for testResult in TestResults.keys():
@@ -144,16 +174,42 @@ class Test(object):
     #--- define useful test utilities
     def registerEventBasedTest(self, eventName, startTime, setupFunction, finishTime, evaluationFunction):
         print("Scheduling setup of : " +eventName+" for time : " + str(startTime) + " seconds.")
-        setupEvent = TestEvent(self.testName + eventName + "Setup")
+        setupEvent = TestEvent(self.testName + eventName + "Setup", self, eventName + "Setup")
         setupEvent.action = setupFunction
         setupEvent.registerEvent(startTime)
 
         print("Scheduling evaluation of : " +eventName+" for time : " + str(finishTime) + " seconds.")
-        evaluateEvent = TestEvent(self.testName + eventName + "Evaluate")
+        evaluateEvent = TestEvent(self.testName + eventName + "Evaluate", self, eventName + "Evaluate")
         evaluateEvent.action = evaluationFunction
         evaluateEvent.registerEvent(finishTime)
         self.lastTestTime = finishTime
 
+    def recordCallbackTime(self, label, simTime, wallTime):
+        """Adds a call of this test's event callback, at the sim time (s) and taking the wall time
+           (s), to testCallbackTimes."""
+        if label not in self.testCallbackTimes:
+            self.testCallbackTimes[label] = {'calls': 0, 'wallTime': 0.0, 'maxWallTime': 0.0,
+                                             'simTimes': []}
+        timing = self.testCallbackTimes[label]
+        timing['calls'] += 1
+        timing['wallTime'] += wallTime
+        timing['maxWallTime'] = max(timing['maxWallTime'], wallTime)
+        timing['simTimes'].append(simTime)
+
+    def getTotalWallTime(self):
+        """Returns the total wall time (s) spent in this test's event callbacks, which includes its
+           tear down log loading and checks."""
+        return sum([timing['wallTime'] for timing in self.testCallbackTimes.values()])
+
+    def getTiming(self):
+        """Returns a dictionary of this test's timing, for the JSON timing results."""
+        return {'name':               self.testName,
+                'wallTime':           self.getTotalWallTime(),
+                'logLoadTime':        self.testLogLoadTime,
+                'tearDownChecksTime': self.testTearDownChecksTime,
+                'tearDownSimTime':    self.testTearDownSimTime,
+                'callbacks':          self.testCallbackTimes}
+
     def setTestCondition(self, conditionalLabel, passFailStatus):
         TestResults[conditionalLabel] = passFailStatus
 
@@ -169,26 +225,23 @@ class Test(object):
         return self.testLogVariables
     
     def lookupLogColumn(self, name):
-        """Returns the column number containing data for the given variable name, else None."""
-        for col in range(0, self.testLogDataNumCols):
-            if name in self.testLogData[col][0]:
-                 return col
-        return None
+        """Returns the column number containing data for the given variable name, else None.
+           See LogData.lookupColumn for the exact, pattern and substring name matching."""
+        if self.testLogData is None:
+            return None
+        return self.testLogData.lookupColumn(name)
     
     def lookupLogRow(self, time):
-        """Returns the first row with time value >= the given time, else None."""
-        for row in range(1, self.testLogDataNumRows):
-            if float(self.testLogData[0][row]) >= time:
-                return row
-        return None
+        """Returns the first data row with time value >= the given time, else None."""
+        if self.testLogData is None:
+            return None
+        return self.testLogData.lookupRow(time)
     
     def lookupLog(self, name, time):
         """Combines lookupLogRow and lookupLogColumn and returns the data value as a float, else None."""
-        col = self.lookupLogColumn(name)
-        row = self.lookupLogRow(time)
-        if col is not None and row is not None:
-            return self.testLogData[col][row]
-        return None
+        if self.testLogData is None:
+            return None
+        return self.testLogData.lookup(name, time)
     
     # Set of test comparison operations that wrap Trick's built in unit-test
     # functionality. They output an xml test report that can be read by
@@ -250,7 +303,7 @@ class Test(object):
     def testLogEqual(self, value1, value2, time, testCase):
         """This tests that value1 at the time in the log data is equal to value2.
            Fails if the given time does not fall within the log data range."""
-        lookupValue1 = float(self.lookupLog(value1, time))
+        lookupValue1 = self.lookupLog(value1, time)
         if lookupValue1 is not None:
             self.testEqual(lookupValue1, value2, testCase)
         else:
@@ -259,7 +312,7 @@ class Test(object):
     def testLogNotEqual(self, value1, value2, time, testCase):
         """This tests that value1 at the time in the log data is not equal to value2.
            Fails if the given time does not fall within the log data range."""
-        lookupValue1 = float(self.lookupLog(value1, time))
+        lookupValue1 = self.lookupLog(value1, time)
         if lookupValue1 is not None:
             self.testNotEqual(lookupValue1, value2, testCase)
         else:
@@ -268,7 +321,7 @@ class Test(object):
     def testLogLT(self, value1, value2, time, testCase):
         """This tests that value1 at the time in the log data is less than value2.
            Fails if the given time does not fall within the log data range."""
-        lookupValue1 = float(self.lookupLog(value1, time))
+        lookupValue1 = self.lookupLog(value1, time)
         if lookupValue1 is not None:
             self.testLT(lookupValue1, value2, testCase)
         else:
@@ -277,7 +330,7 @@ class Test(object):
     def testLogLE(self, value1, value2, time, testCase):
         """This tests that value1 at the time in the log data is less than or equal to value2.
            Fails if the given time does not fall within the log data range."""
-        lookupValue1 = float(self.lookupLog(value1, time))
+        lookupValue1 = self.lookupLog(value1, time)
         if lookupValue1 is not None:
             self.testLE(lookupValue1, value2, testCase)
         else:
@@ -286,7 +339,7 @@ class Test(object):
     def testLogGT(self, value1, value2, time, testCase):
         """This tests that value1 at the time in the log data is greater than value2.
            Fails if the given time does not fall within the log data range."""
-        lookupValue1 = float(self.lookupLog(value1, time))
+        lookupValue1 = self.lookupLog(value1, time)
         if lookupValue1 is not None:
             self.testGT(lookupValue1, value2, testCase)
         else:
@@ -295,7 +348,7 @@ class Test(object):
     def testLogGE(self, value1, value2, time, testCase):
         """This tests that value1 at the time in the log data is greater than or equal to value2.
            Fails if the given time does not fall within the log data range."""
-        lookupValue1 = float(self.lookupLog(value1, time))
+        lookupValue1 = self.lookupLog(value1, time)
         if lookupValue1 is not None:
             self.testGE(lookupValue1, value2, testCase)
         else:
@@ -304,12 +357,131 @@ class Test(object):
     def testLogNear(self, value, target, tolerance, time, testCase):
         """This tests that value at the time in the log data is within the tolerance of the target.
            Fails if the given time does not fall within the log data range."""
-        lookupValue = float(self.lookupLog(value, time))
+        lookupValue = self.lookupLog(value, time)
         if lookupValue is not None:
             self.testNear(lookupValue, target, tolerance, testCase)
         else:
             self.testFalse(True, testCase)
 
+    # Set of time-window tests on the log data.  These check every logged sample of a variable
+    # within [startTime, endTime] at once, with NumPy, which LogData.py imports if it is available.
+    # If a check fails, the first violating sample is printed and reported through the Trick
+    # unit-test comparisons above.  They fail if the window has no log data or NumPy is missing.
+    def lookupLogWindow(self, names, startTime, endTime):
+        """Returns the array of times and the list of value arrays of the given variable names
+           within [startTime, endTime] of the log data, else None if NumPy is not available, any
+           name isn't logged, or there is no data in the window."""
+        if numpy is None or self.testLogData is None:
+            return None
+        rows = self.testLogData.lookupRows(startTime, endTime)
+        if rows is None:
+            return None
+        values = []
+        for name in names:
+            column = self.testLogData.column(name)
+            if column is None:
+                return None
+            values.append(numpy.asarray(column[rows[0]:rows[1]], dtype=numpy.float64))
+        times = numpy.asarray(self.testLogData.times()[rows[0]:rows[1]], dtype=numpy.float64)
+        return (times, values)
+
+    def printLogViolation(self, testCase, time, message):
+        """Prints the first violating sample of a failed time-window test."""
+        print(self.testName + testCase + " first violation at t = " + str(time) + " s: " + message)
+
+    def testLogWindowNear(self, value, target, tolerance, startTime, endTime, testCase):
+        """This tests that value is within the tolerance of the target at all times within
+           [startTime, endTime] in the log data."""
+        window = self.lookupLogWindow([value], startTime, endTime)
+        if window is None:
+            self.testFalse(True, testCase)
+            return
+        (times, (values,)) = window
+        bad = numpy.flatnonzero(~(numpy.abs(values - target) <= tolerance))
+        if len(bad) > 0:
+            i = bad[0]
+            self.printLogViolation(testCase, times[i], value + " = " + str(values[i]))
+            self.testNear(float(values[i]), target, tolerance, testCase)
+        else:
+            self.testTrue(True, testCase)
+
+    def testLogMonotonic(self, value, increasing, startTime, endTime, testCase, strict=False):
+        """This tests that value is monotonic, increasing or decreasing, at all times within
+           [startTime, endTime] in the log data.  Equal successive values fail if strict."""
+        window = self.lookupLogWindow([value], startTime, endTime)
+        if window is None:
+            self.testFalse(True, testCase)
+            return
+        (times, (values,)) = window
+        steps = numpy.diff(values) if increasing else -numpy.diff(values)
+        bad = numpy.flatnonzero(~(steps > 0.0) if strict else ~(steps >= 0.0)) + 1
+        if len(bad) > 0:
+            i = bad[0]
+            self.printLogViolation(testCase, times[i], value + " = " + str(values[i]) +
+                                   " after " + str(values[i - 1]))
+            if increasing and strict:
+                self.testGT(float(values[i]), float(values[i - 1]), testCase)
+            elif increasing:
+                self.testGE(float(values[i]), float(values[i - 1]), testCase)
+            elif strict:
+                self.testLT(float(values[i]), float(values[i - 1]), testCase)
+            else:
+                self.testLE(float(values[i]), float(values[i - 1]), testCase)
+        else:
+            self.testTrue(True, testCase)
+
+    def testLogSettles(self, value, target, tolerance, settleTime, endTime, testCase):
+        """This tests that value has settled to within the tolerance of the target by the
+           settleTime, and stays there until the endTime, in the log data.  Fails if there is no
+           log data at or after the settleTime."""
+        self.testLogWindowNear(value, target, tolerance, settleTime, endTime, testCase)
+
+    def testLogMaxRate(self, value, maxRate, startTime, endTime, testCase):
+        """This tests that the magnitude of the rate of change of value, between successive
+           samples, is no more than maxRate at all times within [startTime, endTime] in the log
+           data.  Fails if there are less than 2 samples in the window."""
+        window = self.lookupLogWindow([value], startTime, endTime)
+        if window is None or len(window[0]) < 2:
+            self.testFalse(True, testCase)
+            return
+        (times, (values,)) = window
+        dt = numpy.diff(times)
+        rates = numpy.zeros(len(dt))
+        moving = dt > 0.0
+        rates[moving] = numpy.diff(values)[moving] / dt[moving]
+        bad = numpy.flatnonzero(~(numpy.abs(rates) <= maxRate))
+        if len(bad) > 0:
+            i = bad[0]
+            self.printLogViolation(testCase, times[i + 1], value + " rate = " + str(rates[i]))
+            self.testLE(float(abs(rates[i])), maxRate, testCase)
+        else:
+            self.testTrue(True, testCase)
+
+    def testLogConservedSum(self, values, tolerance, startTime, endTime, testCase, relative=False):
+        """This tests that the sum of the given list of values (variable names or glob patterns)
+           stays within the tolerance of its value at the start of the window, at all times within
+           [startTime, endTime] in the log data.  If relative, the tolerance is a fraction of the
+           magnitude of the starting sum."""
+        names = []
+        for value in values:
+            cols = self.testLogData.matchColumns(value) if self.testLogData is not None else []
+            names.extend([self.testLogData.names[col] for col in cols] if cols else [value])
+        window = self.lookupLogWindow(names, startTime, endTime)
+        if window is None:
+            self.testFalse(True, testCase)
+            return
+        (times, columns) = window
+        sums = numpy.sum(columns, axis=0)
+        limit = tolerance * abs(sums[0]) if relative else tolerance
+        bad = numpy.flatnonzero(~(numpy.abs(sums - sums[0]) <= limit))
+        if len(bad) > 0:
+            i = bad[0]
+            self.printLogViolation(testCase, times[i], "sum of " + str(len(names)) +
+                                   " values = " + str(sums[i]) + ", started at " + str(sums[0]))
+            self.testNear(float(sums[i]), float(sums[0]), float(limit), testCase)
+        else:
+            self.testTrue(True, testCase)
+
 EventBasedTests = {}
 TestResults = {}
 class TestEvent(object):
@@ -334,14 +506,39 @@ class TestEvent(object):
                           your test run only once you reach the appropriate cicrumstance.
     """
 
-    def __init__(self, eventName):
-        """ Test Event class constructor """
+    def __init__(self, eventName, test=None, label=None):
+        """ Test Event class constructor.  The optional test owns the event, and records the
+            wall time of its action under the label, or the event name if no label is given.
+        """
         self.action = ""
         self.eventName = eventName
+        self.test = test
+        self.label = label or eventName
+        self.numCalls = 0
+        self.wallTime = 0.0
+        self.simTimes = []
 
 
     def registerEvent(self, eventTime):
         """A test setup function that is intended to be run before
         """
         EventBasedTests[self.eventName] = self
-        trick.add_read(eventTime, """EventBasedTests[\""""+self.eventName+"""\"].action()""" )
+        trick.add_read(eventTime, """EventBasedTests[\""""+self.eventName+"""\"].run()""" )
+
+    def run(self):
+        """Calls the event action, recording the sim time it was called at and the wall time (s)
+           it took, in this event and in its test."""
+        simTime = trick.exec_get_sim_time()
+        start = perf_counter()
+        self.action()
+        wallTime = perf_counter() - start
+        self.numCalls += 1
+        self.wallTime += wallTime
+        self.simTimes.append(simTime)
+        if self.test is not None:
+            self.test.recordCallbackTime(self.label, simTime, wallTime)
+
+    def getTiming(self):
+        """Returns a dictionary of this event's timing, for the JSON timing results."""
+        return {'name': self.eventName, 'calls': self.numCalls, 'wallTime': self.wallTime,
+                'simTimes': list(self.simTimes)}
@@ -1,6 +1,7 @@
 # Copyright 2023 United States Government as represented by the Administrator of the
 # National Aeronautics and Space Administration.  All Rights Reserved.
 #
+import json
 import os
 INT_TESTER_HOME = os.environ["GUNNS_HOME"]+"/test/utils/intTester/"
 f = INT_TESTER_HOME+"Test.py"
@@ -15,6 +16,27 @@ class TestSuite:
        testList         The list of tests managed by this test suite
        testTearDownTime The amount of time added to the last scheduled test event time before
                         shutting down the entire sim.
+       suiteLog         The SharedLogData (see LogData.py) that all tests load their log data from,
+                        set up by initLog.
+       testJobs         Dictionary of the Trick job names that each registered test needs, by test.
+       shardIndex       The index of the shard of the registered tests that this sim runs.
+       shardCount       The number of shards the registered tests are split into.
+       suiteStartTime   Wall clock (s, perf_counter) when this suite was created, for the timing report.
+       numSlowest       The number of the slowest tests and callbacks listed in the timing report.
+
+       The registered tests can be split into shards, each run in its own sim process, by
+       run_shards.py.  It sets the INT_TEST_SHARD environment variable to 'index/count' for each
+       sim, and this suite then only runs every count'th registered test, starting at index.  The
+       jobs of the tests that aren't run are turned off, so that each sim only does the work of its
+       own tests.  If INT_TEST_SHARD_RESULTS is set, the Trick unit-test results are written to that
+       file, for run_shards.py to merge.
+
+       Every test event callback records its sim time and wall time (see TestEvent.run), as do the
+       tests' loadLogFile and tearDownChecks.  At the end of the suite these are written as JSON to
+       int_test_timing.json in the Trick output directory, or to the INT_TEST_TIMING environment
+       variable's file if it is set, and the slowest tests and callbacks are printed.  run_shards.py
+       adds the test timing from this file as properties of the tests' suites in the results XML,
+       which Trick writes after the suite ends.
     """
     
     def __init__(self, tearDownTime):
@@ -22,21 +44,57 @@ class TestSuite:
         self.testList          = []
         self.testTearDownTime  = tearDownTime
         self.suiteLogVariables = []
+        self.suiteLog          = None
+        self.testJobs          = {}
+        self.suiteStartTime    = perf_counter()
+        self.numSlowest        = 5
+        (self.shardIndex, self.shardCount) = self.getShard()
+        if 'INT_TEST_SHARD_RESULTS' in os.environ:
+            trick_utest.unit_tests.set_file_name(os.environ['INT_TEST_SHARD_RESULTS'])
 
-    def registerTest(self, testToRegister):
-        """Function to add a test to the testList attribute"""
+    def getShard(self):
+        """Returns the shard index and count from the INT_TEST_SHARD environment variable, or shard
+           0 of 1 if it is not set."""
+        shard = os.environ.get('INT_TEST_SHARD', '0/1')
+        try:
+            (index, count) = [int(x) for x in shard.split('/')]
+        except ValueError:
+            index = -1
+            count = 0
+        if count < 1 or index < 0 or index >= count:
+            print("Invalid INT_TEST_SHARD: " + shard + ", running all tests.")
+            return (0, 1)
+        return (index, count)
+
+    def registerTest(self, testToRegister, jobs=[]):
+        """Function to add a test to the testList attribute.  The optional list of Trick job names
+           that only this test needs, such as its network's update job, are turned off when the
+           test isn't in this sim's shard."""
         self.testList.append(testToRegister)
+        self.testJobs[testToRegister] = list(jobs)
 
-    def initLog(self, logName, timestep):
-        """Sets up the Trick data logging of the set of variables needed to be logged by all the tests."""
-        # Append each test's list to our master list, sort and remove duplicates.
-        for test in self.testList:
+    def getShardTests(self):
+        """Returns the list of registered tests in this sim's shard."""
+        return self.testList[self.shardIndex::self.shardCount]
+
+    def initLog(self, logName, timestep, binary=False):
+        """Sets up the Trick data logging of the set of variables needed to be logged by all the tests.
+           The log is recorded as CSV, or in Trick's binary format if binary is True, which is faster
+           for the sim to write and for the tests to read."""
+        # Append each test's list to our master list, sort and remove duplicates.  Only the tests
+        # in this sim's shard are run, so only their variables are logged.
+        for test in self.getShardTests():
             for var in test.getLogVariables():
                 self.suiteLogVariables.append(var)
         self.suiteLogVariables = sorted(set(self.suiteLogVariables))
         
         # Set up the recording group and add it to Trick's data recording.
-        dr_group = trick.DRAscii(logName)
+        if binary:
+            dr_group = trick.DRBinary(logName)
+            logExtension = '.trk'
+        else:
+            dr_group = trick.DRAscii(logName)
+            logExtension = '.csv'
         dr_group.thisown = 0
         dr_group.set_cycle(timestep)
         dr_group.set_freq(trick.DR_Always)
@@ -45,10 +103,11 @@ class TestSuite:
             dr_group.add_variable(var)
         trick.add_data_record_group(dr_group, trick.DR_Buffer)
         
-        # Give the output log file path/name to the tests.
-        logFileName = trick.command_line_args_get_output_dir() + '/log_' + logName + '.csv'
+        # Give the tests the output log file, shared so that it is only loaded once.
+        logFileName = trick.command_line_args_get_output_dir() + '/log_' + logName + logExtension
+        self.suiteLog = SharedLogData(logFileName)
         for test in self.testList:
-            test.setLogFileName(logFileName)
+            test.setSharedLog(self.suiteLog)
         
     def runAllTests(self):
         """Function to loop through the test list and call each test's setup function,
@@ -56,16 +115,121 @@ class TestSuite:
            passed tests list, call the test's teardown function, and finally deactivate
            the test event.
         """
-        for test in self.testList:
+        shardTests = self.getShardTests()
+        if self.shardCount > 1:
+            print("Running shard " + str(self.shardIndex) + " of " + str(self.shardCount) + ": " +
+                  str(len(shardTests)) + " of " + str(len(self.testList)) + " tests.")
+            self.disableUnusedJobs(shardTests)
+        endOfTestSuiteTime = 0.0
+        for test in shardTests:
             self.runTest(test)
             endOfTestSuiteTime = test.lastTestTime
         print("Scheduling sim to stop at : " + str(endOfTestSuiteTime+self.testTearDownTime) + " seconds.")
         self.scheduleSimShutdown(endOfTestSuiteTime+self.testTearDownTime)
 
+    def disableUnusedJobs(self, shardTests):
+        """Turns off the jobs of the registered tests that aren't in this sim's shard, unless a
+           test in the shard also needs them."""
+        usedJobs = set()
+        for test in shardTests:
+            usedJobs.update(self.testJobs[test])
+        for test in self.testList:
+            for job in self.testJobs[test]:
+                if job not in usedJobs:
+                    trick.exec_set_job_onoff(job, 1, 0)
+
     def runTest(self, testToRun):
         """Function to run a given test. All that needs to be done is call the test setup.
         """
         testToRun.setup()
 
     def scheduleSimShutdown(self, shutdownTime):
+        # The timing report is registered first so that it runs before the sim stops.
+        reportEvent = TestEvent("TestSuiteTimingReport")
+        reportEvent.action = self.printTimingReport
+        reportEvent.registerEvent(shutdownTime)
         trick.add_read(shutdownTime, """trick.stop()""")
+
+    def getTimingFileName(self):
+        """Returns the file name that the JSON timing results are written to."""
+        if 'INT_TEST_TIMING' in os.environ:
+            return os.environ['INT_TEST_TIMING']
+        return trick.command_line_args_get_output_dir() + '/int_test_timing.json'
+
+    def getSharedEvents(self):
+        """Returns the list of events that aren't owned by a test, such as a ConservationEngine's
+           shared events, and have been called."""
+        return [event for event in EventBasedTests.values() if event.test is None and event.numCalls > 0]
+
+    def getTiming(self, tests):
+        """Returns a dictionary of the timing of the suite and the given tests, for the JSON timing
+           results."""
+        suiteLog = {}
+        if self.suiteLog is not None:
+            suiteLog = {'fileName': self.suiteLog.fileName, 'loadTime': self.suiteLog.loadTime,
+                        'numLoads': self.suiteLog.numLoads, 'numServed': self.suiteLog.numServed}
+        return {'shardIndex': self.shardIndex,
+                'shardCount': self.shardCount,
+                'wallTime':   perf_counter() - self.suiteStartTime,
+                'simTime':    trick.exec_get_sim_time(),
+                'suiteLog':   suiteLog,
+                'tests':      [test.getTiming() for test in tests],
+                'events':     [event.getTiming() for event in self.getSharedEvents()]}
+
+    def writeTimingResults(self, timing, fileName):
+        """Writes the timing dictionary to the JSON file."""
+        try:
+            with open(fileName, 'w') as timingFile:
+                json.dump(timing, timingFile, indent=1, sort_keys=True)
+            print("  timing results      : " + fileName)
+        except (IOError, OSError) as error:
+            print("  timing results      : could not write " + fileName + ": " + str(error))
+
+    def printTimingReport(self):
+        """Prints how much of the tests' tear down wall time was spent handling the data log, how
+           the suite's wall time divides between the sim and the test callbacks, and the slowest
+           tests and callbacks, then writes the timing results."""
+        shardTests = self.getShardTests()
+        logTime    = sum(test.testLogLoadTime for test in self.testList)
+        checksTime = sum(test.testTearDownChecksTime for test in self.testList)
+        totalTime  = logTime + checksTime
+        timing     = self.getTiming(shardTests)
+        # Test time recorded within the shared events, such as by a ConservationEngine, is in
+        # both, so the split is taken from the events themselves.
+        sharedTime = sum([event['wallTime'] for event in timing['events']])
+        testsTime  = sum([event.wallTime for event in EventBasedTests.values() if event.test is not None])
+        print("-------------------------------------------------------------------------------------------------")
+        print("Test suite timing for " + str(len(shardTests)) + " tests, at sim time " + str(timing['simTime']) + " s:")
+        print("  suite wall time     : %.6f s" % timing['wallTime'])
+        print("  test callbacks      : %.6f s" % testsTime)
+        print("  shared callbacks    : %.6f s" % sharedTime)
+        print("  sim and overhead    : %.6f s" % (timing['wallTime'] - testsTime - sharedTime))
+        self.printSlowest(timing)
+        print("Test suite tear down timing for " + str(len(self.testList)) + " tests:")
+        if self.suiteLog is not None:
+            print("  log file            : " + self.suiteLog.fileName)
+            print("  log file reads      : %.6f s in %d reads, shared by %d test loads" % (self.suiteLog.loadTime, self.suiteLog.numLoads, self.suiteLog.numServed))
+        print("  log handling total  : %.6f s" % logTime)
+        print("  tear down checks    : %.6f s" % checksTime)
+        if totalTime > 0.0:
+            print("  log handling share  : %.1f%% of tear down time" % (100.0 * logTime / totalTime))
+        self.writeTimingResults(timing, self.getTimingFileName())
+        print("-------------------------------------------------------------------------------------------------")
+
+    def printSlowest(self, timing):
+        """Prints the numSlowest tests and event callbacks with the most wall time in the timing."""
+        tests = sorted(timing['tests'], key=lambda test: test['wallTime'], reverse=True)
+        print("Slowest tests (wall time s, log load s, tear down checks s):")
+        for test in tests[:self.numSlowest]:
+            print("  %.6f  %.6f  %.6f  %s" % (test['wallTime'], test['logLoadTime'],
+                                               test['tearDownChecksTime'], test['name']))
+        callbacks = []
+        for test in timing['tests']:
+            for (label, callback) in test['callbacks'].items():
+                callbacks.append((callback['wallTime'], callback['calls'], test['name'] + " " + label))
+        for event in timing['events']:
+            callbacks.append((event['wallTime'], event['calls'], event['name']))
+        callbacks.sort(key=lambda callback: callback[0], reverse=True)
+        print("Slowest callbacks (wall time s, calls):")
+        for (wallTime, calls, name) in callbacks[:self.numSlowest]:
+            print("  %.6f  %4d  %s" % (wallTime, calls, name))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+"""Queries a Health & Status text log by message source and/or type, using the streaming, indexed
+   reader in HsLog.py, instead of grepping the log by hand.  For example, from the sim directory:
+
+     python3 $GUNNS_HOME/test/utils/intTester/hs_query.py logs/TS_Health_and_Status.out \\
+             --source testSimObject.fluid.netSolver --type WARN
+
+   With --summary, prints the number of records of each source and type instead.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from HsLog import HsLog
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Query a Health & Status text log.')
+    parser.add_argument('log', help='the H&S log file, e.g. logs/TS_Health_and_Status.out')
+    parser.add_argument('-s', '--source', default=None,
+                        help='only the messages from this source object, e.g. testSimObject.fluid.netSolver')
+    parser.add_argument('-t', '--type', default=None, choices=['DBG', 'INFO', 'WARN', 'ERR', 'FAT', 'NA'],
+                        help='only the messages of this type')
+    parser.add_argument('--summary', action='store_true',
+                        help='print the number of messages of each source and type')
+    return parser.parse_args()
+
+def main():
+    args = parseArgs()
+    hsLog = HsLog(args.log)
+    if args.summary:
+        print(str(hsLog.buildIndex()) + ' records in ' + args.log)
+        for msgType in hsLog.types():
+            print('  %8d  %s' % (hsLog.count(type=msgType), msgType))
+        for source in hsLog.sources():
+            print('  %8d  %s' % (hsLog.count(source=source), source))
+        return
+    for record in hsLog.query(args.source, args.type):
+        print('%-4s %12.1f  %s' % (record.type, record.time, record.message))
+
+if __name__ == "__main__":
+    main()
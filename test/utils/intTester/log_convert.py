@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+"""Converts a Trick data log, CSV or binary (.trk), to a columnar format that loads quickly for
+   post-run analysis: a compressed .npz file of the columns, or a directory with one raw float64
+   file per column, which is memory-mapped when loaded.  Either is loaded by LogData.load (see
+   LogData.py).  For example, from the sim directory:
+
+     python3 $GUNNS_HOME/test/utils/intTester/log_convert.py RUN_test/log_Log_Data.csv \\
+             RUN_test/log_Log_Data.npz --start 100 --end 3600 --minmax 50
+
+   The log is streamed in chunks of rows, so logs much larger than memory can be converted to a
+   column directory.  The rows can be sliced to a sim time range, decimated to every Nth row, and
+   downsampled for plotting by reducing each bucket of N rows to the two rows of each column's
+   minimum and maximum, in the order they occurred, so that peaks aren't lost.  These are applied
+   in that order.  This needs NumPy.
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import mmap
+import os
+import sys
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from LogData import LogData
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Convert a Trick data log to a columnar format.')
+    parser.add_argument('input', help='the Trick CSV or binary (.trk) log file')
+    parser.add_argument('output', help='the .npz file, or else column directory, to write')
+    parser.add_argument('-c', '--chunk', type=int, default=100000,
+                        help='number of rows read at a time, default is 100000')
+    parser.add_argument('-s', '--start', type=float, default=None, help='first sim time (s) to keep')
+    parser.add_argument('-e', '--end', type=float, default=None, help='last sim time (s) to keep')
+    parser.add_argument('-d', '--decimate', type=int, default=1, help='keep every Nth row')
+    parser.add_argument('-m', '--minmax', type=int, default=0,
+                        help='reduce each bucket of N rows to its min and max rows, for plotting')
+    parser.add_argument('-v', '--variables', nargs='+', default=None,
+                        help='only the variables matching these names or patterns, e.g. '
+                             '"massOverflow.fluid.netNodes[*].mContent.mMass"')
+    args = parser.parse_args()
+    if args.chunk < 1 or args.decimate < 1 or args.minmax == 1 or args.minmax < 0:
+        parser.error('the chunk and decimate sizes must be >= 1, and the minmax bucket size >= 2')
+    return args
+
+def readCsvChunks(fileName, chunkRows):
+    """Yields the header cells, then the column arrays of each chunk of rows, of a CSV log."""
+    log = LogData()
+    with open(fileName, 'r') as csvfile:
+        header = next(csv.reader([csvfile.readline()]), [])
+        yield header
+        log.setHeader(header)
+        while True:
+            lines = list(itertools.islice(csvfile, chunkRows))
+            if not lines:
+                return
+            yield log.loadNumpy(io.StringIO(''.join(lines)), log.numCols)
+
+def readBinaryChunks(fileName, chunkRows):
+    """Yields the header cells, then the column arrays of each chunk of rows, of a binary log.  The
+       chunks are copied from strided views of the memory-mapped records."""
+    log = LogData()
+    with open(fileName, 'rb') as logFile:
+        buffer = mmap.mmap(logFile.fileno(), 0, access=mmap.ACCESS_READ)
+    (endian, header, types, sizes, offset) = log.readBinaryHeader(buffer)
+    yield header
+    recordSize = sum(sizes)
+    numRows = (len(buffer) - offset) // recordSize if recordSize > 0 else 0
+    columns = log.mapBinaryColumns(buffer, endian, types, sizes, offset, numRows)
+    for first in range(0, numRows, chunkRows):
+        yield [numpy.array(column[first:first + chunkRows], dtype=numpy.float64) for column in columns]
+
+class Downsampler(object):
+    """Slices, decimates and min/max downsamples the chunks of a log's columns, carrying the rows
+       of a partial min/max bucket over to the next chunk.
+
+       Attributes
+       startTime   The first sim time (s) to keep, or None.
+       endTime     The last sim time (s) to keep, or None.
+       decimate    Every decimate'th row in the time range is kept.
+       minmax      The number of rows in each min/max bucket, or 0 to not downsample.
+       numRows     The number of rows in the time range so far, for the decimation.
+       carry       The columns of the rows of the last, partial min/max bucket, or None.
+       done        True once a time past endTime has been read, so the rest can be skipped.
+    """
+
+    def __init__(self, startTime, endTime, decimate, minmax):
+        """ Downsampler class constructor """
+        self.startTime = startTime
+        self.endTime   = endTime
+        self.decimate  = decimate
+        self.minmax    = minmax
+        self.numRows   = 0
+        self.carry     = None
+        self.done      = False
+
+    def process(self, columns):
+        """Returns the columns of the chunk's rows to write."""
+        times = columns[0]
+        keep = numpy.ones(len(times), dtype=bool)
+        if self.startTime is not None:
+            keep &= times >= self.startTime
+        if self.endTime is not None:
+            keep &= times <= self.endTime
+            if len(times) > 0 and times[-1] > self.endTime:
+                self.done = True
+        if self.decimate > 1:
+            rows = numpy.flatnonzero(keep)
+            keep[rows[(self.numRows + numpy.arange(len(rows))) % self.decimate != 0]] = False
+            self.numRows += len(rows)
+        columns = [column[keep] for column in columns]
+        if self.minmax < 2:
+            return columns
+        if self.carry is not None:
+            columns = [numpy.concatenate((old, new)) for old, new in zip(self.carry, columns)]
+        full = (len(columns[0]) // self.minmax) * self.minmax
+        self.carry = [column[full:] for column in columns]
+        return self.reduce([column[:full] for column in columns], self.minmax)
+
+    def finish(self):
+        """Returns the columns of the rows of the last, partial min/max bucket, or None."""
+        if self.carry is None or len(self.carry[0]) == 0:
+            return None
+        columns = self.reduce(self.carry, len(self.carry[0]))
+        self.carry = None
+        return columns
+
+    def reduce(self, columns, bucket):
+        """Returns each bucket of rows reduced to two rows: the bucket's first and last times, and
+           each column's minimum and maximum in the order they occurred in the bucket."""
+        if bucket < 2:
+            return columns
+        numBuckets = len(columns[0]) // bucket
+        reduced = []
+        for (col, column) in enumerate(columns):
+            values = column.reshape(numBuckets, bucket)
+            if col == 0:
+                pair = numpy.stack((values[:, 0], values[:, -1]), axis=1)
+            else:
+                # NaN values are never the min or max, unless the whole bucket is NaN.
+                nan   = numpy.isnan(values)
+                low   = numpy.argmin(numpy.where(nan,  numpy.inf, values), axis=1)
+                high  = numpy.argmax(numpy.where(nan, -numpy.inf, values), axis=1)
+                first = numpy.minimum(low, high)
+                last  = numpy.maximum(low, high)
+                rows  = numpy.arange(numBuckets)
+                pair  = numpy.stack((values[rows, first], values[rows, last]), axis=1)
+            reduced.append(pair.reshape(-1))
+        return reduced
+
+class NpzWriter(object):
+    """Collects the written chunks of columns and saves them to a compressed .npz file, with the
+       column arrays as c0, c1... and the variable names and units as names and units."""
+
+    def __init__(self, fileName, names, units):
+        """ NpzWriter class constructor """
+        self.fileName = fileName
+        self.names    = names
+        self.units    = units
+        self.chunks   = [[] for name in names]
+
+    def write(self, columns):
+        for (chunks, column) in zip(self.chunks, columns):
+            chunks.append(column)
+
+    def close(self):
+        """Saves the file, and returns the number of rows written."""
+        arrays = {'names': numpy.array(self.names), 'units': numpy.array(self.units)}
+        for (col, chunks) in enumerate(self.chunks):
+            arrays['c' + str(col)] = numpy.concatenate(chunks) if chunks else numpy.empty(0)
+        numpy.savez_compressed(self.fileName, **arrays)
+        return len(arrays['c0']) if self.chunks else 0
+
+class ColumnDirWriter(object):
+    """Appends the written chunks of columns to one raw float64 file per column, c0.f8, c1.f8...
+       in a directory, and writes the variable names, units and number of rows to index.json in
+       it when closed."""
+
+    def __init__(self, dirName, names, units):
+        """ ColumnDirWriter class constructor """
+        if not os.path.isdir(dirName):
+            os.makedirs(dirName)
+        self.dirName = dirName
+        self.names   = names
+        self.units   = units
+        self.numRows = 0
+        self.files   = [open(os.path.join(dirName, 'c' + str(col) + '.f8'), 'wb')
+                        for col in range(len(names))]
+
+    def write(self, columns):
+        for (columnFile, column) in zip(self.files, columns):
+            numpy.ascontiguousarray(column, dtype=numpy.float64).tofile(columnFile)
+        if columns:
+            self.numRows += len(columns[0])
+
+    def close(self):
+        """Closes the column files and writes the index, and returns the number of rows written."""
+        for columnFile in self.files:
+            columnFile.close()
+        with open(os.path.join(self.dirName, 'index.json'), 'w') as indexFile:
+            json.dump({'names': self.names, 'units': self.units, 'numRows': self.numRows}, indexFile,
+                      indent=1)
+        return self.numRows
+
+def convert(args):
+    """Converts the log.  Returns the number of rows read and written."""
+    if args.input.endswith('.trk'):
+        chunks = readBinaryChunks(args.input, args.chunk)
+    else:
+        chunks = readCsvChunks(args.input, args.chunk)
+    log = LogData()
+    log.setHeader(next(chunks))
+    selected = list(range(log.numCols))
+    if args.variables:
+        selected = [0] + sorted(set(col for pattern in args.variables
+                                    for col in log.matchColumns(pattern) if col != 0))
+    names = [log.names[col] for col in selected]
+    units = [log.units[col] for col in selected]
+    if args.output.endswith('.npz'):
+        writer = NpzWriter(args.output, names, units)
+    else:
+        writer = ColumnDirWriter(args.output, names, units)
+    downsampler = Downsampler(args.start, args.end, args.decimate, args.minmax)
+    numRead = 0
+    for columns in chunks:
+        numRead += len(columns[0]) if columns else 0
+        writer.write(downsampler.process([columns[col] for col in selected]))
+        if downsampler.done:
+            break
+    last = downsampler.finish()
+    if last is not None:
+        writer.write(last)
+    return (numRead, writer.close())
+
+def main():
+    args = parseArgs()
+    (numRead, numWritten) = convert(args)
+    print('Converted ' + str(numRead) + ' rows of ' + args.input + ' to ' + str(numWritten) +
+          ' rows in ' + args.output)
+
+if __name__ == "__main__":
+    main()
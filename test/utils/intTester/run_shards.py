@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# Copyright 2023 United States Government as represented by the Administrator of the
+# National Aeronautics and Space Administration.  All Rights Reserved.
+#
+"""Runs the registered tests of an integration test suite (see TestSuite.py) split into shards,
+   each shard in its own sim process, concurrently.  Each sim is given its shard by the
+   INT_TEST_SHARD environment variable, its own Trick output directory, and its own Trick
+   unit-test results file.  When all the sims have finished, their results files are merged into
+   the single results file that the CI checks.
+
+   Run this from the sim directory, e.g. for SIM_mass_overflow:
+
+     python3 $GUNNS_HOME/test/utils/intTester/run_shards.py -n 8 RUN_test/input.py \\
+             RUN_test/results/SIM_mass_overflow_int_test_results.xml
+
+   Each shard's test timing (see TestSuite.printTimingReport) is added to the merged results as
+   properties of the tests' suites, and the shards' timing files are merged into one JSON file
+   beside the results file, e.g. SIM_mass_overflow_int_test_results_timing.json.  Run with -n 1
+   to get these for an unsharded run.
+
+   A shard whose sim fails, or doesn't write its results file, is recorded as a failure in the
+   merged results.  Tests that check files written to the sim directory rather than the output
+   directory, such as the H&S log, aren't safe to shard since every shard writes them.
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description='Run an integration test suite in parallel shards.')
+    parser.add_argument('input', help='the sim input file that runs the test suite')
+    parser.add_argument('results', help='the merged Trick unit-test results file to write')
+    parser.add_argument('-n', '--shards', type=int, default=os.cpu_count() or 1,
+                        help='number of shards (sim processes), default is the number of cores')
+    parser.add_argument('-s', '--sim', default=None,
+                        help='sim executable, default is the S_main*.exe in this directory')
+    parser.add_argument('-o', '--output', default=None,
+                        help='directory for the shard output directories, default is the input file directory')
+    args = parser.parse_args()
+    if args.shards < 1:
+        parser.error('the number of shards must be >= 1')
+    if args.sim is None:
+        sims = sorted(glob.glob('S_main*.exe'))
+        if not sims:
+            parser.error('no S_main*.exe found, build the sim or give --sim')
+        args.sim = sims[0]
+    if args.output is None:
+        args.output = os.path.dirname(args.input) or '.'
+    return args
+
+def startShards(args):
+    """Starts a sim process for each shard.  Returns the list of (index, process, output dir,
+       results file) for the shards."""
+    shards = []
+    for index in range(args.shards):
+        outputDir = os.path.join(args.output, 'shard_' + str(index))
+        os.makedirs(outputDir, exist_ok=True)
+        results = os.path.join(outputDir, 'int_test_results.xml')
+        if os.path.exists(results):
+            os.remove(results)
+        env = dict(os.environ)
+        env['INT_TEST_SHARD'] = str(index) + '/' + str(args.shards)
+        env['INT_TEST_SHARD_RESULTS'] = results
+        env['INT_TEST_TIMING'] = os.path.join(outputDir, 'int_test_timing.json')
+        with open(os.path.join(outputDir, 'sim.out'), 'w') as out:
+            process = subprocess.Popen([os.path.abspath(args.sim), args.input, '-O', outputDir],
+                                       env=env, stdout=out, stderr=subprocess.STDOUT)
+        shards.append((index, process, outputDir, results))
+    return shards
+
+def loadTiming(outputDir):
+    """Returns the shard's timing results from its output directory, or None if it has none."""
+    try:
+        with open(os.path.join(outputDir, 'int_test_timing.json')) as timingFile:
+            return json.load(timingFile)
+    except (IOError, ValueError):
+        return None
+
+def addTimingProperties(suite, timing):
+    """Adds the test's timing as properties of its results suite."""
+    properties = suite.find('properties')
+    if properties is None:
+        properties = ET.Element('properties')
+        suite.insert(0, properties)
+    for key in ('wallTime', 'logLoadTime', 'tearDownChecksTime', 'tearDownSimTime'):
+        if timing[key] is not None:
+            ET.SubElement(properties, 'property', name=key, value=str(timing[key]))
+    for (label, callback) in sorted(timing['callbacks'].items()):
+        ET.SubElement(properties, 'property', name='callback.' + label + '.wallTime',
+                      value=str(callback['wallTime']))
+
+def mergeTiming(shards, suites, resultsFile):
+    """Adds the shards' test timing to their results suites, by test name, and writes the shards'
+       timing results to one JSON file beside the results file."""
+    merged = []
+    for (index, returnCode, outputDir, results) in shards:
+        timing = loadTiming(outputDir)
+        if timing is None:
+            continue
+        merged.append(timing)
+        for test in timing['tests']:
+            if test['name'] in suites:
+                addTimingProperties(suites[test['name']], test)
+    timingFile = os.path.splitext(resultsFile)[0] + '_timing.json'
+    with open(timingFile, 'w') as out:
+        json.dump({'shards': merged}, out, indent=1, sort_keys=True)
+    return timingFile
+
+def mergeResults(shards, resultsFile):
+    """Merges the shards' results files into one.  Test suites with the same name in different
+       shards are combined.  Returns the total number of tests and failures."""
+    merged = ET.Element('testsuites', name='AllTests')
+    suites = {}
+    for (index, returnCode, outputDir, results) in shards:
+        root = None
+        if os.path.exists(results):
+            try:
+                root = ET.parse(results).getroot()
+            except ET.ParseError:
+                root = None
+        if root is None or returnCode != 0:
+            # Record the failed shard as a failed test, so the CI check sees it.
+            if 'shards' not in suites:
+                suites['shards'] = ET.SubElement(merged, 'testsuite', name='shards')
+            suite = suites['shards']
+            case = ET.SubElement(suite, 'testcase', name='shard ' + str(index), status='run',
+                                 classname='shards')
+            ET.SubElement(case, 'failure', message='shard ' + str(index) + ' sim exited with ' +
+                          str(returnCode) + ', see ' + os.path.join(outputDir, 'sim.out'), type='')
+        if root is None:
+            continue
+        for suite in root.iter('testsuite'):
+            name = suite.get('name', '')
+            if name not in suites:
+                suites[name] = ET.SubElement(merged, 'testsuite', dict(suite.attrib))
+            suites[name].extend([child for child in suite if child.tag != 'properties'])
+    numTests = 0
+    numFailures = 0
+    for suite in suites.values():
+        cases = suite.findall('testcase')
+        failures = len([case for case in cases if case.find('failure') is not None])
+        suite.set('tests', str(len(cases)))
+        suite.set('failures', str(failures))
+        numTests += len(cases)
+        numFailures += failures
+    merged.set('tests', str(numTests))
+    merged.set('failures', str(numFailures))
+    resultsDir = os.path.dirname(resultsFile)
+    if resultsDir:
+        os.makedirs(resultsDir, exist_ok=True)
+    mergeTiming(shards, suites, resultsFile)
+    ET.ElementTree(merged).write(resultsFile, encoding='UTF-8', xml_declaration=True)
+    return (numTests, numFailures)
+
+def main():
+    args = parseArgs()
+    start = time.time()
+    shards = startShards(args)
+    print('Started ' + str(len(shards)) + ' shards of ' + args.input + ' with ' + args.sim)
+    finished = []
+    for (index, process, outputDir, results) in shards:
+        returnCode = process.wait()
+        print('  shard ' + str(index) + ' finished with ' + str(returnCode) + ' at ' +
+              '%.1f s' % (time.time() - start))
+        finished.append((index, returnCode, outputDir, results))
+    (numTests, numFailures) = mergeResults(finished, args.results)
+    print('Merged ' + str(numTests) + ' test results, ' + str(numFailures) + ' failures, into ' +
+          args.results + ' in %.1f s.' % (time.time() - start))
+    if numFailures > 0:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()